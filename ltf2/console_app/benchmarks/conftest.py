@@ -0,0 +1,116 @@
+""" Benchmarks of the console pages
+
+Benchmarks use the fixtures of the functional tests (login, warm contexts, ...)
+but not their page fixtures: those change the shared property. Page objects
+are created on `warm_page` with `open_page` and only read the console.
+
+Run them separately from the functional tests and without pytest-xdist:
+
+    $ pytest ltf2/console_app/benchmarks --bench-runs 20
+    $ pytest ltf2/console_app/benchmarks --bench-update  # save the new baseline
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Callable, Generator, List
+from urllib.parse import urljoin
+
+import allure
+import pytest
+from playwright.sync_api import Page
+
+from ltf2.console_app.magic.benchmark import SLOWER, Benchmark, BaselineStore
+from ltf2.console_app.magic.constants import PAGE_TIMEOUT
+from ltf2.console_app.magic.pages.base_page import BasePage
+
+pytest_plugins = ['ltf2.console_app.tests.conftest']
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('benchmarks', 'console benchmarks')
+    group.addoption('--bench-runs', type=int, default=10, metavar='N',
+                    help='Number of the measured runs of every benchmark')
+    group.addoption('--bench-warmup', type=int, default=1, metavar='N',
+                    help='Number of the runs before the measured ones')
+    group.addoption('--bench-baseline', default=None, metavar='PATH',
+                    help='Baseline file (`baseline.json` next to the benchmarks by default)')
+    group.addoption('--bench-update', action='store_true', default=False,
+                    help='Save the samples of this run as the baseline instead of '
+                         'comparing them with it')
+    group.addoption('--bench-alpha', type=float, default=0.01,
+                    help='Significance level of the slowdown')
+    group.addoption('--bench-min-change', type=float, default=0.1,
+                    help='Min relative slowdown of the median that fails the benchmark')
+
+
+@pytest.fixture(scope='session')
+def benchmark_runner(request) -> Generator[Benchmark, None, None]:
+    """ Benchmark runner of the session, the baseline is saved at the end with `--bench-update` """
+    config = request.config
+    path = config.getoption('--bench-baseline') or Path(__file__).parent / 'baseline.json'
+    runner = Benchmark(BaselineStore.load(path),
+                       runs=config.getoption('--bench-runs'),
+                       warmup=config.getoption('--bench-warmup'),
+                       alpha=config.getoption('--bench-alpha'),
+                       min_change=config.getoption('--bench-min-change'))
+    yield runner
+    for verdict in runner.verdicts.values():
+        print(verdict)
+    if config.getoption('--bench-update') and runner.results:
+        runner.update_baseline()
+        print(f'Baseline of {len(runner.results)} benchmarks is saved to {runner.baseline.path}')
+
+
+@pytest.fixture
+def bench(request, benchmark_runner: Benchmark) -> Callable[[str, Callable[[], float]], None]:
+    """ Run the benchmark and fail on a significant slowdown
+
+    Example:
+        def test_open(bench, open_page):
+            traffic = open_page(TrafficPage, TRAFFIC_PATH)
+            bench('traffic.open', lambda: time_to_interactive(traffic, traffic.traffic_header))
+    """
+    update = request.config.getoption('--bench-update')
+
+    def run(name: str, action: Callable[[], float]) -> None:
+        verdict = benchmark_runner.run(name, action)
+        allure.attach(json.dumps({'verdict': verdict.status,
+                                  'stats': verdict.stats._asdict(),
+                                  'baseline': verdict.baseline and verdict.baseline._asdict(),
+                                  'change': verdict.change,
+                                  'p_value': verdict.p_value,
+                                  'samples': benchmark_runner.results[name]}, indent=2),
+                      name=f'benchmark {name}', attachment_type=allure.attachment_type.JSON)
+        if verdict.status == SLOWER and not update:
+            pytest.fail(str(verdict))
+    return run
+
+
+@pytest.fixture
+def open_page(warm_page: Page, ltfrc_console_app: dict,
+              base_url: str) -> Generator[Callable[[type, str], BasePage], None, None]:
+    """ Factory of page objects on `warm_page` opened by path
+
+    `{team}` and `{property}` in the path are replaced from .ltfrc.
+
+    Example:
+        traffic = open_page(TrafficPage, '{team}/{property}/env/production/traffic')
+    """
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
+    pages: List[BasePage] = []
+
+    def open_(page_class: type, path: str) -> BasePage:
+        try:
+            path = path.format(team=ltfrc_console_app['team'],
+                               property=ltfrc_console_app['property'])
+        except KeyError:
+            raise ValueError(f'team and property variables are missed in .ltfrc')
+        page_object = page_class(warm_page, url=urljoin(base_url, path))
+        pages.append(page_object)
+        page_object.soft_goto()
+        return page_object
+
+    yield open_
+    for page_object in pages:
+        page_object.detach()
@@ -0,0 +1,74 @@
+from itertools import cycle
+
+from ltf2.console_app.magic.benchmark import interaction_latency
+from ltf2.console_app.magic.constants import TRAFFIC_ROUTES
+from ltf2.console_app.magic.pages.pages import TrafficPage
+from ltf2.console_app.tests.conftest import TRAFFIC_URL_PATH
+
+
+TRAFFIC_PATH = '{team}/{property}/' + TRAFFIC_URL_PATH
+
+
+def select(page: TrafficPage, selector, values):
+    """ Select the next of the values in the drop-down on every call """
+    values = cycle(values)
+
+    def action():
+        selector.click()
+        page.select_by_name(name=next(values)).click()
+    return action
+
+
+def test_traffic_main_chart_metric(bench, open_page):
+    """Latency of switching the metric of the main traffic chart
+
+        Steps:
+        ------
+        1. Switch the metric of the main chart N times, wait for the page to settle
+
+        Expected Results:
+        -----------------
+        1. Median of the latency is not significantly slower than the baseline
+        """
+    traffic = open_page(TrafficPage, TRAFFIC_PATH)
+    traffic.traffic_header.wait_for()
+    action = select(traffic, traffic.traffic_metric_selector,
+                    ['Data Transferred Origin', 'Data Transferred Edge'])
+    bench('TrafficPage.main_chart_metric', lambda: interaction_latency(traffic, action))
+
+
+def test_traffic_rules_percentile(bench, open_page):
+    """Latency of switching the percentile of the Rules grid (new routes request)
+
+        Steps:
+        ------
+        1. Switch the percentile of the Rules grid N times, wait for the routes
+           response and for the page to settle
+
+        Expected Results:
+        -----------------
+        1. Median of the latency is not significantly slower than the baseline
+        """
+    traffic = open_page(TrafficPage, TRAFFIC_PATH)
+    traffic.traffic_rules_percentile_selector.wait_for()
+    action = select(traffic, traffic.traffic_rules_percentile_selector, ['p95', 'p75'])
+    bench('TrafficPage.rules_percentile',
+          lambda: interaction_latency(traffic, action, url=TRAFFIC_ROUTES))
+
+
+def test_traffic_country_tab(bench, open_page):
+    """Latency of switching between the Overview and By Country tabs
+
+        Steps:
+        ------
+        1. Switch the tab N times, wait for the page to settle
+
+        Expected Results:
+        -----------------
+        1. Median of the latency is not significantly slower than the baseline
+        """
+    traffic = open_page(TrafficPage, TRAFFIC_PATH)
+    traffic.traffic_header.wait_for()
+    tabs = cycle([traffic.country_tab, traffic.traffic_overview_tab_button])
+    bench('TrafficPage.country_tab',
+          lambda: interaction_latency(traffic, lambda: next(tabs).click()))
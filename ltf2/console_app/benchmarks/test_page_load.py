@@ -0,0 +1,35 @@
+import pytest
+
+from ltf2.console_app.magic.benchmark import time_to_interactive
+from ltf2.console_app.magic.pages.pages import (OrgActivityPage, OriginsPage, PropertyPage,
+                                                SecurityPage, TrafficPage)
+from ltf2.console_app.tests.conftest import ORIGINS_URL_PATH, PROPERTY_URL_PATH, TRAFFIC_URL_PATH
+
+
+PROPERTY_PATH = '{team}/{property}/'
+
+# Page class, path and the element that shows the page is loaded
+PAGES = [
+    pytest.param(TrafficPage, PROPERTY_PATH + TRAFFIC_URL_PATH, 'traffic_header', id='traffic'),
+    pytest.param(PropertyPage, PROPERTY_PATH + PROPERTY_URL_PATH, 'add_rule', id='rules'),
+    pytest.param(OriginsPage, PROPERTY_PATH + ORIGINS_URL_PATH, 'origins_title', id='origins'),
+    pytest.param(SecurityPage, '{team}/security/access_rules', 'add_rule', id='security'),
+    pytest.param(OrgActivityPage, '{team}/activity', 'activity_header', id='org-activity'),
+]
+
+
+@pytest.mark.parametrize('page_class, path, ready', PAGES)
+def test_time_to_interactive(bench, open_page, page_class, path, ready):
+    """Time from loading the page until it is ready and settled
+
+        Steps:
+        ------
+        1. Load the page N times, wait for the ready element and for the page to settle
+
+        Expected Results:
+        -----------------
+        1. Median of the time is not significantly slower than the baseline
+        """
+    page = open_page(page_class, path)
+    bench(f'{page_class.__name__}.time_to_interactive',
+          lambda: time_to_interactive(page, getattr(page, ready)))
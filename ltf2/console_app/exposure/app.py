@@ -1,47 +1,260 @@
+import threading
+from typing import Dict, List
+
 from flask import Flask
 from flask import request
 from ltf2.util.config import get_ltfrc_section
 
-from ltf2.console_app.exposure.exposure import NcExposure, HttpExposure
+from ltf2.console_app.exposure.engine import get_engine
+from ltf2.console_app.exposure.exposure import BaseExposure, NcExposure, HttpExposure
+from ltf2.console_app.exposure.http_serv import routes_from_json
 
 
 app = Flask(__name__)
 
-EXPOSURES = []
+# Active exposures by port
+EXPOSURES: Dict[int, BaseExposure] = {}
+# Serializes changes of EXPOSURES made by concurrent requests
+EXPOSURES_LOCK = threading.Lock()
+
+EXPOSURE_TYPES = ('nc', 'http')
+
+# Max time (sec) of the long poll of hits
+MAX_WAIT_TIMEOUT = 600
+
+
+class SpecError(ValueError):
+    """ Invalid exposure spec or the port is used by another owner """
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_ports(value) -> List[int]:
+    """ Ports from `443`, `"10000-11000"` or list of them """
+    items = value if isinstance(value, list) else [value]
+    ports = []
+    for item in items:
+        first, _, last = str(item).partition('-')
+        first = int(first)
+        last = int(last) if last else first
+        if not 0 < first <= last <= 65535:
+            raise ValueError(f'Invalid port range: {item}')
+        ports.extend(range(first, last + 1))
+    return ports
+
+
+def parse_spec(data) -> List[dict]:
+    """ Normalize exposure spec to the list of specs of every port
+
+    Example:
+        {"type": "http", "port": 443, "cert": "self-signed"}
+        # cert minted on the fly (see `CertSpec`)
+        {"type": "http", "port": 443, "cert": {"kind": "expired", "host": "example.com"}}
+        # or range/list of ports served with the same settings
+        {"type": "http", "ports": "10000-11000", "cert": "self-signed"}
+        {"type": "nc", "ports": [80, "8000-8010"]}
+    """
+    if not isinstance(data, dict):
+        raise SpecError(f'Exposure must be dict/object: {data}')
+    e_type = str(data.get('type', '')).lower()
+    if e_type not in EXPOSURE_TYPES:
+        raise SpecError(f'Unknown exposure type `{data.get("type")}`, '
+                        f'supported: {EXPOSURE_TYPES}')
+    try:
+        ports = parse_ports(data['ports'] if 'ports' in data else data['port'])
+    except (KeyError, TypeError, ValueError):
+        raise SpecError(f'Exposure port is missed or invalid: {data}') from None
+    return [{'type': e_type,
+             'port': port,
+             'cert': data.get('cert') or '',
+             'routes': data.get('routes') or {}}
+            for port in ports]
 
 
-def handle_post_data(json_data):
+def create_exposure(spec: dict) -> BaseExposure:
+    if spec['type'] == 'nc':
+        return NcExposure(spec['port'])
+    try:
+        return HttpExposure(spec['port'], tls=spec['cert'],
+                            routes=routes_from_json(spec['routes']))
+    except (TypeError, ValueError) as e:
+        raise SpecError(f'Invalid exposure {spec}: {e}') from None
+
+
+def apply_specs(json_data, owner: str = '', exclusive: bool = False) -> dict:
+    """ Start exposures of the specs that are not active yet
+
+    Exposure with the same spec is kept, exposure of the port with another spec
+    is restarted. If `exclusive`, exposures of the owner that are not in the specs
+    are stopped (specs are the full desired state of the owner).
+    Ports of other owners are never changed.
+    """
     if not isinstance(json_data, list):
-        return "JSON must be list of dicts/objects", 400
-    for e in json_data:
-        if e['type'].lower() == 'nc':
-            EXPOSURES.append(NcExposure(e['port']))
-        elif e['type'].lower() == 'http':
-            EXPOSURES.append(HttpExposure(e['port'], tls=e['cert']))
-    [x.start() for x in EXPOSURES if not x.handle]
-    return [repr(x) for x in EXPOSURES]
+        raise SpecError("JSON must be list of dicts/objects")
+    desired = {s['port']: s for data in json_data for s in parse_spec(data)}
+    result = {'started': [], 'stopped': [], 'kept': []}
+    with EXPOSURES_LOCK:
+        busy = [p for p in desired if p in EXPOSURES and EXPOSURES[p].owner != owner]
+        if busy:
+            raise SpecError(f'Ports {busy} are used by another owner', status=409)
+        to_stop = [port for port, exposure in EXPOSURES.items()
+                   if (exclusive and exposure.owner == owner and port not in desired)
+                   or (port in desired and exposure.spec != desired[port])]
+        to_start = []
+        for port, spec in desired.items():
+            if port in EXPOSURES and port not in to_stop:
+                result['kept'].append(port)
+                continue
+            # Created (and validated) before anything is stopped
+            exposure = create_exposure(spec)
+            exposure.spec = spec
+            exposure.owner = owner
+            to_start.append(exposure)
+        stop_exposures(to_stop)
+        result['stopped'] = to_stop
+        errors = BaseExposure.start_many(to_start)
+        for exposure in to_start:
+            if exposure.port not in errors:
+                EXPOSURES[exposure.port] = exposure
+                result['started'].append(exposure.port)
+    if errors:
+        raise SpecError(f'Ports were not opened: {errors}', status=500)
+    return result
+
+
+def stop_exposures(ports: List[int]) -> None:
+    """ Stop exposures of the ports (EXPOSURES_LOCK should be acquired) """
+    BaseExposure.stop_many([EXPOSURES.pop(port) for port in ports])
+
+
+def exposures_repr() -> List[str]:
+    return [repr(x) for x in EXPOSURES.values()]
+
+
+def handle_post_data(json_data, owner: str = ''):
+    try:
+        apply_specs(json_data, owner)
+    except SpecError as e:
+        return str(e), e.status
+    return exposures_repr()
 
 
 @app.route('/', methods=['GET', 'POST'])
 def root():
     if request.method == 'GET':
-        return [repr(x) for x in EXPOSURES]
+        return exposures_repr()
     if request.method == 'POST':
         post_data = request.get_json(force=True)
-        return handle_post_data(post_data)
+        return handle_post_data(post_data, request.args.get('owner', ''))
+
+
+@app.route('/reconcile', methods=['POST', 'PUT'])
+def reconcile():
+    """ Make exposures of the owner (`?owner=`) equal to the posted list of specs
+
+    Only the difference is started/stopped, so repeated requests with the same
+    specs do not touch the listeners.
+    """
+    try:
+        result = apply_specs(request.get_json(force=True), request.args.get('owner', ''),
+                             exclusive=True)
+    except SpecError as e:
+        return str(e), e.status
+    result['exposures'] = exposures_repr()
+    return result
 
 
 @app.route('/clear')
 def clear():
-    for e in EXPOSURES:
-        e.stop()
-    EXPOSURES.clear()
-    return EXPOSURES
+    """ Stop all exposures or exposures of the owner (`?owner=`) """
+    owner = request.args.get('owner')
+    with EXPOSURES_LOCK:
+        stop_exposures([port for port, exposure in EXPOSURES.items()
+                        if owner is None or exposure.owner == owner])
+    return exposures_repr()
+
+
+@app.route('/hits')
+def hits():
+    """ Hits of all ports opened since the service start """
+    engine = get_engine()
+    # Ports are added and hits are updated by other threads
+    with engine.hits_condition:
+        return {str(port): stats.to_dict() for port, stats in engine.stats.items()}
+
+
+@app.route('/hits/<int:port>')
+def port_hits(port: int):
+    stats = get_engine().hits(port)
+    if stats is None:
+        return f'Port {port} was not opened', 404
+    return stats.to_dict()
+
+
+@app.route('/hits/reset', methods=['POST'])
+def reset_hits():
+    """ Reset hits of many ports at once
+
+    Example:
+        POST /hits/reset {"ports": [443, "10000-11000"]}
+    """
+    try:
+        ports = parse_ports((request.get_json(force=True) or {})['ports'])
+    except (KeyError, TypeError, ValueError) as e:
+        return f'Ports are missed or invalid: {e}', 400
+    return {str(port): get_engine().reset_hits(port).to_dict() for port in ports}
+
+
+@app.route('/hits/wait', methods=['POST'])
+def wait_hits():
+    """ Long poll: wait until every port gets `count` hits of the `kind` or `timeout` (sec)
+
+    Example:
+        POST /hits/wait {"ports": [443, "10000-10010"], "count": 1, "timeout": 120}
+        {"reached": true, "hits": {"443": {"port": 443, "connections": 1, ...}, ...}}
+    """
+    data = request.get_json(force=True) or {}
+    try:
+        ports = parse_ports(data['ports'])
+        count = int(data.get('count', 1))
+        timeout = min(float(data.get('timeout', 60)), MAX_WAIT_TIMEOUT)
+        reached = get_engine().wait_hits_many(ports, count, data.get('kind', 'connections'),
+                                              timeout)
+    except (KeyError, TypeError, ValueError) as e:
+        return f'Invalid wait request: {e!r}', 400
+    stats = {port: get_engine().hits(port) for port in ports}
+    return {'reached': reached,
+            'hits': {str(port): s.to_dict() if s else {'port': port} for port, s in stats.items()}}
+
+
+@app.route('/hits/<int:port>/reset', methods=['POST'])
+def reset_port_hits(port: int):
+    return get_engine().reset_hits(port).to_dict()
+
+
+@app.route('/hits/<int:port>/wait')
+def wait_port_hits(port: int):
+    """ Long poll: wait until the port gets `count` hits of the `kind` or `timeout` (sec)
+
+    Example:
+        GET /hits/443/wait?count=1&kind=requests&timeout=120
+        {"reached": true, "port": 443, "requests": 1, "first_hit": 1700000000.1, ...}
+    """
+    try:
+        count = int(request.args.get('count', 1))
+        timeout = min(float(request.args.get('timeout', 60)), MAX_WAIT_TIMEOUT)
+        reached = get_engine().wait_hits(port, count, request.args.get('kind', 'connections'),
+                                         timeout)
+    except ValueError as e:
+        return str(e), 400
+    stats = get_engine().hits(port)
+    return {'reached': reached, **(stats.to_dict() if stats else {'port': port})}
 
 
 def main():
     port = int(get_ltfrc_section("edgio-console-app")['exposure_service_port'])
-    app.run(host='0.0.0.0', port=port)
+    app.run(host='0.0.0.0', port=port, threaded=True)
 
 
 if __name__ == '__main__':
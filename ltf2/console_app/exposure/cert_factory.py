@@ -0,0 +1,182 @@
+import datetime
+import hashlib
+import ipaddress
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+
+CERT_KINDS = ('self-signed', 'expired', 'wrong-host', 'weak-key', 'custom-san')
+
+# Host of the 'wrong-host' certs
+WRONG_HOST = 'wrong.host.invalid'
+
+# Cached certs expiring sooner (or in half of their validity period) are minted again
+RENEW_BEFORE = datetime.timedelta(days=7)
+
+# Minted certs are kept between runs
+CACHE_DIR = Path(os.getenv('LTF2_EXPOSURE_CERTS_CACHE',
+                           Path.home() / '.cache' / 'ltf2-exposure' / 'certs'))
+
+
+class CertSpec(NamedTuple):
+    """ Parameters of the minted certificate
+
+    Args:
+        kind: one of CERT_KINDS
+        host: host (CN and SAN) the cert is issued for
+        san: extra subject alternative names (DNS names or IP addresses)
+        key_size: RSA key size, 1024 by default for 'weak-key'
+        days: validity period
+    """
+    kind: str = 'self-signed'
+    host: str = 'localhost'
+    san: Tuple[str, ...] = ()
+    key_size: Optional[int] = None
+    days: int = 365
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'CertSpec':
+        """ Spec from `{"kind": "expired", "host": "example.com", "san": [...]}` """
+        san = data.get('san') or ()
+        if isinstance(san, str):
+            san = (san,)
+        try:
+            spec = cls(**{**data, 'san': tuple(san)})
+        except TypeError as e:
+            raise ValueError(f'Invalid cert spec {data}: {e}') from None
+        if spec.kind not in CERT_KINDS:
+            raise ValueError(f'Unknown cert kind `{spec.kind}`, supported: {CERT_KINDS}')
+        return spec
+
+    @property
+    def cache_key(self) -> str:
+        return hashlib.sha1(json.dumps(self._asdict(), sort_keys=True).encode()).hexdigest()
+
+    @property
+    def name(self) -> str:
+        return f'{self.kind}-{self.host}-{self.cache_key[:8]}'
+
+
+def general_name(name: str) -> x509.GeneralName:
+    try:
+        return x509.IPAddress(ipaddress.ip_address(name))
+    except ValueError:
+        return x509.DNSName(name)
+
+
+def mint(spec: CertSpec) -> bytes:
+    """ Generate key and certificate of the spec, return PEM with both of them """
+    key_size = spec.key_size or (1024 if spec.kind == 'weak-key' else 2048)
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    host = WRONG_HOST if spec.kind == 'wrong-host' else spec.host
+    names = [host] if spec.kind != 'custom-san' or not spec.san else []
+    names += [n for n in spec.san if n not in names]
+    now = datetime.datetime.now(datetime.timezone.utc)
+    if spec.kind == 'expired':
+        not_before = now - datetime.timedelta(days=spec.days + 1)
+        not_after = now - datetime.timedelta(days=1)
+    else:
+        not_before = now - datetime.timedelta(days=1)
+        not_after = now + datetime.timedelta(days=spec.days)
+    subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, host),
+                         x509.NameAttribute(NameOID.ORGANIZATION_NAME, 'LTF2 Exposure')])
+    cert = (x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(subject)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(not_before)
+            .not_valid_after(not_after)
+            .add_extension(x509.SubjectAlternativeName([general_name(n) for n in names]),
+                           critical=False)
+            .sign(key, hashes.SHA256()))
+    return (cert.public_bytes(serialization.Encoding.PEM)
+            + key.private_bytes(serialization.Encoding.PEM,
+                                serialization.PrivateFormat.TraditionalOpenSSL,
+                                serialization.NoEncryption()))
+
+
+def not_valid_after(pem: bytes) -> datetime.datetime:
+    """ Expiration time (UTC) of the certificate in PEM """
+    cert = x509.load_pem_x509_certificate(pem)
+    # `not_valid_after_utc` is added in cryptography 42
+    expires = getattr(cert, 'not_valid_after_utc', None)
+    return expires or cert.not_valid_after.replace(tzinfo=datetime.timezone.utc)
+
+
+class CertFactory:
+    """ Mints certificates on request and caches them in memory and on disk
+
+    Certs are keyed by their parameters, so the key of the spec is generated
+    only once and reused by the next runs of the service. Cached cert that is
+    expired or expires soon (see RENEW_BEFORE) is minted again, except for the
+    'expired' kind.
+
+    Example:
+        factory = get_cert_factory()
+        pem_path = factory.get(CertSpec(kind='expired', host='example.com'))
+    """
+    def __init__(self, cache_dir: Union[str, Path] = CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        # Cached PEM paths and their expiration time by spec key
+        self._paths: Dict[str, Tuple[Path, Optional[datetime.datetime]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, spec: CertSpec) -> Path:
+        """ Path to PEM (cert and key) of the spec """
+        key = spec.cache_key
+        with self._lock:
+            path, expires = self._paths.get(key, (self.cache_dir / f'{key}.pem', None))
+            if expires is None and path.exists():
+                try:
+                    expires = not_valid_after(path.read_bytes())
+                except ValueError:
+                    # Broken PEM, mint it again
+                    pass
+            if expires is None or self._expires_soon(spec, expires):
+                pem = mint(spec)
+                self._write(path, pem)
+                expires = not_valid_after(pem)
+            self._paths[key] = (path, expires)
+            return path
+
+    @staticmethod
+    def _expires_soon(spec: CertSpec, expires: datetime.datetime) -> bool:
+        if spec.kind == 'expired':
+            return False
+        margin = min(RENEW_BEFORE, datetime.timedelta(days=spec.days) / 2)
+        return expires - datetime.datetime.now(datetime.timezone.utc) < margin
+
+    def _write(self, path: Path, data: bytes) -> None:
+        """ Write the file atomically, so concurrent services never read a partial PEM """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+_factory: Optional[CertFactory] = None
+_factory_lock = threading.Lock()
+
+
+def get_cert_factory() -> CertFactory:
+    """ Factory shared by all exposures of the process """
+    global _factory
+    with _factory_lock:
+        if _factory is None:
+            _factory = CertFactory()
+        return _factory
@@ -1,27 +1,54 @@
-import sys
-import requests
+import argparse
+import json
 
+from ltf2.console_app.exposure.client import ExposureClient, ExposureError
+
+
+SERVICE_URL = 'http://localhost:8899'
+
+
+def parse_exposure(spec: str) -> dict:
+    """ Exposure from `<type>:<port or range>[:<cert>]`, e.g. `http:10000-11000:self-signed` """
+    e_type, ports, *cert = spec.split(':')
+    return {"type": e_type, "ports": ports, "cert": cert[0] if cert else ""}
 
-def start():
-    r = requests.post(
-        'http://localhost:8899',
-        json=[
-            {"type": "nc", "port": 80},
-            {"type": "http", "port": 4443, "cert": "self-signed"},
-        ],
-    )
-    print(r.status_code)
-    print(r.text)
 
+def start(client: ExposureClient):
+    """ Default exposures. Port 80 can be opened only if the service is run with
+    privileges (root or CAP_NET_BIND_SERVICE), see `ListenerEngine` """
+    return client.open([
+        {"type": "nc", "port": 80},
+        {"type": "http", "port": 4443, "cert": "self-signed"},
+    ])
 
-def stop():
-    r = requests.get('http://localhost:8899/clear')
-    print(r.status_code)
-    print(r.text)
+
+def stop(client: ExposureClient):
+    return client.clear()
+
+
+def open_ports(client: ExposureClient, specs):
+    return client.open([parse_exposure(s) for s in specs])
 
 
 if __name__ == '__main__':
-    if sys.argv[1] == 'start':
-        start()
-    if sys.argv[1] == 'stop':
-        stop()
+    parser = argparse.ArgumentParser(description='Exposure service client')
+    parser.add_argument('command', choices=['start', 'stop', 'open'])
+    parser.add_argument(
+        'exposures',
+        nargs='*',
+        help='Exposures to open: <type>:<port or range>[:<cert>] '
+             '(e.g. nc:5900 http:10000-11000:self-signed)',
+    )
+    parser.add_argument('-u', dest='url', default=SERVICE_URL, help='Exposure service url')
+    args = parser.parse_args()
+    with ExposureClient(args.url) as client:
+        try:
+            if args.command == 'start':
+                result = start(client)
+            if args.command == 'stop':
+                result = stop(client)
+            if args.command == 'open':
+                result = open_ports(client, args.exposures)
+        except ExposureError as e:
+            raise SystemExit(str(e))
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,199 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Port, range of ports ("10000-11000") or list of them (see `app.parse_ports`)
+Ports = Union[int, str, List[Union[int, str]]]
+
+# Timeout (sec) added to the long poll timeout of the service
+WAIT_TIMEOUT_MARGIN = 10
+
+
+class ExposureError(Exception):
+    """ Exposure service request failed """
+    def __init__(self, message, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class ExposureClient:
+    """ Client of the exposure service (see `exposure.app`)
+
+    Requests are sent over a pool of keep-alive connections and retried on
+    connection errors and 502/503/504. All service operations are idempotent,
+    so POSTs are retried too. Read timeouts are not retried: long polls would
+    be repeated for too long.
+
+    Args:
+        url: service url, e.g. http://10.0.0.1:8899
+        owner: owner of the exposures opened by the client
+        timeout: request timeout (sec)
+        retries: number of retries of the failed request
+        max_workers: number of requests sent concurrently by bulk methods
+
+    Example:
+        with ExposureClient('http://10.0.0.1:8899', owner='runner-1') as client:
+            client.reconcile([{'type': 'http', 'ports': '10000-10100', 'cert': 'self-signed'}])
+            client.reset_hits('10000-10100')
+            client.wait_hits('10000-10100', timeout=120)
+    """
+    def __init__(self,
+                 url: str,
+                 owner: str = '',
+                 timeout: float = 30,
+                 retries: int = 3,
+                 max_workers: int = 8):
+        self.url = url.rstrip('/')
+        self.owner = owner
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.session = requests.Session()
+        retry = Retry(total=retries,
+                      read=0,
+                      backoff_factor=0.3,
+                      status_forcelist=(502, 503, 504),
+                      allowed_methods=None,
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def __enter__(self) -> 'ExposureClient':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _request(self, method: str, path: str, timeout: Optional[float] = None, **kwargs):
+        url = f'{self.url}{path}'
+        try:
+            response = self.session.request(method, url, timeout=timeout or self.timeout,
+                                            **kwargs)
+        except requests.RequestException as e:
+            raise ExposureError(f'{method} {url} failed: {e}') from e
+        if not response.ok:
+            raise ExposureError(f'{method} {url} failed: {response.status_code} {response.text}',
+                                status=response.status_code)
+        return response.json()
+
+    def _owner_params(self, owner: Optional[str]) -> dict:
+        return {'owner': self.owner if owner is None else owner}
+
+    def exposures(self) -> List[str]:
+        """ Active exposures of all owners """
+        return self._request('GET', '/')
+
+    def open(self, specs: List[dict], owner: Optional[str] = None) -> List[str]:
+        """ Start exposures of the specs, other exposures are kept """
+        return self._request('POST', '/', params=self._owner_params(owner), json=specs)
+
+    def reconcile(self, specs: List[dict], owner: Optional[str] = None) -> dict:
+        """ Make exposures of the owner equal to the specs, return started/stopped/kept ports """
+        self.log.debug(f'Reconcile {self.owner if owner is None else owner}: {specs}')
+        return self._request('POST', '/reconcile', params=self._owner_params(owner), json=specs)
+
+    def clear(self, owner: Optional[str] = None) -> List[str]:
+        """ Stop exposures of the owner (of all owners if the owner is empty) """
+        params = self._owner_params(owner)
+        return self._request('GET', '/clear', params=params if params['owner'] else {})
+
+    def hits(self, port: Optional[int] = None) -> dict:
+        """ Hits of the port or of all ports """
+        return self._request('GET', '/hits' if port is None else f'/hits/{port}')
+
+    def reset_hits(self, ports: Ports) -> Dict[str, dict]:
+        return self._request('POST', '/hits/reset', json={'ports': ports})
+
+    def wait_hits(self, ports: Ports, count: int = 1, kind: str = 'connections',
+                  timeout: float = 60) -> dict:
+        """ Wait until every port gets `count` hits of the kind
+
+        Return `{"reached": bool, "hits": {port: hits}}`.
+        """
+        return self._request('POST', '/hits/wait',
+                             json={'ports': ports, 'count': count, 'kind': kind,
+                                   'timeout': timeout},
+                             timeout=timeout + WAIT_TIMEOUT_MARGIN)
+
+    def map(self, func, *iterables) -> list:
+        """ Call client method for every item concurrently over the connection pool
+
+        Example:
+            client.map(client.hits, [80, 443, 8080])
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, *iterables))
+
+
+class AsyncExposureClient:
+    """ asyncio interface of `ExposureClient`
+
+    Requests are sent from the thread pool of the client, so many of them
+    (e.g. long polls of different ports) can be awaited concurrently.
+
+    Example:
+        async with AsyncExposureClient('http://10.0.0.1:8899', owner='runner-1') as client:
+            await client.reconcile(specs)
+            results = await asyncio.gather(*(client.wait_hits(p) for p in ports))
+    """
+    def __init__(self, url: str, owner: str = '', timeout: float = 30, retries: int = 3,
+                 max_workers: int = 8):
+        self.client = ExposureClient(url, owner=owner, timeout=timeout, retries=retries,
+                                     max_workers=max_workers)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix='exposure-client')
+
+    async def __aenter__(self) -> 'AsyncExposureClient':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False)
+        self.client.close()
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def exposures(self) -> List[str]:
+        return await self._run(self.client.exposures)
+
+    async def open(self, specs: List[dict], owner: Optional[str] = None) -> List[str]:
+        return await self._run(self.client.open, specs, owner)
+
+    async def reconcile(self, specs: List[dict], owner: Optional[str] = None) -> dict:
+        return await self._run(self.client.reconcile, specs, owner)
+
+    async def clear(self, owner: Optional[str] = None) -> List[str]:
+        return await self._run(self.client.clear, owner)
+
+    async def hits(self, port: Optional[int] = None) -> dict:
+        return await self._run(self.client.hits, port)
+
+    async def reset_hits(self, ports: Ports) -> Dict[str, dict]:
+        return await self._run(self.client.reset_hits, ports)
+
+    async def wait_hits(self, ports: Ports, count: int = 1, kind: str = 'connections',
+                        timeout: float = 60) -> dict:
+        return await self._run(self.client.wait_hits, ports, count, kind, timeout)
+
+    async def gather(self, func, *iterables) -> list:
+        """ Await async client method for every item concurrently
+
+        Example:
+            await client.gather(client.hits, [80, 443, 8080])
+        """
+        return await asyncio.gather(*(func(*args) for args in zip(*iterables)))
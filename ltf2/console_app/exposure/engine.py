@@ -0,0 +1,292 @@
+import asyncio
+import logging
+import ssl
+import threading
+import time
+from http import HTTPStatus
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from ltf2.console_app.exposure.http_serv import SERVER_VERSION, Routes, make_response
+
+
+Handler = Callable[[asyncio.StreamReader, asyncio.StreamWriter, 'PortStats'], Awaitable[None]]
+
+# Max time (sec) to wait for the loop to start/stop a listener
+CALL_TIMEOUT = 10
+
+# Idle keep-alive HTTP connections are closed after this time (sec)
+IDLE_TIMEOUT = 30
+
+
+class PortStats:
+    """ Hits of the port: accepted connections, HTTP requests and received bytes
+
+    Updated from the loop of the engine, read and waited from other threads.
+    """
+    KINDS = ('connections', 'requests', 'bytes_received')
+
+    def __init__(self, port: int, condition: threading.Condition):
+        self.port = port
+        self.condition = condition
+        self.reset()
+
+    def reset(self) -> None:
+        self.connections = 0
+        self.requests = 0
+        self.bytes_received = 0
+        self.first_hit = None
+        self.last_hit = None
+
+    def hit(self, connections: int = 0, requests: int = 0, bytes_received: int = 0) -> None:
+        with self.condition:
+            self.connections += connections
+            self.requests += requests
+            self.bytes_received += bytes_received
+            self.last_hit = time.time()
+            if self.first_hit is None:
+                self.first_hit = self.last_hit
+            self.condition.notify_all()
+
+    def to_dict(self) -> dict:
+        return {'port': self.port,
+                'connections': self.connections,
+                'requests': self.requests,
+                'bytes_received': self.bytes_received,
+                'first_hit': self.first_hit,
+                'last_hit': self.last_hit}
+
+
+class ListenerEngine:
+    """ In-process engine of the exposure listeners
+
+    All listeners (TCP and HTTP(S) ports) are served by one asyncio loop run in
+    a background thread, so starting and stopping a listener takes milliseconds
+    and no processes are spawned. Methods are thread-safe and can be called from
+    the request handlers of the service.
+
+    NOTE: the service should be run with privileges to bind ports < 1024
+    (e.g. `sudo ltf2-exposure` or CAP_NET_BIND_SERVICE), otherwise opening such
+    port fails with PermissionError.
+
+    Example:
+        engine = get_engine()
+        engine.open(8080, serve_http)
+        ...
+        engine.close(8080)
+    """
+    def __init__(self, host: str = '0.0.0.0'):
+        self.host = host
+        raise_open_files_limit()
+        self.loop = asyncio.new_event_loop()
+        self.servers: Dict[int, asyncio.AbstractServer] = {}
+        # Open connections of every port, closed with the listener
+        self.connections: Dict[int, Set[asyncio.StreamWriter]] = {}
+        # Hits of every port, reset when the port is opened
+        self.stats: Dict[int, PortStats] = {}
+        self.hits_condition = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name='listener-engine', daemon=True)
+        self.thread.start()
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _call(self, coro: Awaitable):
+        """ Run coroutine in the loop of the engine and return the result """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(CALL_TIMEOUT)
+
+    def open(self, port: int, handler: Handler,
+             ssl_context: Optional[ssl.SSLContext] = None) -> asyncio.AbstractServer:
+        """ Start listening on the port, connections are served by `handler` """
+        return self._call(self._open(port, handler, ssl_context))
+
+    def close(self, port: int) -> None:
+        """ Stop listening on the port and close its connections """
+        self._call(self._close(port))
+
+    def open_many(self, listeners: List[Tuple[int, Handler, Optional[ssl.SSLContext]]]
+                  ) -> Dict[int, Union[asyncio.AbstractServer, Exception]]:
+        """ Start listening on many ports at once
+
+        Return server or the error (e.g. port is busy) of every port.
+        """
+        return self._call(self._open_many(listeners))
+
+    def close_many(self, ports: Iterable[int]) -> None:
+        self._call(self._close_many(ports))
+
+    async def _open_many(self, listeners):
+        results = await asyncio.gather(*(self._open(*listener) for listener in listeners),
+                                       return_exceptions=True)
+        return {listener[0]: result for listener, result in zip(listeners, results)}
+
+    async def _close_many(self, ports: Iterable[int]) -> None:
+        await asyncio.gather(*(self._close(port) for port in ports))
+
+    def is_open(self, port: int) -> bool:
+        return port in self.servers
+
+    def hits(self, port: int) -> Optional[PortStats]:
+        return self.stats.get(port)
+
+    def reset_hits(self, port: int) -> PortStats:
+        with self.hits_condition:
+            if port in self.stats:
+                self.stats[port].reset()
+            else:
+                self.stats[port] = PortStats(port, self.hits_condition)
+            return self.stats[port]
+
+    def wait_hits(self, port: int, count: int = 1, kind: str = 'connections',
+                  timeout: float = 60) -> bool:
+        """ Wait until the port gets `count` hits of the kind (see `PortStats.KINDS`)
+
+        Return False if the hits were not received in `timeout` sec.
+        """
+        return self.wait_hits_many([port], count, kind, timeout)
+
+    def wait_hits_many(self, ports: Iterable[int], count: int = 1, kind: str = 'connections',
+                       timeout: float = 60) -> bool:
+        """ Wait until every port gets `count` hits of the kind """
+        if kind not in PortStats.KINDS:
+            raise ValueError(f'Unknown kind of hits `{kind}`, supported: {PortStats.KINDS}')
+        ports = list(ports)
+        with self.hits_condition:
+            return self.hits_condition.wait_for(
+                lambda: all(port in self.stats and getattr(self.stats[port], kind) >= count
+                            for port in ports),
+                timeout)
+
+    async def _open(self, port: int, handler: Handler,
+                    ssl_context: Optional[ssl.SSLContext]) -> asyncio.AbstractServer:
+        if port in self.servers:
+            raise ValueError(f'Port {port} is already open')
+        connections = self.connections.setdefault(port, set())
+        stats = self.reset_hits(port)
+
+        async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            connections.add(writer)
+            stats.hit(connections=1)
+            try:
+                await handler(reader, writer, stats)
+            except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError,
+                    ssl.SSLError):
+                pass
+            except Exception as e:
+                self.log.warning(f'Port {port}: connection handler failed: {e!r}')
+            finally:
+                connections.discard(writer)
+                writer.close()
+
+        try:
+            server = await asyncio.start_server(serve, host=self.host, port=port,
+                                                ssl=ssl_context, reuse_address=True)
+        except PermissionError as e:
+            if port >= 1024:
+                raise
+            raise PermissionError(f'Port {port} < 1024 requires privileges: run the service '
+                                  f'as root or with CAP_NET_BIND_SERVICE ({e})') from e
+        self.servers[port] = server
+        self.log.info(f'Listening on port {port}')
+        return server
+
+    async def _close(self, port: int) -> None:
+        server = self.servers.pop(port, None)
+        if server is None:
+            return
+        server.close()
+        for writer in self.connections.pop(port, set()):
+            writer.close()
+        await server.wait_closed()
+        self.log.info(f'Port {port} is closed')
+
+
+def raise_open_files_limit() -> None:
+    """ Every listener and connection is a file descriptor, allow as many as possible """
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+_engine: Optional[ListenerEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> ListenerEngine:
+    """ Engine shared by all exposures of the process """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = ListenerEngine()
+        return _engine
+
+
+# ============= Connection handlers ============================
+
+
+async def serve_tcp(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                    stats: PortStats) -> None:
+    """ Accept connection and read data until the client closes it (like `nc -lk`) """
+    while True:
+        data = await reader.read(64 * 1024)
+        if not data:
+            return
+        stats.hit(bytes_received=len(data))
+
+
+async def serve_http(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                     stats: PortStats, routes: Optional[Routes] = None) -> None:
+    """ HTTP/1.1 origin emulator (keep-alive supported)
+
+    Replies to any method with the request line and headers (see
+    `http_serv.make_response`). Connection idle for IDLE_TIMEOUT sec is closed.
+    """
+    while True:
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), IDLE_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            # Client closed connection, headers are too long or connection is idle
+            return
+        request_line, *header_lines = head.decode('latin-1').split('\r\n')
+        headers = {}
+        for line in header_lines:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        try:
+            method, path, version = request_line.split(' ', 2)
+            length = int(headers.get('content-length') or 0)
+            if length < 0:
+                raise ValueError(f'Negative Content-Length: {length}')
+        except ValueError:
+            # Malformed request line or Content-Length
+            writer.write(b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n')
+            await writer.drain()
+            return
+        if length:
+            await asyncio.wait_for(reader.readexactly(length), IDLE_TIMEOUT)
+        stats.hit(requests=1, bytes_received=len(head) + length)
+        keep_alive = (headers.get('connection', '').lower() != 'close'
+                      and version.upper() == 'HTTP/1.1')
+        route, body = make_response(routes or {}, method, path, header_lines)
+        if route.latency:
+            await asyncio.sleep(route.latency)
+        status = HTTPStatus(route.status)
+        writer.write((f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+                      f'Server: {SERVER_VERSION}\r\n'
+                      f'Content-type: text/plain; charset=utf-8\r\n'
+                      f'Content-length: {len(body)}\r\n'
+                      f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n').encode()
+                     + (b'' if method.upper() == 'HEAD' else body))
+        await writer.drain()
+        if not keep_alive:
+            return
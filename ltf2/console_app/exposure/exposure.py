@@ -1,61 +1,101 @@
 import os
-import subprocess
-import time
+import ssl
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ltf2.console_app.exposure.cert_factory import CertSpec, get_cert_factory
+from ltf2.console_app.exposure.engine import get_engine, serve_http, serve_tcp
+from ltf2.console_app.exposure.http_serv import Routes, server_ssl_context
+
+
+CERTS_DIR = Path(__file__).parent / 'certs'
+
+
+@lru_cache(maxsize=None)
+def cached_ssl_context(certfile: str, mtime_ns: int) -> ssl.SSLContext:
+    """ One context per cert for all the ports (e.g. port range) using it
+
+    Modification time of the file is a part of the key: a re-minted cert gets a new context.
+    """
+    return server_ssl_context(certfile)
 
 
 class BaseExposure:
-    def __init__(self, shell=False):
+    """ Listener on the port served by the in-process engine (see `ListenerEngine`) """
+    handler = None
+
+    def __init__(self, port):
+        self.port = int(port)
         self.handle = None
-        self.cmd_line = None
-        self.shell = shell
+        # Spec the exposure was created from and owner of the exposure (see app.py)
+        self.spec = None
+        self.owner = ''
+
+    def ssl_context(self):
+        return None
 
     def start(self):
-        cmd = self.cmd_line if self.shell else self.cmd_line.split()
-        print('>>>> cmd:', cmd)
-        self.handle = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            shell=self.shell,
-            preexec_fn=os.setpgrp)
-        print('>>>> handle pid:', self.handle.pid)
+        self.handle = get_engine().open(self.port, self.handler, self.ssl_context())
 
     def stop(self):
         if not self.handle:
             return
-        max_killing_tries = 5
-        while max_killing_tries > 0:
-            # subprocess.call(f'sudo kill -2 {self.handle.pid}'.split())
-            subprocess.call(f'sudo pkill -TERM -P {self.handle.pid}'.split())
-            if self.handle.poll() is None:
-                max_killing_tries -= 1
-                time.sleep(1)
-                continue
-            self.handle = None
-            break
-        else:
-            raise Exception(f'The pid {self.handle.pid} was not killed in {max_killing_tries}s')
+        get_engine().close(self.port)
+        self.handle = None
+
+    @staticmethod
+    def start_many(exposures: List['BaseExposure']) -> Dict[int, Exception]:
+        """ Start exposures with one call to the engine, return errors by port """
+        results = get_engine().open_many([(e.port, e.handler, e.ssl_context()) for e in exposures])
+        errors = {}
+        for exposure in exposures:
+            result = results[exposure.port]
+            if isinstance(result, Exception):
+                errors[exposure.port] = result
+            else:
+                exposure.handle = result
+        return errors
+
+    @staticmethod
+    def stop_many(exposures: List['BaseExposure']) -> None:
+        get_engine().close_many([e.port for e in exposures if e.handle])
+        for exposure in exposures:
+            exposure.handle = None
 
 
 class NcExposure(BaseExposure):
-    def __init__(self, port):
-        super().__init__()
-        self.port = port
-        self.cmd_line = f'sudo nc -lk {port}'
+    handler = staticmethod(serve_tcp)
 
     def __repr__(self):
         return f'NcExposure port: {self.port}, active: {self.handle is not None}'
 
 
 class HttpExposure(BaseExposure):
-    def __init__(self, port, tls=False):
-        super().__init__(shell=True)
-        self.port = port
-        cwd = os.getcwd()
-        self.tls_name = tls
-        path_pref = f'{cwd}/ltf2/console_app/exposure'
-        self.tls = f'{path_pref}/certs/{tls}.pem' if tls else ''
-        self.cmd_line = f'sudo python3 {path_pref}/http_serv.py -p {port} -tls "{self.tls}"'
+    """ HTTP(S) origin emulator
+
+    Args:
+        port: port to listen on
+        tls: name of the cert in `certs` folder (without extension) or spec of
+            the cert minted by `CertFactory` (e.g. {"kind": "expired", "host": "a.com"})
+        routes: response settings by path prefix (see `http_serv.Route`)
+    """
+    def __init__(self, port, tls=False, routes: Optional[Routes] = None):
+        super().__init__(port)
+        if isinstance(tls, dict):
+            spec = CertSpec.from_json(tls)
+            self.tls_name = spec.name
+            self.tls = str(get_cert_factory().get(spec))
+        else:
+            self.tls_name = tls
+            self.tls = str(CERTS_DIR / f'{tls}.pem') if tls else ''
+        self.routes = routes or {}
+        self.handler = partial(serve_http, routes=self.routes)
+
+    def ssl_context(self):
+        if not self.tls:
+            return None
+        return cached_ssl_context(self.tls, os.stat(self.tls).st_mtime_ns)
 
     def __repr__(self):
         return f'HttpExposure port: {self.port}, TLS: {self.tls_name}, active: {self.handle is not None}'
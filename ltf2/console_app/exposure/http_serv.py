@@ -1,46 +1,68 @@
-import argparse
-from http.server import HTTPServer, BaseHTTPRequestHandler
 import ssl
+from functools import lru_cache
+from http import HTTPStatus
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 
-class ReqHandler(BaseHTTPRequestHandler):
-    def version_string(self):
-        return 'CoolHttp/1.0'
-
-    def do_GET(self):
-        msg = f'GET {self.path}\n{self.headers}'
-        self.send_response(200)
-        self.send_header('Content-type', 'text/plain; charset=utf-8')
-        self.send_header('Content-length', str(len(msg)))
-        self.end_headers()
-        self.wfile.write(msg.encode())
-
-
-def run(port, tls):
-    httpd = HTTPServer(('0.0.0.0', port), ReqHandler)
-    if tls:
-        httpd.socket = ssl.wrap_socket(
-            httpd.socket,
-            certfile=tls,
-            server_side=True)
-    httpd.serve_forever()
-
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description='Run a simple HTTP server')
-    parser.add_argument(
-        '-p',
-        dest='port',
-        type=int,
-        default=443,
-        help='Specify the port on which the server listens',
-    )
-    parser.add_argument(
-        '-tls',
-        dest='tls',
-        default='./certs/self-signed.pem',
-        help='Specify the TLS certificate file',
-    )
-
-    args = parser.parse_args()
-    run(port=args.port, tls=args.tls)
+SERVER_VERSION = 'CoolHttp/1.0'
+
+
+class Route(NamedTuple):
+    """ Response settings of the path prefix """
+    size: Optional[int] = None
+    latency: float = 0
+    status: int = 200
+
+
+# Routes by path prefix, the longest prefix wins
+Routes = Dict[str, Route]
+
+
+def routes_from_json(data: Optional[dict]) -> Routes:
+    """ Routes from `{"/big": {"size": 1048576, "latency": 0.5}}`
+
+    Raises ValueError if status is not a known HTTP status or size is negative.
+    """
+    routes = {prefix: Route(**params) for prefix, params in (data or {}).items()}
+    for prefix, route in routes.items():
+        HTTPStatus(route.status)
+        if route.size is not None and route.size < 0:
+            raise ValueError(f'Negative size of {prefix!r}: {route.size}')
+    return routes
+
+
+def match_route(routes: Routes, path: str) -> Route:
+    prefixes = [p for p in routes if path.startswith(p)]
+    return routes[max(prefixes, key=len)] if prefixes else Route()
+
+
+@lru_cache(maxsize=32)
+def filler(size: int) -> bytes:
+    return b'x' * size
+
+
+def make_response(routes: Routes, method: str, path: str,
+                  header_lines: List[str]) -> Tuple[Route, bytes]:
+    """ Route settings and body of the response
+
+    The body is the request line and headers. If route size is specified, the
+    body is padded (or cut) to that size.
+    """
+    route = match_route(routes, path)
+    body = (f'{method} {path}\n' + ''.join(f'{line}\n' for line in header_lines if line)).encode()
+    if route.size is not None:
+        body = body[:route.size] + filler(max(route.size - len(body), 0))
+    return route, body
+
+
+def server_ssl_context(certfile: str) -> ssl.SSLContext:
+    """ Server TLS context, TLS sessions are resumed with session tickets """
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    try:
+        context.load_cert_chain(certfile)
+    except ssl.SSLError:
+        # Weak keys/signatures are refused by the default security level
+        context.set_ciphers('DEFAULT:@SECLEVEL=0')
+        context.load_cert_chain(certfile)
+    return context
+
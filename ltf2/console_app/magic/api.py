@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Optional
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# WAF config paths of the security rules sections (see `SecurityPage`)
+WAF_PATHS = {
+    'access_rules': '/acl',
+    'rate_rules': '/limit',
+    'managed_rules': '/profile',
+}
+
+# The same operations are sent by the console app (see the mocks in security tests)
+WAF_CONFIG_QUERY = """
+query wafConfig($team: String!, $path: String!, $params: JSON) {
+  wafConfig(team: $team, path: $path, params: $params)
+}"""
+
+MUTATE_WAF_CONFIG = """
+mutation mutateWafConfig($team: String!, $path: String!, $httpMethod: String!, $body: JSON) {
+  mutateWafConfig(team: $team, path: $path, httpMethod: $httpMethod, body: $body) {
+    userErrors {
+      message
+    }
+    response
+  }
+}"""
+
+
+class ApiError(Exception):
+    """ Console API request failed """
+
+
+class ConsoleApi:
+    """ Client of the console GraphQL and BFF endpoints
+
+    Uses cookies of the signed in state (see `saved_login` fixture), so fixtures
+    can seed and purge test data without clicking through the UI.
+
+    Args:
+        base_url: console url
+        storage_state: playwright storage state with the login cookies
+        graphql_url: GraphQL endpoint (`<base_url>/graphql` by default)
+        timeout: request timeout (sec)
+        max_workers: number of requests sent concurrently by bulk methods
+
+    Example:
+        api = ConsoleApi(base_url, saved_login)
+        api.delete_waf_rules('my-team', WAF_PATHS['access_rules'],
+                             [cmp.re_match('ltf-')])
+    """
+    def __init__(self,
+                 base_url: str,
+                 storage_state: dict,
+                 graphql_url: Optional[str] = None,
+                 timeout: float = 30,
+                 max_workers: int = 8):
+        self.base_url = base_url
+        self.graphql_url = graphql_url or urljoin(base_url, '/graphql')
+        self.bff_url = urljoin(base_url, '/api/bff/')
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        for cookie in storage_state.get('cookies', []):
+            self.session.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain', ''),
+                                     path=cookie.get('path', '/'))
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise ApiError(f'{method} {url} failed: {e}') from e
+        return response
+
+    def graphql(self, query: str, variables: Optional[dict] = None,
+                operation_name: Optional[str] = None) -> dict:
+        """ Send GraphQL request and return `data` of the response """
+        self.log.debug(f'GraphQL {operation_name}: {variables}')
+        payload = {'query': query, 'variables': variables or {}}
+        if operation_name:
+            payload['operationName'] = operation_name
+        body = self._request('POST', self.graphql_url, json=payload).json()
+        if body.get('errors'):
+            raise ApiError(f'GraphQL {operation_name} errors: {body["errors"]}')
+        return body['data']
+
+    def bff(self, method: str, path: str, **kwargs) -> Any:
+        """ Send request to BFF endpoint (e.g. 'traffic/routes') and return json """
+        return self._request(method, urljoin(self.bff_url, path.lstrip('/')), **kwargs).json()
+
+    # ======== WAF (security rules) ========
+
+    def waf_config(self, team: str, path: str, params: Optional[dict] = None) -> Any:
+        return self.graphql(WAF_CONFIG_QUERY,
+                            {'team': team, 'path': path, 'params': params},
+                            'wafConfig')['wafConfig']
+
+    def mutate_waf_config(self, team: str, path: str, http_method: str,
+                          body: Optional[dict] = None) -> Any:
+        result = self.graphql(MUTATE_WAF_CONFIG,
+                              {'team': team, 'path': path,
+                               'httpMethod': http_method, 'body': body},
+                              'mutateWafConfig')['mutateWafConfig']
+        if result.get('userErrors'):
+            raise ApiError(f'{http_method} {path} failed: {result["userErrors"]}')
+        return result.get('response')
+
+    def create_waf_rule(self, team: str, path: str, rule: dict) -> Any:
+        """ Create rule in WAF config section (e.g. WAF_PATHS['access_rules']) """
+        return self.mutate_waf_config(team, path, 'post', rule)
+
+    def create_waf_rules(self, team: str, path: str, rules: Iterable[dict]) -> List[Any]:
+        """ Create several rules concurrently """
+        return self._bulk(lambda rule: self.create_waf_rule(team, path, rule), rules)
+
+    def delete_waf_rules(self, team: str, path: str, names: Iterable,
+                         missing_ok: bool = False) -> List[str]:
+        """ Delete rules by names (support comparators) and return deleted names
+
+        Rules are listed with one request and deleted concurrently. ApiError is
+        raised if the rules have unexpected shape or, unless `missing_ok`, some of
+        the plain (not comparator) names are not found.
+        """
+        names = list(names)
+        config = self.waf_config(team, path)
+        try:
+            if not isinstance(config, list):
+                raise TypeError(f'list is expected, got {type(config).__name__}')
+            rules = [rule for rule in config if any(name == rule['name'] for name in names)]
+            ids = [rule['id'] for rule in rules]
+        except (KeyError, TypeError) as e:
+            raise ApiError(f'Unexpected {path} rules {str(config)[:200]}: {e!r}') from e
+        deleted = [rule['name'] for rule in rules]
+        missing = [name for name in names if type(name) is str and name not in deleted]
+        if missing and not missing_ok:
+            raise ApiError(f'{path} rules {missing} are not found')
+        self._bulk(lambda id_: self.mutate_waf_config(team, f"{path}/{id_}", 'delete'), ids)
+        self.log.debug(f'Deleted {path} rules: {deleted}')
+        return deleted
+
+    def _bulk(self, func, items: Iterable) -> List[Any]:
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, items))
+
+    def close(self) -> None:
+        self.session.close()
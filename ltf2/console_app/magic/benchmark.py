@@ -0,0 +1,243 @@
+""" Benchmarks of the console: repeated measurements compared with a baseline
+
+A benchmark runs a measured action N times, its median and p95 are compared
+with the samples of the baseline. The change fails the benchmark only when it
+is statistically significant (one-sided Mann-Whitney U test, `alpha`) and the
+median is slower by more than `min_change`, so the noise of a shared stage
+environment does not fail the run.
+"""
+import json
+import math
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from ltf2.console_app.magic.elements import PageElement
+
+
+BASELINE_VERSION = 1
+
+# Quiet window of the settled page (ms), it is not counted in the measured time
+SETTLE_QUIET = 300
+
+OK = 'ok'
+NEW = 'new'
+SLOWER = 'slower'
+FASTER = 'faster'
+
+
+def rankdata(values: np.ndarray) -> np.ndarray:
+    """ Ranks of the values (1-based), tied values get the average rank """
+    ranks = np.empty(len(values))
+    ranks[np.argsort(values, kind='mergesort')] = np.arange(1, len(values) + 1)
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    return (np.bincount(inverse, weights=ranks) / counts)[inverse]
+
+
+def mann_whitney_greater(samples: Sequence[float], baseline: Sequence[float]) -> float:
+    """ One-sided p-value of `samples` being greater (slower) than `baseline`
+
+    Normal approximation of the Mann-Whitney U test with tie and continuity
+    corrections, good enough from ~8 samples per group.
+    """
+    x, y = np.asarray(samples, dtype=float), np.asarray(baseline, dtype=float)
+    n1, n2 = len(x), len(y)
+    n = n1 + n2
+    if not n1 or not n2:
+        return 1.0
+    values = np.concatenate([x, y])
+    u = rankdata(values)[:n1].sum() - n1 * (n1 + 1) / 2
+    _, counts = np.unique(values, return_counts=True)
+    ties = float((counts ** 3 - counts).sum())
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class Stats(NamedTuple):
+    """ Statistics of the samples (sec) """
+    runs: int
+    median: float
+    p95: float
+    mean: float
+    min: float
+    max: float
+
+    @classmethod
+    def of(cls, samples: Sequence[float]) -> 'Stats':
+        values = np.asarray(samples, dtype=float)
+        return cls(len(values), *(round(float(v), 4) for v in (
+            np.median(values), np.percentile(values, 95), values.mean(), values.min(), values.max())))
+
+
+class Verdict(NamedTuple):
+    """ Result of the comparison with the baseline """
+    name: str
+    status: str
+    stats: Stats
+    baseline: Optional[Stats]
+    change: Optional[float]
+    p_value: Optional[float]
+
+    def __str__(self) -> str:
+        text = f'{self.name}: {self.status}, median {self.stats.median:.3f}s, p95 {self.stats.p95:.3f}s'
+        if self.baseline is not None:
+            text += (f' (baseline median {self.baseline.median:.3f}s, p95 {self.baseline.p95:.3f}s, '
+                     f'change {self.change:+.1%}, p={self.p_value:.4f})')
+        return text
+
+
+def compare(name: str, samples: Sequence[float], baseline: Optional[Sequence[float]],
+            alpha: float = 0.01, min_change: float = 0.1) -> Verdict:
+    """ Compare the samples with the samples of the baseline
+
+    Example:
+        verdict = compare('traffic.open', [1.2, 1.3, ...], [1.0, 1.1, ...])
+        assert verdict.status != SLOWER, str(verdict)
+    """
+    stats = Stats.of(samples)
+    if not baseline:
+        return Verdict(name, NEW, stats, None, None, None)
+    base = Stats.of(baseline)
+    change = stats.median / base.median - 1 if base.median else 0.0
+    slower = mann_whitney_greater(samples, baseline)
+    faster = mann_whitney_greater(baseline, samples)
+    if slower < alpha and change > min_change:
+        status, p_value = SLOWER, slower
+    elif faster < alpha and -change > min_change:
+        status, p_value = FASTER, faster
+    else:
+        status, p_value = OK, min(slower, faster)
+    return Verdict(name, status, stats, base, round(change, 4), round(p_value, 6))
+
+
+class BaselineStore:
+    """ Samples of the benchmarks saved in the JSON file
+
+    Example:
+        store = BaselineStore.load('benchmarks/baseline.json')
+        store.update('traffic.open', samples)
+        store.save()
+    """
+    def __init__(self, path: Union[str, Path], benchmarks: Optional[Dict[str, dict]] = None):
+        self.path = Path(path)
+        self.benchmarks = benchmarks or {}
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'BaselineStore':
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+        data = json.loads(path.read_text())
+        if data.get('version') != BASELINE_VERSION:
+            raise ValueError(f'Unsupported version of the baseline {path}: {data.get("version")}')
+        return cls(path, data['benchmarks'])
+
+    def samples(self, name: str) -> Optional[List[float]]:
+        entry = self.benchmarks.get(name)
+        return entry['samples'] if entry else None
+
+    def update(self, name: str, samples: Sequence[float]) -> None:
+        self.benchmarks[name] = {**Stats.of(samples)._asdict(),
+                                 'samples': [round(s, 4) for s in samples],
+                                 'updated': datetime.now(timezone.utc).isoformat(timespec='seconds')}
+
+    def save(self) -> None:
+        """ Save the baseline atomically, benchmarks are sorted to keep diffs small """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': BASELINE_VERSION, 'benchmarks': dict(sorted(self.benchmarks.items()))}
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f'.{self.path.name}.')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+
+class Benchmark:
+    """ Runs the measurements and compares them with the baseline
+
+    Args:
+        baseline: baseline store
+        runs: number of measured runs
+        warmup: number of runs before the measured ones (not counted)
+        alpha: significance level of the slowdown
+        min_change: min relative slowdown of the median that fails the benchmark
+
+    Example:
+        bench = Benchmark(BaselineStore.load(path), runs=10)
+        verdict = bench.run('traffic.open',
+                            lambda: time_to_interactive(traffic_page, traffic_page.traffic_header))
+    """
+    def __init__(self, baseline: BaselineStore, runs: int = 10, warmup: int = 1,
+                 alpha: float = 0.01, min_change: float = 0.1):
+        self.baseline = baseline
+        self.runs = runs
+        self.warmup = warmup
+        self.alpha = alpha
+        self.min_change = min_change
+        self.results: Dict[str, List[float]] = {}
+        self.verdicts: Dict[str, Verdict] = {}
+
+    def measure(self, name: str, action: Callable[[], float], runs: Optional[int] = None,
+                warmup: Optional[int] = None) -> List[float]:
+        """ Samples of the action (it returns the measured time, sec) """
+        for _ in range(self.warmup if warmup is None else warmup):
+            action()
+        samples = [action() for _ in range(self.runs if runs is None else runs)]
+        self.results[name] = samples
+        return samples
+
+    def run(self, name: str, action: Callable[[], float], runs: Optional[int] = None,
+            warmup: Optional[int] = None) -> Verdict:
+        """ Measure the action and compare the samples with the baseline """
+        samples = self.measure(name, action, runs, warmup)
+        verdict = compare(name, samples, self.baseline.samples(name), self.alpha, self.min_change)
+        self.verdicts[name] = verdict
+        return verdict
+
+    def update_baseline(self) -> None:
+        """ Save the samples of this run as the baseline """
+        for name, samples in self.results.items():
+            self.baseline.update(name, samples)
+        self.baseline.save()
+
+
+def time_to_interactive(page_object, ready: PageElement,
+                        navigate: Optional[Callable[[], None]] = None) -> float:
+    """ Time (sec) from the navigation until `ready` is visible and the page is settled
+
+    The page is settled when there are no fetch/xhr requests in progress and no
+    DOM mutations (see `BasePage.wait_for_settle`), its quiet window is not counted.
+
+    Example:
+        time_to_interactive(traffic_page, traffic_page.traffic_header)
+    """
+    start = time.perf_counter()
+    (navigate or page_object.goto)()
+    ready.wait_for()
+    page_object.wait_for_settle(quiet=SETTLE_QUIET)
+    return time.perf_counter() - start - SETTLE_QUIET / 1000
+
+
+def interaction_latency(page_object, action: Callable[[], None],
+                        graphql: Optional[str] = None, url: Optional[str] = None) -> float:
+    """ Time (sec) from the action until the page is settled (see `BasePage.settle`)
+
+    Example:
+        interaction_latency(traffic_page, lambda: traffic_page.select_by_name(name='p95').click(),
+                            url=TRAFFIC_ROUTES)
+    """
+    start = time.perf_counter()
+    with page_object.settle(graphql, url, quiet=SETTLE_QUIET):
+        action()
+    return time.perf_counter() - start - SETTLE_QUIET / 1000
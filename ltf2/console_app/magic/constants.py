@@ -4,6 +4,15 @@ HTTP_METHODS = ['GET', 'POST', 'PUT', 'DELETE', 'HEAD',
 
 PAGE_TIMEOUT = 15 * 1000
 
+# Max count of requests/responses stored in the page history
+HISTORY_MAX_SIZE = 10000
+
+# Time (ms) to wait for the app router to open the page before loading it
+SOFT_NAVIGATION_TIMEOUT = 5 * 1000
+
+# Max time (ms) to wait for the page to settle after a timed interaction
+INTERACTION_SETTLE_TIMEOUT = 10 * 1000
+
 
 ACCESS_CONTROL_TYPE = {
     'ASN': 'asn',
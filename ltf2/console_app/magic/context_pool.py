@@ -0,0 +1,117 @@
+import logging
+from typing import List, Optional
+
+from playwright.sync_api import Browser, Error, Page
+
+from ltf2.console_app.magic.constants import PAGE_TIMEOUT
+
+
+# Local and session storage are empty in a new context
+CLEAR_STORAGE_JS = """() => {
+    try {
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+    } catch (e) {}
+}"""
+
+
+class ContextPool:
+    """ Pool of warm browser contexts
+
+    Keeps contexts (with the console app loaded in their page) alive between
+    tests. A released page is reset instead of being closed: its routes, extra
+    pages, permissions and storage are cleared and the cookies are restored from
+    `context_args['storage_state']`. The next test loads its page in the warm
+    context instead of creating a new one.
+
+    Page objects created on the page should be detached (`BasePage.detach`)
+    before the page is released.
+
+    Args:
+        browser: playwright Browser instance
+        context_args: arguments of `browser.new_context`
+        max_size: max number of free contexts kept in the pool
+
+    Example:
+        pool = ContextPool(browser, {'storage_state': saved_login})
+        page = pool.acquire()
+        prop_page = PropertyPage(page, url)
+        prop_page.goto()
+        ...
+        prop_page.detach()
+        pool.release(page)
+    """
+    def __init__(self, browser: Browser, context_args: dict, max_size: int = 2):
+        self.browser = browser
+        self.context_args = context_args
+        self.max_size = max_size
+        self._free: List[Page] = []
+        self._busy: List[Page] = []
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def acquire(self) -> Page:
+        """ Get warm page from the pool or create a new context """
+        page: Optional[Page] = None
+        while self._free:
+            page = self._free.pop()
+            if not page.is_closed():
+                break
+            self._close(page)
+            page = None
+        if page is None:
+            self.log.debug('Creating new context')
+            page = self.browser.new_context(**self.context_args).new_page()
+        self._busy.append(page)
+        return page
+
+    def release(self, page: Page, reuse: bool = True) -> None:
+        """ Return the page to the pool
+
+        The context is closed if `reuse` is False (e.g. test failed and the page
+        may be in unexpected state), the page is closed or the pool is full.
+        """
+        if page in self._busy:
+            self._busy.remove(page)
+        if not reuse or page.is_closed() or len(self._free) >= self.max_size:
+            self._close(page)
+            return
+        try:
+            self.reset(page)
+        except Error as e:
+            self.log.debug(f'Page was not reset: {e}')
+            self._close(page)
+            return
+        self._free.append(page)
+
+    def reset(self, page: Page) -> None:
+        """ Bring the page context to the state of the new context """
+        context = page.context
+        for other in context.pages:
+            if other != page:
+                other.close()
+        if hasattr(page, 'unroute_all'):
+            page.unroute_all(behavior='ignoreErrors')
+            context.unroute_all(behavior='ignoreErrors')
+        context.clear_permissions()
+        context.clear_cookies()
+        cookies = (self.context_args.get('storage_state') or {}).get('cookies')
+        if cookies:
+            context.add_cookies(cookies)
+        page.evaluate(CLEAR_STORAGE_JS)
+        page.set_default_timeout(PAGE_TIMEOUT)
+
+    def _close(self, page: Page) -> None:
+        try:
+            page.context.close()
+        except Error as e:
+            self.log.debug(f'Context was not closed: {e}')
+
+    def close(self) -> None:
+        """ Close all contexts of the pool """
+        for page in self._free + self._busy:
+            self._close(page)
+        self._free = []
+        self._busy = []
+
+    def __len__(self) -> int:
+        return len(self._free)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from playwright.sync_api import Page
-from typing import Type, List
+from typing import Dict, Iterable, List, Optional, Type, Union
 import logging
 
+from ltf2.console_app.magic.interaction import InteractionTiming, measure_interaction
+from ltf2.console_app.magic.timing import LOCATOR_BUILDERS, get_action_recorder
+
 
 class PageElement:
     """ Base parent-class for all elements """
@@ -15,14 +18,92 @@ class PageElement:
 
     def __getattr__(self, attr: str):
         if hasattr(self._locator, attr):
-            self.log.debug(f'Doing `{attr}` to: `{self.selector}`')
-            return getattr(self._locator, attr)
+            self.log.debug('Doing `%s` to: `%s`', attr, self.selector)
+            value = getattr(self._locator, attr)
+            recorder = get_action_recorder()
+            if recorder.active and callable(value) and attr not in LOCATOR_BUILDERS:
+                return recorder.wrap(value, self.selector, attr)
+            return value
+
+    def is_present(self) -> bool:
+        """ Whether the element is visible right now, without waiting (see `BasePage.probe`) """
+        return self._locator.first.is_visible()
+
+    def timed(self, action: str, *args, name: Optional[str] = None, **kwargs) -> InteractionTiming:
+        """ Do the action and measure the user-perceived latency (see `measure_interaction`)
+
+        Example:
+            traffic_page.select_by_name(name='p95').timed('click', name='rules percentile p95')
+        """
+        return measure_interaction(self._locator, action, *args, name=name,
+                                   selector=self.selector, **kwargs)
+
+    def timed_click(self, name: Optional[str] = None, **kwargs) -> InteractionTiming:
+        """ Click and measure the time until the next paint and the settled page """
+        return self.timed('click', name=name, **kwargs)
 
     def __dir__(self) -> List[str]:
         """Include methods from self._locator in dir() output"""
         return sorted(set(dir(type(self)) + list(self.__dict__.keys()) + dir(self._locator)))
 
 
+class LazyElement:
+    """ Lazy element declaration
+
+    Descriptor for describing page elements on the class level. The element is
+    created on the first access and cached in the page instance, so only elements
+    that are actually used are built.
+
+    Args:
+        selector: element selector (or selector pattern for dynamic elements)
+        element_type: class of the element to create
+        *args: extra positional arguments passed to `element_type` after selector
+        parent: name of the page attribute to use as a root of the element
+            (`page.page` is used by default)
+        nth: index of the element to return (`Locator.nth`)
+
+    Example:
+        class LoginMixin:
+            username = LazyElement("//input[@id='username']")
+            table = LazyElement("//table", TableElement)
+            close = LazyElement("//button[text()='Close']", nth=1)
+
+        login_page.username.fill('user')  # PageElement is created here
+    """
+    def __init__(self,
+                 selector: str,
+                 element_type: Type = PageElement,
+                 *args,
+                 parent: Optional[str] = None,
+                 nth: Optional[int] = None):
+        self.selector = selector
+        self.element_type = element_type
+        self.args = args
+        self.parent = parent
+        self.nth = nth
+        self.name = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner: type):
+        if instance is None:
+            return self
+        root = instance.page if self.parent is None else getattr(instance, self.parent)
+        element = self.element_type(root, self.selector, *self.args)
+        if self.nth is not None:
+            element = element.nth(self.nth)
+        # Cache element in the instance, the descriptor is not called anymore
+        instance.__dict__[self.name] = element
+        return element
+
+
+def set_lazy_element(owner: type, name: str, element: LazyElement) -> None:
+    """ Add lazy element to the class after the class creation """
+    setattr(owner, name, element)
+    element.__set_name__(owner, name)
+
+
 class IframeElement(PageElement):
     def __init__(self, iframe, selector: str):
         super().__init__(iframe, selector)
@@ -172,6 +253,29 @@ class TheadElement(PageElement):
         self.th = ListElement(page, f'{selector}/tr/th')
 
 
+# Text of the cells of every row and the table headers (evaluated on all `tr` of tbody)
+TABLE_CELLS_JS = """rows => {
+    const text = el => el.textContent;
+    const table = rows.length ? rows[0].closest('table') : null;
+    const headers = table ? Array.from(table.querySelectorAll(':scope > thead > tr > th'), text) : [];
+    return {headers, rows: rows.map(row => Array.from(row.querySelectorAll(':scope > td'), text))};
+}"""
+
+# Index of the first row which cell contains one of the values (-1 if not found)
+TABLE_FIND_ROW_JS = """(rows, [column, values]) => {
+    if (typeof column === 'string') {
+        const table = rows.length ? rows[0].closest('table') : null;
+        const headers = table ? Array.from(table.querySelectorAll(':scope > thead > tr > th'),
+                                           th => th.textContent) : [];
+        column = headers.indexOf(column);
+    }
+    return rows.findIndex(row => {
+        const cell = row.querySelectorAll(':scope > td')[column];
+        return cell !== undefined && values.includes(cell.textContent);
+    });
+}"""
+
+
 class TableElement(PageElement):
     """ Class for describing HTML table """
     def __init__(self, page: Page, selector: str):
@@ -179,6 +283,64 @@ class TableElement(PageElement):
         self.thead = TheadElement(page, f'{selector}/thead')
         self.tbody = TbodyElement(page, f'{selector}/tbody', TrElements, TdElements)
 
+    def cells(self) -> Dict[str, list]:
+        """ Headers and text of all cells of the table in one browser call
+
+        Returns:
+            {'headers': ['Name', ...], 'rows': [['name1', ...], ['name2', ...]]}
+        """
+        return self.tbody.tr.evaluate_all(TABLE_CELLS_JS)
+
+    def rows(self) -> List[Dict[str, str]]:
+        """ Text of all cells of the table keyed by `thead.th` text
+
+        Cells without a header are keyed by column index.
+
+        Example:
+            collections_page.collections_table.rows()
+            # [{'Name': 'collection1', 'Entities': '2', ...}, ...]
+        """
+        cells = self.cells()
+        headers = cells['headers']
+        return [{headers[i] if i < len(headers) and headers[i] else i: text
+                 for i, text in enumerate(row)}
+                for row in cells['rows']]
+
+    def find_row_index(self, value: Union[str, Iterable[str]],
+                       column: Union[int, str] = 0) -> int:
+        """ Index of the first row with the cell text equal to value (-1 if not found)
+
+        Args:
+            value: cell text or several texts (any of them matches).
+                Comparators are matched in python against the text of all cells.
+            column: column index or header text
+        """
+        values = [value] if isinstance(value, str) or not isinstance(value, Iterable) \
+            else list(value)
+        if all(isinstance(v, str) for v in values):
+            return self.tbody.tr.evaluate_all(TABLE_FIND_ROW_JS, [column, values])
+        cells = self.cells()
+        if isinstance(column, str):
+            column = cells['headers'].index(column)
+        for index, row in enumerate(cells['rows']):
+            if column < len(row) and any(v == row[column] for v in values):
+                return index
+        return -1
+
+    def find_row(self, value: Union[str, Iterable[str]],
+                 column: Union[int, str] = 0) -> Optional[TdElements]:
+        """ Find the first row with the cell text equal to value (None if not found)
+
+        Only one browser call is made, cells are not fetched one by one.
+
+        Example:
+            row = security_page.table.find_row('rule name')
+            if row is not None:
+                row[0].click()
+        """
+        index = self.find_row_index(value, column)
+        return None if index < 0 else self.tbody.tr[index]
+
 
 class MembersTableElement(PageElement):
     class TdMembersElement(TdElements):
@@ -1,6 +1,10 @@
 from __future__ import annotations
+from pathlib import Path
 from random import randint, choice
+import os
+import pickle
 import string
+import tempfile
 
 from playwright.sync_api import Page
 
@@ -20,6 +24,43 @@ def random_bool():
     return choice([True, False])
 
 
+def worker_id() -> str:
+    """ Return pytest-xdist worker id (e.g. 'gw0') or 'master' if tests are not distributed """
+    return os.getenv('PYTEST_XDIST_WORKER', 'master')
+
+
+def worker_index() -> int:
+    """ Return index of the pytest-xdist worker (0 for 'master') """
+    wid = worker_id()
+    return 0 if wid == 'master' else int(wid[2:])
+
+
+def worker_prefix(prefix: str) -> str:
+    """ Make name prefix unique for the current pytest-xdist worker.
+
+    Used to create and clean up entities only of the current worker, e.g.
+    'ltf-' -> 'ltf-gw1-'. The prefix is not changed if tests are not distributed.
+    """
+    wid = worker_id()
+    return prefix if wid == 'master' else f'{prefix}{wid}-'
+
+
+def pickle_dump_atomic(obj, path: Path) -> None:
+    """ Pickle object into the file atomically
+
+    The object is written into a temporary file in the same directory and then
+    renamed, so concurrent readers never see partially written file.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(obj, f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
 def mock_frame_request(page: Page) -> Page:
     page.route("*/embed/frame",
                lambda route: route.fulfill(status=200,
@@ -0,0 +1,232 @@
+""" User-perceived latency of a single interaction
+
+The interaction (click, fill, ...) is measured in the browser from the input
+event until:
+
+    paint: the next frame after the event handlers (the first visual response)
+    settled: the last DOM mutation or the end of the last network call
+        triggered by the interaction (the final state of the UI)
+
+Network calls (fetch/xhr) started by the interaction are recorded too.
+Measurements are kept in `ActionRecorder.interactions` and attached to the
+allure report of the test (see `interaction_timings` fixture).
+"""
+import logging
+import time
+from typing import List, NamedTuple, Optional
+
+from playwright.sync_api import Error, Locator, Request, Response
+
+from ltf2.console_app.magic.constants import INTERACTION_SETTLE_TIMEOUT
+from ltf2.console_app.magic.timing import get_action_recorder
+
+
+# Requests that are waited for and recorded
+TRACKED_RESOURCE_TYPES = ('fetch', 'xhr')
+
+# Records the input event, the next paint and the last DOM mutation (performance.now() ms)
+INTERACTION_START_JS = """() => {
+    const state = window.__ltfInteraction = {input: null, paint: null, lastMutation: null};
+    const types = ['pointerdown', 'mousedown', 'keydown', 'input', 'click'];
+    const onInput = event => {
+        types.forEach(type => removeEventListener(type, onInput, true));
+        state.input = event.timeStamp;
+        // The next frame after the event handlers: the response is painted
+        requestAnimationFrame(() => setTimeout(() => { state.paint = performance.now(); }));
+    };
+    types.forEach(type => addEventListener(type, onInput, true));
+    state.observer = new MutationObserver(() => { state.lastMutation = performance.now(); });
+    state.observer.observe(document.documentElement,
+                           {subtree: true, childList: true, attributes: true, characterData: true});
+    return performance.timeOrigin;
+}"""
+
+# Resolves when the response is painted and there are no DOM mutations for `quiet` ms
+# (settled is true) or when `timeout` ms is passed (settled is false)
+INTERACTION_WAIT_JS = """([quiet, timeout]) => new Promise(resolve => {
+    const state = window.__ltfInteraction;
+    const started = performance.now();
+    const check = () => {
+        const now = performance.now();
+        const last = Math.max(state.lastMutation || 0, state.input || 0, started);
+        const settled = state.paint !== null && now - last >= quiet;
+        if (settled || now - started >= timeout) {
+            resolve({input: state.input, paint: state.paint,
+                     lastMutation: state.lastMutation, settled});
+        } else {
+            setTimeout(check, 50);
+        }
+    };
+    check();
+})"""
+
+INTERACTION_STOP_JS = """() => {
+    const state = window.__ltfInteraction;
+    if (state) {
+        state.observer.disconnect();
+        delete window.__ltfInteraction;
+    }
+}"""
+
+
+class InteractionTiming(NamedTuple):
+    """ Measured interaction
+
+    `paint` and `settled` are ms from the input event (None if the page was
+    navigated or did not settle), `duration` is the wall time (sec) of the
+    action and the wait.
+    """
+    name: str
+    selector: str
+    action: str
+    started: float
+    duration: float
+    paint: Optional[float]
+    settled: Optional[float]
+    requests: List[dict]
+
+
+class _RequestTracker:
+    """ fetch/xhr requests of the page started while the tracker is attached """
+    def __init__(self, page):
+        self.page = page
+        self.requests: List[Request] = []
+        self.statuses = {}
+        self.inflight = set()
+        self._listeners = [('request', self._on_request),
+                           ('response', self._on_response),
+                           ('requestfinished', self.inflight.discard),
+                           ('requestfailed', self.inflight.discard)]
+        for event, handler in self._listeners:
+            self.page.on(event, handler)
+
+    def _on_request(self, request: Request) -> None:
+        if request.resource_type in TRACKED_RESOURCE_TYPES:
+            self.requests.append(request)
+            self.inflight.add(request)
+
+    def _on_response(self, response: Response) -> None:
+        self.statuses[response.request] = response.status
+
+    def detach(self) -> None:
+        for event, handler in self._listeners:
+            self.page.remove_listener(event, handler)
+
+    def end(self, request: Request) -> Optional[float]:
+        """ Unix time (ms) of the end of the response, None if it is not finished """
+        timing = request.timing
+        if request in self.inflight or timing.get('responseEnd', -1) < 0:
+            return None
+        return timing['startTime'] + timing['responseEnd']
+
+    def records(self, input_time: Optional[float]) -> List[dict]:
+        records = []
+        for request in self.requests:
+            end = self.end(request)
+            started = request.timing.get('startTime')
+            records.append({'method': request.method,
+                            'url': request.url,
+                            'status': self.statuses.get(request),
+                            'start': _since(started, input_time),
+                            'end': _since(end, input_time)})
+        return records
+
+
+def _since(value: Optional[float], origin: Optional[float]) -> Optional[float]:
+    return None if value is None or origin is None else round(value - origin, 1)
+
+
+def measure_interaction(locator: Locator, action: str = 'click', *args,
+                        name: Optional[str] = None,
+                        selector: Optional[str] = None,
+                        quiet: int = 300,
+                        timeout: float = INTERACTION_SETTLE_TIMEOUT,
+                        settle: bool = True,
+                        **kwargs) -> InteractionTiming:
+    """ Do the action with the locator and measure the latency of the interaction
+
+    The action is done as usual (`locator.click(**kwargs)`), then the page is
+    waited to paint the response and to settle: no DOM mutations for `quiet` ms
+    and the requests started by the interaction are finished. Not settled page
+    is logged, the measurement does not fail the test.
+
+    With `settle=False` only the next paint is waited for (`settled` is None), so
+    a transient response (e.g. a snackbar) can be waited for right after it.
+
+    Example:
+        timing = measure_interaction(page.deploy_changes_button.last, name='deploy changes')
+        timing.settled  # ms from the click until the UI is updated
+    """
+    page = locator.page
+    selector = selector or str(locator)
+    name = name or f'{action} {selector}'
+    log = logging.getLogger('Interaction')
+    tracker = _RequestTracker(page)
+    started = time.time()
+    start = time.perf_counter()
+    state = None
+    try:
+        try:
+            time_origin = page.evaluate(INTERACTION_START_JS)
+        except Error as e:
+            log.debug(f'{name}: interaction is not measured in the browser: {e}')
+            time_origin = None
+        getattr(locator, action)(*args, **kwargs)
+        if time_origin is not None:
+            state = _wait(page, tracker, quiet if settle else 0, timeout, settle)
+    finally:
+        tracker.detach()
+        if state is None:
+            _stop(page)
+    duration = time.perf_counter() - start
+    paint = settled = input_time = None
+    if state is None or state['input'] is None:
+        log.debug(f'{name}: input event was not captured')
+    else:
+        input_time = time_origin + state['input']
+        if state['paint'] is not None:
+            paint = round(state['paint'] - state['input'], 1)
+        if settle and state['settled']:
+            ends = [tracker.end(r) for r in tracker.requests]
+            last = max([time_origin + (state['lastMutation'] or state['input'])]
+                       + [end for end in ends if end is not None])
+            settled = round(max(last - input_time, paint or 0), 1)
+        elif settle:
+            log.warning(f'{name}: page was not settled in {timeout} ms')
+    timing = InteractionTiming(name, selector, action, started, duration, paint, settled,
+                               tracker.records(input_time))
+    get_action_recorder().interactions.append(timing)
+    log.info(f'{name}: paint {paint} ms, settled {settled} ms, {len(timing.requests)} requests')
+    return timing
+
+
+def _wait(page, tracker: _RequestTracker, quiet: int, timeout: float,
+          settle: bool = True) -> Optional[dict]:
+    """ Wait for the page to settle (or to paint), state of the interaction in the browser """
+    deadline = time.monotonic() + timeout / 1000
+    try:
+        while True:
+            remaining = max((deadline - time.monotonic()) * 1000, 0)
+            state = page.evaluate(INTERACTION_WAIT_JS, [quiet, remaining])
+            if not settle:
+                _stop(page)
+                return state
+            if not state['settled'] or not tracker.inflight or time.monotonic() >= deadline:
+                if tracker.inflight:
+                    state['settled'] = False
+                _stop(page)
+                return state
+            # Let playwright handle events while requests are in progress
+            page.wait_for_timeout(50)
+    except Error as e:
+        # The page was navigated by the interaction
+        logging.getLogger('Interaction').debug(f'Interaction state is lost: {e}')
+        return None
+
+
+def _stop(page) -> None:
+    """ Remove the observers of the interaction from the page """
+    try:
+        page.evaluate(INTERACTION_STOP_JS)
+    except Error:
+        pass
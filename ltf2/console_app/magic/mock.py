@@ -1,9 +1,17 @@
+import heapq
 import json
 import logging
 import time
-from typing import Optional, Callable
+from collections import deque
+from itertools import count
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Tuple
 
-from playwright.sync_api import Page
+from playwright.sync_api import Error, Page
+
+
+# Types of values that can be compared by hash (i.e. indexed).
+# Everything else (e.g. comparators) is evaluated by `match_dicts`
+INDEXED_TYPES = (str, int, float, bool)
 
 
 def match_dicts(first: dict, second: dict) -> bool:
@@ -21,15 +29,175 @@ def match_dicts(first: dict, second: dict) -> bool:
     return True
 
 
+def exact_values(match: dict, path: tuple = ()) -> Iterator[Tuple[tuple, Any]]:
+    """ Yield (path, value) pairs of the plain values (not comparators) of the match dict """
+    for key, val in match.items():
+        if isinstance(val, dict):
+            yield from exact_values(val, path + (key,))
+        elif type(val) in INDEXED_TYPES:
+            yield path + (key,), val
+
+
+def get_by_path(data: dict, path: tuple) -> Any:
+    """ Get value from nested dicts by path of keys """
+    for key in path:
+        data = data[key]
+    return data
+
+
+class Schedule(NamedTuple):
+    """ Compiled mock schedule """
+    seq: int
+    match: dict
+    response: dict
+    delay: Optional[float]
+    # Dispatch key: path of keys in request and value expected by this path
+    key: Optional[tuple]
+    value: Any
+    # Top-level keys of the request required by the match dict
+    required: frozenset
+
+
+class ScheduleIndex:
+    """ Schedules compiled into the dispatch index
+
+    Every schedule is put into the bucket by its dispatch key: `operationName` if it
+    is specified in the match dict as a plain value, otherwise the first plain value
+    found in the match dict (e.g. `variables.path`). Schedules that contain only
+    comparators are put into the wildcard bucket.
+
+    For the request only schedules from the matched buckets and the wildcard bucket
+    are evaluated with `match_dicts`. The latest added schedule has priority.
+    """
+    def __init__(self):
+        self._seq = count()
+        # {path: {value: [Schedule, ...]}}
+        self._index = {}
+        self._wildcard = []
+
+    def add(self, match: dict, response: dict, delay: Optional[float] = None) -> Schedule:
+        values = dict(exact_values(match))
+        if ('operationName',) in values:
+            key = ('operationName',)
+        else:
+            key = min(values, key=len, default=None)
+        schedule = Schedule(seq=next(self._seq),
+                            match=match,
+                            response=response,
+                            delay=delay,
+                            key=key,
+                            value=values.get(key),
+                            required=frozenset(k for k, v in match.items()
+                                               if isinstance(v, dict)))
+        if key is None:
+            self._wildcard.append(schedule)
+        else:
+            self._index.setdefault(key, {}).setdefault(schedule.value, []).append(schedule)
+        return schedule
+
+    def clear(self) -> None:
+        self._index = {}
+        self._wildcard = []
+
+    def __iter__(self) -> Iterator[Schedule]:
+        """ Iterate over all schedules, the latest first """
+        buckets = [b for values in self._index.values() for b in values.values()]
+        return self._merge(buckets + [self._wildcard])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @staticmethod
+    def _merge(buckets: List[List[Schedule]]) -> Iterator[Schedule]:
+        return heapq.merge(*(reversed(b) for b in buckets), key=lambda s: -s.seq)
+
+    def candidates(self, request: Any) -> Iterator[Schedule]:
+        """ Schedules that may match the request, the latest first """
+        if not isinstance(request, dict):
+            return self._merge([self._wildcard])
+        buckets = [self._wildcard]
+        for path, values in self._index.items():
+            try:
+                bucket = values.get(get_by_path(request, path))
+            except (KeyError, TypeError):
+                # No such path in request or value is not hashable
+                continue
+            if bucket:
+                buckets.append(bucket)
+        return self._merge(buckets)
+
+    def match(self, request: Any) -> Optional[Schedule]:
+        """ Find the latest added schedule that matches the request """
+        keys = request.keys() if isinstance(request, dict) else ()
+        for schedule in self.candidates(request):
+            if not schedule.required.issubset(keys):
+                continue
+            try:
+                if match_dicts(schedule.match, request):
+                    return schedule
+            except (KeyError, TypeError, AttributeError):
+                # Request has different structure
+                continue
+        return None
+
+
+class MatchStats:
+    """ Time spent on matching requests with schedules """
+    def __init__(self, maxlen: int = 1000):
+        self.count = 0
+        self.matched = 0
+        self.total = 0.0
+        self.max = 0.0
+        # Duration of the latest requests (sec)
+        self.durations = deque(maxlen=maxlen)
+
+    def add(self, duration: float, matched: bool) -> None:
+        self.count += 1
+        self.matched += matched
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.durations.append(duration)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> dict:
+        return {'requests': self.count,
+                'matched': self.matched,
+                'total_ms': round(self.total * 1000, 3),
+                'mean_ms': round(self.mean * 1000, 3),
+                'max_ms': round(self.max * 1000, 3)}
+
+    def __repr__(self):
+        return f'MatchStats({self.summary()})'
+
+
 class GraphQLMock:
-    """ Class for mocking graphql requests """
-    def __init__(self, page: Page, delay: float = 0):
+    """ Class for mocking graphql requests
+
+    Args:
+        page: playwright Page instance
+        delay: default delay (sec) of the scheduled responses
+        blocking_delay: if True, delay response with `time.sleep` that blocks all
+            other requests and events of the page until the response is sent.
+            By default, the response is delayed with `page.wait_for_timeout`: route
+            handler is suspended and other requests are handled while it waits.
+    """
+    def __init__(self, page: Page, delay: float = 0, blocking_delay: bool = False):
         self.page = page
         self.delay = delay
-        self.schedules = []
+        self.blocking_delay = blocking_delay
+        self.index = ScheduleIndex()
+        self.stats = MatchStats()
         self.page.route("**/graphql", self.handle_route)
         self.log = logging.getLogger(self.__class__.__name__)
 
+    @property
+    def schedules(self) -> List[tuple]:
+        """ List of scheduled (match, response, delay), the latest first """
+        return [(s.match, s.response, s.delay) for s in self.index]
+
     def schedule(self,
                  match: dict = {},
                  status: int = 200,
@@ -40,6 +208,8 @@ class GraphQLMock:
         """ Schedule response on mock for specified request
 
         Support comparators.
+        `delay` (sec) overrides the default delay of the mock. Delayed response
+        does not block other requests of the page (see `blocking_delay`).
 
         Example:
             from ltf2.util import comparators as cmp
@@ -52,20 +222,41 @@ class GraphQLMock:
         response = dict(status=status,
                         headers=headers,
                         body=json.dumps(body_json) if body_json else body)
-        self.schedules.insert(0, (match, response, delay))
+        self.index.add(match, response, delay)
 
     def handle_route(self, route: Callable):
         """ Handle all requests on /graphql """
-        self.log.debug(f'>> {route.request.post_data_json}')
-        for expected_request, response, delay in self.schedules:
-            if match_dicts(expected_request, route.request.post_data_json):
-                self.log.debug(f'<< Scheduled response: {response}')
-                time.sleep(self.delay if delay is None else delay)
-                route.fulfill(**response)
-                break
-        else:
-            route.continue_()
+        request_json = route.request.post_data_json
+        self.log.debug('>> %s', request_json)
+        start = time.perf_counter()
+        schedule = self.index.match(request_json)
+        duration = time.perf_counter() - start
+        self.stats.add(duration, schedule is not None)
+        self.log.debug('Matching took %.3f ms', duration * 1000)
+        if schedule is None:
+            # Next route handler (e.g. `ConsoleRecorder`) or the network
+            route.fallback()
+            return
+        self.log.debug('<< Scheduled response: %s', schedule.response)
+        delay = self.delay if schedule.delay is None else schedule.delay
+        if delay and self.blocking_delay:
+            time.sleep(delay)
+        elif delay:
+            # Every event handler is run in its own greenlet by sync playwright API,
+            # so waiting via playwright lets the dispatcher handle other requests
+            try:
+                self.page.wait_for_timeout(delay * 1000)
+            except Error as e:
+                # Page was closed while waiting
+                self.log.debug('Scheduled response was not sent: %s', e)
+                return
+        route.fulfill(**schedule.response)
 
     def clear(self):
         """ Clear all schedules """
-        self.schedules = []
+        self.index.clear()
+
+    def detach(self):
+        """ Clear all schedules and stop handling requests of the page """
+        self.index.clear()
+        self.page.unroute("**/graphql", self.handle_route)
@@ -1,32 +1,166 @@
+import heapq
 import logging
 import time
-from collections import namedtuple, UserList
+from collections import deque, namedtuple
+from contextlib import contextmanager
+from itertools import count, islice
+from operator import itemgetter
+from typing import Callable, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
 
+from ltf2.console_app.magic.constants import (HISTORY_MAX_SIZE, PAGE_TIMEOUT,
+                                              SOFT_NAVIGATION_TIMEOUT)
 from ltf2.console_app.magic.elements import PageElement
+from ltf2.console_app.magic.interaction import measure_interaction
 from ltf2.console_app.magic.mock import GraphQLMock
+from ltf2.console_app.magic.web_vitals import HARD, SOFT, get_web_vitals_collector
 
-from playwright.sync_api import Page
+from playwright.sync_api import Error, Locator, Page, Request, Response, TimeoutError
 
 
 RespItem = namedtuple('RespItem', ['ts', 'url', 'status'])
+ReqItem = namedtuple('ReqItem', ['ts', 'url', 'method'])
+
+# Resolves when there are no DOM mutations for `quiet` ms (true)
+# or when `timeout` ms is passed (false)
+DOM_QUIET_JS = """([quiet, timeout]) => new Promise(resolve => {
+    let quietTimer;
+    const finish = (result) => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(timeoutTimer);
+        resolve(result);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(true), quiet);
+    });
+    observer.observe(document.documentElement,
+                     {subtree: true, childList: true, attributes: true, characterData: true});
+    quietTimer = setTimeout(() => finish(true), quiet);
+    const timeoutTimer = setTimeout(() => finish(false), timeout);
+})"""
+
+# Navigate with the router of Next.js app without loading the page.
+# Returns false if the router is not available
+SOFT_NAVIGATE_JS = """url => {
+    const router = window.next && window.next.router;
+    if (!router || typeof router.push !== 'function') {
+        return false;
+    }
+    router.push(url);
+    return true;
+}"""
+
+# Types of the History filter values that are looked up in the index directly,
+# other values (comparators) are compared with every indexed key
+PLAIN_TYPES = (str, int, float, bool, bytes)
+
+# Requests that are tracked to detect that the page is settled
+TRACKED_RESOURCE_TYPES = ('fetch', 'xhr')
 
 
 def current_time():
     return int(time.time() * 1000)
 
 
-class History(UserList):
+class History:
     """Class for storing history info.
 
-    Uses for simple filtering and searching through elements.
+    Keeps only the latest `maxlen` items and indexes them by `indexed` fields,
+    so filtering by these fields checks every distinct value only once instead
+    of every item. Uses for simple filtering and searching through elements.
 
     Example:
         ...
         from ltf2.utils.comparators import contains
         items = history.get(url=contains('login'))
+        # Responses with 500 status received during the last 5 seconds
+        items = history.get(status=500, since=current_time() - 5000)
     """
-    def get(self, **kwargs):
-        return [h for h in self if h == kwargs]
+    def __init__(self, maxlen: Optional[int] = HISTORY_MAX_SIZE,
+                 indexed: Tuple[str, ...] = ('url', 'status')):
+        self.items = deque(maxlen=maxlen)
+        self.indexed = indexed
+        # {field: {value: deque([(seq, item), ...])}}
+        self._index = {field: {} for field in indexed}
+        self._seq = count()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index: int):
+        return self.items[index]
+
+    def append(self, item) -> None:
+        if len(self.items) == self.items.maxlen:
+            self._drop_oldest()
+        self.items.append(item)
+        seq = next(self._seq)
+        for field, index in self._index.items():
+            index.setdefault(getattr(item, field), deque()).append((seq, item))
+
+    def _drop_oldest(self) -> None:
+        item = self.items[0]
+        # The oldest item is also the oldest one in its index buckets
+        for field, index in self._index.items():
+            key = getattr(item, field)
+            index[key].popleft()
+            if not index[key]:
+                del index[key]
+
+    def clear(self) -> None:
+        self.items.clear()
+        self._index = {field: {} for field in self.indexed}
+
+    def _bisect(self, ts: int) -> int:
+        """ Index of the first item with `item.ts >= ts` """
+        low, high = 0, len(self.items)
+        while low < high:
+            middle = (low + high) // 2
+            if self.items[middle].ts < ts:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def window(self, since: Optional[int] = None, until: Optional[int] = None) -> list:
+        """ Items with timestamp (ms) in [since, until] range """
+        start = 0 if since is None else self._bisect(since)
+        end = len(self.items) if until is None else self._bisect(until + 1)
+        return list(islice(self.items, start, end))
+
+    def get(self, since: Optional[int] = None, until: Optional[int] = None, **kwargs) -> list:
+        """ Filter items by fields values (comparators are supported) and time window """
+        buckets = None
+        for field in self.indexed:
+            if field not in kwargs:
+                continue
+            expected = kwargs[field]
+            index = self._index[field]
+            if type(expected) in PLAIN_TYPES:
+                # Plain value: direct lookup instead of comparing with every key
+                matched = [index[expected]] if expected in index else []
+            else:
+                matched = [b for key, b in index.items() if expected == key]
+            if buckets is None or sum(map(len, matched)) < sum(map(len, buckets)):
+                buckets, used_field = matched, field
+        if buckets is None:
+            items = self.window(since, until)
+        else:
+            # Items in the buckets are already matched by the used field
+            kwargs = {k: v for k, v in kwargs.items() if k != used_field}
+            items = [h for _, h in heapq.merge(*buckets, key=itemgetter(0))
+                     if (since is None or h.ts >= since) and (until is None or h.ts <= until)]
+        return [h for h in items if all(v == getattr(h, k) for k, v in kwargs.items())]
+
+
+def is_present(element: Union[PageElement, Locator]) -> bool:
+    """ Whether the element (or playwright locator) is visible right now """
+    return getattr(element, '_locator', element).first.is_visible()
 
 
 class BasePage:
@@ -38,13 +172,41 @@ class BasePage:
         self.page = page
         self.url = url
         self.mock = GraphQLMock(page)
-        self.request_history = History()
+        self.request_history = History(indexed=('url', 'method'))
         self.response_history = History()
-        self.page.on('response',
-                     lambda res: self.response_history.append(
-                         RespItem(current_time(), res.url, res.status)))
+        # fetch/xhr requests that are not finished yet
+        self.inflight_requests = set()
+        self._listeners = [
+            ('request', lambda req: self.request_history.append(
+                ReqItem(current_time(), req.url, req.method))),
+            ('response', lambda res: self.response_history.append(
+                RespItem(current_time(), res.url, res.status))),
+            ('request', self._on_request_started),
+            ('requestfinished', lambda req: self.inflight_requests.discard(req)),
+            ('requestfailed', lambda req: self.inflight_requests.discard(req)),
+        ]
+        for event, handler in self._listeners:
+            self.page.on(event, handler)
         self.log = logging.getLogger(self.__class__.__name__)
 
+    def detach(self) -> None:
+        """ Detach the page object from playwright page
+
+        Remove event listeners and GraphQL mock of this object and clear
+        its history, so the playwright page can be reused by another page object
+        (see `ContextPool`).
+        """
+        vitals = get_web_vitals_collector()
+        if vitals.enabled:
+            vitals.leave(self)
+        for event, handler in self._listeners:
+            self.page.remove_listener(event, handler)
+        self._listeners = []
+        self.mock.detach()
+        self.request_history.clear()
+        self.response_history.clear()
+        self.inflight_requests.clear()
+
     def __getattr__(self, attr):
         if hasattr(self.page, attr):
             return getattr(self.page, attr)
@@ -57,14 +219,167 @@ class BasePage:
         return element_type(self.page, locator)
 
     def goto(self, url=None, **kwargs):
-        self.log.info(f'Navigating to page: {url or self.url}')
+        url = self.url if url is None else url
+        self.log.info(f'Navigating to page: {url}')
         timeout = kwargs.pop('timeout', 30) * 1000
-        self.page.goto(self.url if url is None else url, timeout=timeout, **kwargs)
+        vitals = get_web_vitals_collector()
+        if vitals.enabled:
+            vitals.leave(self)
+        start = time.perf_counter()
+        self.page.goto(url, timeout=timeout, **kwargs)
+        if vitals.enabled:
+            vitals.enter(self, url, HARD, time.perf_counter() - start)
+
+    def soft_goto(self, url=None, **kwargs):
+        """ Navigate inside of the already loaded console app
+
+        The app router is used instead of loading the page, so the app is not
+        reloaded. Fall back to `goto` if the app is not loaded in the page
+        (another origin, blank page) or the router did not open the url.
+        """
+        url = self.url if url is None else url
+        target, current = urlsplit(url), urlsplit(self.page.url)
+        if (target.scheme, target.netloc) == (current.scheme, current.netloc):
+            self.log.info(f'Soft navigating to page: {url}')
+            path = target.path.rstrip('/')
+            vitals = get_web_vitals_collector()
+            since = vitals.leave(self) if vitals.enabled else 0
+            start = time.perf_counter()
+            try:
+                if self.page.evaluate(SOFT_NAVIGATE_JS, urlunsplit(('', '') + target[2:])):
+                    self.page.wait_for_url(lambda u: urlsplit(u).path.rstrip('/') == path,
+                                           timeout=SOFT_NAVIGATION_TIMEOUT)
+                    if vitals.enabled:
+                        vitals.enter(self, url, SOFT, time.perf_counter() - start, since)
+                    return
+            except Error as e:
+                self.log.debug(f'Soft navigation failed: {e}')
+        self.goto(url, **kwargs)
+
+    def _on_request_started(self, request: Request) -> None:
+        if request.resource_type in TRACKED_RESOURCE_TYPES:
+            self.inflight_requests.add(request)
+
+    @staticmethod
+    def graphql_predicate(operation: str) -> Callable[[Response], bool]:
+        """ Predicate for the response of GraphQL request with `operationName` """
+        def is_operation(response: Response) -> bool:
+            if '/graphql' not in response.url:
+                return False
+            try:
+                data = response.request.post_data_json
+            except ValueError:
+                return False
+            return isinstance(data, dict) and data.get('operationName') == operation
+        return is_operation
+
+    def expect_call(self, graphql: Optional[str] = None, url: Optional[str] = None,
+                    timeout: float = PAGE_TIMEOUT):
+        """ Wait for the response of the named network call made in the block
+
+        Args:
+            graphql: GraphQL operationName
+            url: url glob pattern (e.g. BFF path from magic/constants.py)
+
+        Example:
+            with page.expect_call(url=TRAFFIC_ROUTES) as response_info:
+                page.select_by_name(name='p95').click()
+            assert response_info.value.status == 200
+        """
+        if (graphql is None) == (url is None):
+            raise ValueError('Either `graphql` or `url` should be specified')
+        return self.page.expect_response(url if graphql is None else self.graphql_predicate(graphql),
+                                         timeout=timeout)
+
+    def wait_for_dom_settle(self, quiet: int = 300, timeout: float = PAGE_TIMEOUT) -> None:
+        """ Wait until there are no DOM mutations for `quiet` ms """
+        try:
+            settled = self.page.evaluate(DOM_QUIET_JS, [quiet, timeout])
+        except Error as e:
+            if 'Execution context was destroyed' not in str(e):
+                raise
+            # Page was navigated while waiting, wait on the new document
+            self.page.wait_for_load_state(timeout=timeout)
+            settled = self.page.evaluate(DOM_QUIET_JS, [quiet, timeout])
+        if not settled:
+            raise TimeoutError(f'DOM was not settled in {timeout} ms')
+
+    def wait_for_settle(self, quiet: int = 300, timeout: float = PAGE_TIMEOUT) -> None:
+        """ Wait until the page is settled: no fetch/xhr requests in progress
+        and no DOM mutations for `quiet` ms.
+
+        Used instead of fixed `wait_for_timeout` after actions that update the page.
+        """
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining = max((deadline - time.monotonic()) * 1000, 0)
+            self.wait_for_dom_settle(quiet, remaining)
+            if not self.inflight_requests:
+                return
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f'Page was not settled in {timeout} ms: '
+                                   f'{[r.url for r in self.inflight_requests]}')
+            # Let playwright handle events while requests are in progress
+            self.page.wait_for_timeout(50)
+
+    def probe(self, element: Union[PageElement, Locator],
+              ready: Union[PageElement, Locator, Sequence[Union[PageElement, Locator]], None] = None,
+              timeout: float = PAGE_TIMEOUT) -> bool:
+        """ Whether the optional element is present
+
+        No fixed timeout is spent to prove the absence of the element: the page is
+        waited for a ready state and the element is checked instantly. The ready
+        state is the element itself or any of `ready` elements (rendered together
+        with or instead of the optional one) being visible. Without `ready` the
+        page is waited to settle (see `wait_for_settle`).
+
+        Example:
+            # MFA step or the console is shown after login
+            if page.probe(page.skip_this_step, ready=page.settings):
+                page.skip_this_step.click()
+        """
+        if ready is None:
+            self.wait_for_settle(timeout=timeout)
+        else:
+            ready = list(ready) if isinstance(ready, (list, tuple)) else [ready]
+            self.wait_for_any(element, *ready, timeout=timeout)
+        return is_present(element)
+
+    def wait_for_any(self, *elements: Union[PageElement, Locator],
+                     timeout: float = PAGE_TIMEOUT) -> Optional[Union[PageElement, Locator]]:
+        """ Wait until any of the elements is visible and return the first visible one """
+        locators = [getattr(e, '_locator', e) for e in elements]
+        locator = locators[0]
+        for other in locators[1:]:
+            locator = locator.or_(other)
+        locator.first.wait_for(timeout=timeout)
+        return next((e for e in elements if is_present(e)), None)
+
+    @contextmanager
+    def settle(self, graphql: Optional[str] = None, url: Optional[str] = None,
+               quiet: int = 300, timeout: float = PAGE_TIMEOUT):
+        """ Wait for the page to settle after actions in the block
+
+        If `graphql` (operationName) or `url` (glob) is specified, wait for
+        the response of that call made in the block first.
+
+        Example:
+            with page.settle(url=TRAFFIC_ROUTES):
+                page.select_by_name(name='p95').click()
+        """
+        if graphql is None and url is None:
+            yield
+        else:
+            with self.expect_call(graphql, url, timeout):
+                yield
+        self.wait_for_settle(quiet, timeout)
 
     def deploy_changes(self):
-        self.deploy_changes_button.last.click()
-        self.wait_for_timeout(timeout=1000)
-        self.deploy_changes_button.last.click()
+        # Confirmation dialog is opened when the page is settled
+        measure_interaction(self.deploy_changes_button.last, name='deploy changes')
+        # The success message is transient: wait only for the paint before looking for it
+        measure_interaction(self.deploy_changes_button.last, name='confirm deploy changes',
+                            settle=False)
         # wait for success message
         message = self.client_snackbar.get_by_text(
             'Changes deployed successfully')
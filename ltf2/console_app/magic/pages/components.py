@@ -5,723 +5,607 @@ import time
 from itertools import product
 
 from playwright._impl import _errors
-from playwright.sync_api import Page, expect
+from playwright.sync_api import expect
 
 from ltf2.console_app.magic.constants import ACCESS_CONTROL_TYPE, HTTP_METHODS
-from ltf2.console_app.magic.elements import PageElement, UlElement, MembersTableElement, \
+from ltf2.console_app.magic.elements import UlElement, MembersTableElement, \
     TableElement, ListElement, DynamicPageElement, DynamicSelectElement, IframeElement, \
-    CreatedRuleElement, DynamicRateConditions, DynamicIndexElement
+    CreatedRuleElement, DynamicRateConditions, DynamicIndexElement, LazyElement, \
+    set_lazy_element
 
 
 class LoginMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.username = PageElement(self.page, "//input[@id='username']")
-        self.password = PageElement(self.page, "//input[@id='password']")
-        self.next_button = PageElement(self.page, "//button[text()='Next']")
-        self.submit = PageElement(self.page, "//button[@type='submit']")
-        self.error_message = PageElement(self.page, "//p[contains(@class, 'Mui-error')]")
-        self.invalid_email_or_password_message = PageElement(
-            self.page,
-            '//*[contains(@class, "Login-errorWhite")]/*[text()]')
-        self.skip_this_step = PageElement(self.page,
-                                          "//label[text()='Skip This Step']")
-        self.reset_pasword = PageElement(self.page,
-                                         "//form[@class='change-password-form']")
+    username = LazyElement("//input[@id='username']")
+    password = LazyElement("//input[@id='password']")
+    next_button = LazyElement("//button[text()='Next']")
+    submit = LazyElement("//button[@type='submit']")
+    error_message = LazyElement("//p[contains(@class, 'Mui-error')]")
+    invalid_email_or_password_message = LazyElement(
+        '//*[contains(@class, "Login-errorWhite")]/*[text()]')
+    skip_this_step = LazyElement("//label[text()='Skip This Step']")
+    reset_pasword = LazyElement("//form[@class='change-password-form']")
 
 
 class CommonMixin:
     """ Shared elements """
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        # General
-        self.input_name = PageElement(self.page, "//input[@id='name']")
-        self.client_snackbar = PageElement(self.page, "//*[@id='notistack-snackbar']")
-        self.apply = PageElement(self.page, "//button[text()='Apply']")
-        self.save = PageElement(self.page, "//button[text()='Save']")
-        self.create = PageElement(self.page, "//button[text()='Create']")
-        self.close = PageElement(self.page, "//button[text()='Close']").nth(1)
-        self.cancel_button = PageElement(self.page, "//*[text()='Cancel']")
-        self.select = UlElement(self.page, "//ul[@role='listbox']")
-        self.redeploy_button = PageElement(self.page, "//button[@data-qa='redeploy-btn']")
-        self.select_by_name = DynamicSelectElement(
-            self.page, "//ul[@role='listbox']/li[text()='{name}']")
-        self.select_by_name_extra_level = DynamicPageElement(self.page, "//ul[@role='listbox']//li[text()='{name}']")
-        self.table = TableElement(self.page, "//table")
-        self.submit_button = PageElement(self.page, "//button[text()='Submit']")
-        self.delete_button = PageElement(self.page, "//button[text()='Delete']")
-        self.confirm_button = PageElement(self.page, "//button[text()='Confirm']")
-        self.revert_button = PageElement(self.page, "//button[text()='Revert']")
-        self.revert_confirm_button = PageElement(self.page, "//button[text()='Revert Changes']")
-        self.delete_button_list = ListElement(self.page,"//button[@data-qa='delete-button']")
-        self.deploy_changes_button = PageElement(self.page, "//button[text()='Deploy Changes']")
-        self.create_org_button = PageElement(self.page, "//*[text()='Create an Organization']")
-
-        self.docs = PageElement(self.page, "//li[text()='Docs']")
-        self.forums = PageElement(self.page, "//li[text()='Forums']")
-        self.status = PageElement(self.page, "//li[text()='Status']")
-        self.support = PageElement(self.page, "//li[text()='Support']")
-
-        self.overview = PageElement(self.page, "//*[text()='Overview']")
-        self.activity = PageElement(self.page, "//*[text()='Activity']")
-        self.members = PageElement(self.page, "//*[text()='Members']")
-        self.settings = PageElement(self.page, "//*[text()='Settings']")
-        self.security = PageElement(self.page, "//div/span[text()='Security']")
-        self.attack_surfaces = PageElement(self.page, "//div/span[text()='Attack Surfaces']")
-
-        # Create organization dialog
-        self.button_create_org_dialog = PageElement(
-            self.page,
-            '//button[text()="Create an Organization"]')
-
-        self.org_switcher_button = PageElement(self.page, "//button[@id='organization-switcher']")
-        self.org_switcher_list = UlElement(self.page, "//ul[@role='menu']")
-        self.property_switcher_button = PageElement(self.page, "//button[@id='property-switcher']")
-        self.delete_org_checkbox = PageElement(
-            self.page,
-            "//*[text()='Confirm that I want to delete this organization.']/../..//input[@type='checkbox']")
-        self.delete_property_checkbox = DynamicPageElement(
-            self.page, "//*[text()='Confirm that I want to delete the property \"{property_name}\".']/../..//input[@type='checkbox']"
-        )
-        self.delete_org_button = PageElement(self.page, "//*[text()='Delete Organization']")
-        self.delete_property_button = PageElement(self.page, "//*[text()='Delete Property']")
-
-        self.visible_page_content = PageElement(self.page,
-                                                "//div[@id='__next' and not(@aria-hidden='true')]")
-        self.status_iframe = PageElement(self.page, "//iframe[@title='Layer0 Status']")
-        self.status_iframe_close_button = IframeElement(self.status_iframe,
-                                                        "//div[contains(@class, 'frame-close')]//button")
-        self.status_snackbar_close = PageElement(self.page, "//div[@id='notistack-snackbar']/..//button")
-        self.online_status = PageElement(self.page, "//i[text()='Deployed']")
+    # General
+    input_name = LazyElement("//input[@id='name']")
+    client_snackbar = LazyElement("//*[@id='notistack-snackbar']")
+    apply = LazyElement("//button[text()='Apply']")
+    save = LazyElement("//button[text()='Save']")
+    create = LazyElement("//button[text()='Create']")
+    close = LazyElement("//button[text()='Close']", nth=1)
+    cancel_button = LazyElement("//*[text()='Cancel']")
+    select = LazyElement("//ul[@role='listbox']", UlElement)
+    redeploy_button = LazyElement("//button[@data-qa='redeploy-btn']")
+    select_by_name = LazyElement("//ul[@role='listbox']/li[text()='{name}']", DynamicSelectElement)
+    select_by_name_extra_level = LazyElement(
+        "//ul[@role='listbox']//li[text()='{name}']", DynamicPageElement)
+    table = LazyElement("//table", TableElement)
+    submit_button = LazyElement("//button[text()='Submit']")
+    delete_button = LazyElement("//button[text()='Delete']")
+    confirm_button = LazyElement("//button[text()='Confirm']")
+    revert_button = LazyElement("//button[text()='Revert']")
+    revert_confirm_button = LazyElement("//button[text()='Revert Changes']")
+    delete_button_list = LazyElement("//button[@data-qa='delete-button']", ListElement)
+    deploy_changes_button = LazyElement("//button[text()='Deploy Changes']")
+    create_org_button = LazyElement("//*[text()='Create an Organization']")
+
+    docs = LazyElement("//li[text()='Docs']")
+    forums = LazyElement("//li[text()='Forums']")
+    status = LazyElement("//li[text()='Status']")
+    support = LazyElement("//li[text()='Support']")
+
+    overview = LazyElement("//*[text()='Overview']")
+    activity = LazyElement("//*[text()='Activity']")
+    members = LazyElement("//*[text()='Members']")
+    settings = LazyElement("//*[text()='Settings']")
+    security = LazyElement("//div/span[text()='Security']")
+    attack_surfaces = LazyElement("//div/span[text()='Attack Surfaces']")
+
+    # Create organization dialog
+    button_create_org_dialog = LazyElement('//button[text()="Create an Organization"]')
+
+    org_switcher_button = LazyElement("//button[@id='organization-switcher']")
+    org_switcher_list = LazyElement("//ul[@role='menu']", UlElement)
+    property_switcher_button = LazyElement("//button[@id='property-switcher']")
+    delete_org_checkbox = LazyElement(
+        "//*[text()='Confirm that I want to delete this organization.']/../..//input[@type='checkbox']")
+    delete_property_checkbox = LazyElement(
+        "//*[text()='Confirm that I want to delete the property \"{property_name}\".']/../..//input[@type='checkbox']",
+        DynamicPageElement)
+    delete_org_button = LazyElement("//*[text()='Delete Organization']")
+    delete_property_button = LazyElement("//*[text()='Delete Property']")
+
+    visible_page_content = LazyElement("//div[@id='__next' and not(@aria-hidden='true')]")
+    status_iframe = LazyElement("//iframe[@title='Layer0 Status']")
+    status_iframe_close_button = LazyElement(
+        "//div[contains(@class, 'frame-close')]//button", IframeElement, parent='status_iframe')
+    status_snackbar_close = LazyElement("//div[@id='notistack-snackbar']/..//button")
+    online_status = LazyElement("//i[text()='Deployed']")
+
+    def close_status_snackbar(self) -> bool:
+        """ Close the status banner if present, return True if it was closed """
+        try:
+            if not self.probe(self.status_snackbar_close):
+                return False
+        except _errors.TimeoutError as e:
+            # Page did not settle (e.g. polling requests), the banner is not checked
+            self.log.debug(f'Status banner was not probed: {e}')
+            return False
+        self.status_snackbar_close.click()
+        return True
 
 
 class OrgMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.add_member_button = PageElement(self.page, "//button[text()='Add Member']")
-        self.invite_member_button = PageElement(self.page,
-                                                "//button[text()='Invite']")
-        self.member_permission = DynamicPageElement(self.page, "//div/p[text()='{role}']")
-        self.email = PageElement(self.page, "//input[@id='email']")
-        self.plus_button = PageElement(self.page, "//button[@title='Add']")
-
-        self.members_table = MembersTableElement(self.page, "//table")
-        self.selected_org = DynamicPageElement(self.page,
-                                               "//header//p[text()='{name}']")
-        # Create property
-        self.new_property_button = PageElement(self.page, "//*[text()='New Property']")
-        self.origin_hostname_input = PageElement(
-            self.page, "//input[@name='origins.0.hosts.0.hostname']")
-        self.create_property_button = PageElement(self.page,
-                                                  "//*[text()='Create Property']")
+    add_member_button = LazyElement("//button[text()='Add Member']")
+    invite_member_button = LazyElement("//button[text()='Invite']")
+    member_permission = LazyElement("//div/p[text()='{role}']", DynamicPageElement)
+    email = LazyElement("//input[@id='email']")
+    plus_button = LazyElement("//button[@title='Add']")
+
+    members_table = LazyElement("//table", MembersTableElement)
+    selected_org = LazyElement("//header//p[text()='{name}']", DynamicPageElement)
+    # Create property
+    new_property_button = LazyElement("//*[text()='New Property']")
+    origin_hostname_input = LazyElement("//input[@name='origins.0.hosts.0.hostname']")
+    create_property_button = LazyElement("//*[text()='Create Property']")
 
 
 class EnvironmentMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.environments = PageElement(self.page, "//*[text()='Environments']")
-        self.new_environment_button = PageElement(self.page,
-                                                  "//*[text()='New Environment']")
-        self.configuration = PageElement(self.page, "//*[text()='Configuration']")
-        self.hostnames = PageElement(self.page, "//*[text()='Hostnames']")
-        self.origins = PageElement(self.page, "//*[text()='Origins']")
-        self.rules = PageElement(self.page, "//*[text()='Rules']")
-
-        self.environment = DynamicPageElement(self.page, "//a/div[@role='button' and text()='{name}']")
-        self.revert_button = PageElement(self.page, "//button[text()='Revert']")
-        self.revert_changes_button = PageElement(self.page,
-                                                 "//button[text()='Revert Changes']")
-        # ======== Rules =========
-        self.add_rule = PageElement(self.page, "//button[text()='Add Router Rule']")
-        self.add_element = PageElement(self.page, "//button[text()='Add']")
-        self.select_rule_element = DynamicSelectElement(
-            self.page,
-            "//div[not(@aria-hidden='true')]/div/ul[@role='menu']/*[@role='menuitem' and text()='{name}']")
-        self.delete_rule_list = ListElement(self.page,
-                                            "//button[@data-qa='delete-button']")
-        self.condition_operator_list = ListElement(
-            self.page, "//div[contains(@class, 'MuiCollapse-entered')]//div[@role='button']")
-        self.select_operator_name = DynamicSelectElement(
-            self.page,
-            "//div[@role='presentation' and not(@aria-hidden='true')]/div/ul[@role='menu']/li[text()='{name}']")
-        self.delete_rule_button = PageElement(self.page, "//button[text()='Delete Router Rule']")
-        self.add_feature_button = PageElement(
-            self.page, "//button[@type='submit' and text()='Add Feature']")
-        self.deploy_changes = PageElement(self.page, "//button[text()='Deploy Changes']")
-        self.variable_input = PageElement(self.page,
-                                          "//label[text()='Variable']/../div/input")
-        self.variable_select = DynamicPageElement(
-            self.page, "//div[text()='All Variables']/../ul/li//p[text()='{name}']")
-        self.operator_input = PageElement(self.page,
-                                          "//label[text()='Operator']/../div/input")
-        self.rule_checkbox = PageElement(self.page, "//label//input[@type='checkbox']")
-        self.code_input = PageElement(self.page, "//input[@name='feature.value.code']")
-        self.name_input = PageElement(
-            self.page, "//label[contains(text(), 'Name')]/..//div[@role='textbox']")
-        self.value_div = PageElement(
-            self.page, "//label[contains(text(), 'Value')]/..//div[@role='textbox']")
-        self.match_value_input = PageElement(
-            self.page, "//label[contains(text(), 'Value')]/../div/input")
-        self.match_tags_inputs = PageElement(
-            self.page, "//label[contains(text(), 'Value')]/../div")
-        self.match_compress_content_type_inputs = PageElement(
-            self.page, "//label[contains(text(), 'Compress Content Type')]/../div")
-        self.match_value_regex = PageElement(
-            self.page, "//label[contains(text(), 'Match Value')]/..//div[@role='textbox']")
-        self.values_list = PageElement(
-            self.page, "//label[contains(text(), 'Value(s')]/../div")
-        self.add_condition_button = PageElement(
-            self.page, "//button[@type='submit' and text()='Add Condition']")
-        self.feature_input = PageElement(self.page,
-                                         "//input[@placeholder='Search Features...']")
-        self.feature_select = DynamicSelectElement(
-            self.page,
-            "//ul[@role='listbox']/li/div[text()='{type}']/../ul/li[text()='{name}']")
-        self.header_name = PageElement(
-            self.page,
-            "//label[contains(text(), 'Header Name')]/..//div[@role='textbox']")
-        self.response_headers = PageElement(
-            self.page, "//input[@name='remove_response_headers']")
-        self.origin_response_headers = PageElement(
-            self.page, "//label[text()='Response Headers']/../div/input")
-        self.match_style_input = PageElement(
-            self.page, "//input[@name='feature.value.0.syntax']")
-        self.source_input = PageElement(
-            self.page, "//label[contains(text(), 'Source')]/..//div[@role='textbox']")
-        self.destination_input = PageElement(
-            self.page, "//label[contains(text(), 'Destination')]/..//div[@role='textbox']")
-        self.variable_name = PageElement(
-            self.page, "//label[text()='Name']/..//div[@role='textbox']")
-        self.variable_value = PageElement(
-            self.page, "//label[text()='Value']/..//div[@role='textbox']")
-        self.number_input = PageElement(self.page,
-                                        "//input[@name='condition.ruleVariable.value']")
-        self.response_headers = PageElement(
-            self.page,
-            "//label[text()='Response Headers']/../div/input")
-        self.parameter_name = PageElement(self.page,
-                                          "//label[text()='Parameter Name']/..//div[@role='textbox']")
-        self.custom_log_field = PageElement(
-            self.page, "//label[text()='Custom Log Field']/../div/input")
-        self.response_body = PageElement(
-            self.page, "//label[text()='Response Body']/..//textarea")
-        self.kbytes_per_second = PageElement(
-            self.page, "//input[@name='feature.value.kbytes_per_sec']")
-        self.prebuf_seconds = PageElement(
-            self.page, "//input[@name='feature.value.prebuf_seconds']")
-        self.header_treatment_input = PageElement(
-            self.page, "//label[text()='Cache Control Header Treatment']/../div/input")
-        self.cache_key_option_input = PageElement(self.page, "//input[@name='cache-key']")
-        self.headers_input = PageElement(self.page, "//input[@name='headers']")
-        self.cookies_input = PageElement(self.page, "//input[@name='cookies']")
-        self.add_expression_button = PageElement(self.page,
-                                                 "//button[text()='Add an Expression']")
-        self.expression_input = PageElement(self.page, "//div[@role='textbox']/div")
-        self.option_input = PageElement(self.page, "//input[@name='cache-key-query-string']")
-        self.include_input = PageElement(self.page, "//input[@name='include']")
-        self.exclude_input = PageElement(self.page, "//input[@name='exclude']")
-        self.cacheable_request_body_size = PageElement(
-            self.page, "//label[text()='Cacheable Request Body Size']/../div/input")
-        self.compress_content_types_input = PageElement(
-            self.page, "//label[text()='Compress Content Types']/../div/input")
-        self.post_input = PageElement(self.page, "//label[text()='POST']/..//input")
-        self.put_input = PageElement(self.page, "//label[text()='PUT']/..//input")
-        self.h264_support_input = PageElement(
-            self.page,
-            "//label[text()='Enable H264 encoding']/../div/input")
-        self.expires_header_treatment_input = PageElement(
-            self.page, "//label[text()='Expires Header Treatment']/../div/input")
-        self.duration_value = PageElement(
-            self.page, "//input[@name='feature.value' and @type='number']")
-        self.duration_unit = PageElement(self.page,
-                                         "//input[@name='feature.value' and @type='text']")
-        self.response_status_code = PageElement(
-            self.page, "//input[@name='feature.value.0.key']")
-        self.max_age_value = PageElement(self.page,
-                                         "//input[@name='feature.value.0.value' and @type='number']")
-        self.max_age_unit = PageElement(self.page,
-                                        "//input[@name='feature.value.0.value' and @type='text']")
-        self.service_worker_max_age_value = PageElement(
-            self.page, "//input[@name='feature.value' and @type='number']")
-        self.service_worker_max_age_unit = PageElement(
-            self.page, "//input[@name='feature.value' and @type='text']")
-        self.ignore_origin_no_cache = PageElement(self.page,
-                "//label[text()='Ignore no-cache headers when the origin returns one of these status codes:']/../div/input")
-        self.cacheable_status_codes = PageElement(
-            self.page, "//label[text()='Cacheable Status Codes']/../div/input")
-        self.feature_value_input = PageElement(
-            self.page, "//input[@name='feature.value']")
-        self.proxy_special_headers_input = PageElement(
-            self.page, "//label[text()='Proxy Special Headers']/../div/input")
-        self.set_origin_input = PageElement(self.page,
-                                            "//label[text()='Origin Name']/../div/input")
-        # AI Rules
-        self.add_rule_using_ai = PageElement(self.page,
-                                             "//button[text()='Add Router Rule Using AI...']")
-        self.add_rule_using_ai_input = PageElement(
-            self.page, "//input[@data-qa='add-rule-using-ai-text']")
-        self.generate_rule = PageElement(self.page, "//button[text()='Generate Rule']")
-        self.rules_list = ListElement(self.page, "//div[@data-rbd-droppable-id='droppable-rules']/div")
-        self.created_rule = CreatedRuleElement(
-            self.page,
-            "((//div[@data-qa='rule-conditions'])[{rule_num}]//div[@data-qa='rule-condition'])[{{num}}]",
-            "((//div[@data-qa='rule-features'])[{rule_num}]//div[@data-qa='rule-feature'])[{{num}}]")
-        self.single_condition = ListElement(self.page, "//div[@data-qa='rule-condition']")
-        self.rule_div = PageElement(self.page,
-                                    "//form/div/div/div[@data-rbd-draggable-context-id]")
-        self.nested_rule_add_element_button = DynamicPageElement(
-            self.page,
-            "((//div[@data-rbd-droppable-id='{id}']/div)[{num}]//button[text()='Add'])[last()]")
-        self.rule_add_element_button = DynamicIndexElement(
-            self.page,
-            "(//form/div/div/div[@data-rbd-draggable-id][{num}]//button[text()='Add'])[last()]")
-        self.ai_rule_generation_error = PageElement(self.page,
-                                                    "//form//p[contains(@class, 'MuiTypography-body1')]")
-        # ====== Cache =====
-
-        self.purge_the_cache = PageElement(self.page,
-                                           "//button[text()='Purge the Cache...']")
-        self.purge_cache = PageElement(self.page, "//button[text()='Purge Cache']")
-        self.purge = PageElement(self.page, "//button[text()='Purge']")
-        self.purge_all_entries = PageElement(self.page, "//input[@value='all_entries']")
-        self.purge_by_path = PageElement(self.page, "//input[@value='path']")
-        self.purge_by_key = PageElement(self.page, "//input[@value='surrogate_key']")
+    environments = LazyElement("//*[text()='Environments']")
+    new_environment_button = LazyElement("//*[text()='New Environment']")
+    configuration = LazyElement("//*[text()='Configuration']")
+    hostnames = LazyElement("//*[text()='Hostnames']")
+    origins = LazyElement("//*[text()='Origins']")
+    rules = LazyElement("//*[text()='Rules']")
+
+    environment = LazyElement("//a/div[@role='button' and text()='{name}']", DynamicPageElement)
+    revert_button = LazyElement("//button[text()='Revert']")
+    revert_changes_button = LazyElement("//button[text()='Revert Changes']")
+    # ======== Rules =========
+    add_rule = LazyElement("//button[text()='Add Router Rule']")
+    add_element = LazyElement("//button[text()='Add']")
+    select_rule_element = LazyElement(
+        "//div[not(@aria-hidden='true')]/div/ul[@role='menu']/*[@role='menuitem' and text()='{name}']",
+        DynamicSelectElement)
+    delete_rule_list = LazyElement("//button[@data-qa='delete-button']", ListElement)
+    condition_operator_list = LazyElement(
+        "//div[contains(@class, 'MuiCollapse-entered')]//div[@role='button']", ListElement)
+    select_operator_name = LazyElement(
+        "//div[@role='presentation' and not(@aria-hidden='true')]/div/ul[@role='menu']/li[text()='{name}']",
+        DynamicSelectElement)
+    delete_rule_button = LazyElement("//button[text()='Delete Router Rule']")
+    add_feature_button = LazyElement("//button[@type='submit' and text()='Add Feature']")
+    deploy_changes = LazyElement("//button[text()='Deploy Changes']")
+    variable_input = LazyElement("//label[text()='Variable']/../div/input")
+    variable_select = LazyElement(
+        "//div[text()='All Variables']/../ul/li//p[text()='{name}']", DynamicPageElement)
+    operator_input = LazyElement("//label[text()='Operator']/../div/input")
+    rule_checkbox = LazyElement("//label//input[@type='checkbox']")
+    code_input = LazyElement("//input[@name='feature.value.code']")
+    name_input = LazyElement("//label[contains(text(), 'Name')]/..//div[@role='textbox']")
+    value_div = LazyElement("//label[contains(text(), 'Value')]/..//div[@role='textbox']")
+    match_value_input = LazyElement("//label[contains(text(), 'Value')]/../div/input")
+    match_tags_inputs = LazyElement("//label[contains(text(), 'Value')]/../div")
+    match_compress_content_type_inputs = LazyElement(
+        "//label[contains(text(), 'Compress Content Type')]/../div")
+    match_value_regex = LazyElement(
+        "//label[contains(text(), 'Match Value')]/..//div[@role='textbox']")
+    values_list = LazyElement("//label[contains(text(), 'Value(s')]/../div")
+    add_condition_button = LazyElement("//button[@type='submit' and text()='Add Condition']")
+    feature_input = LazyElement("//input[@placeholder='Search Features...']")
+    feature_select = LazyElement(
+        "//ul[@role='listbox']/li/div[text()='{type}']/../ul/li[text()='{name}']",
+        DynamicSelectElement)
+    header_name = LazyElement("//label[contains(text(), 'Header Name')]/..//div[@role='textbox']")
+    response_headers = LazyElement("//input[@name='remove_response_headers']")
+    origin_response_headers = LazyElement("//label[text()='Response Headers']/../div/input")
+    match_style_input = LazyElement("//input[@name='feature.value.0.syntax']")
+    source_input = LazyElement("//label[contains(text(), 'Source')]/..//div[@role='textbox']")
+    destination_input = LazyElement(
+        "//label[contains(text(), 'Destination')]/..//div[@role='textbox']")
+    variable_name = LazyElement("//label[text()='Name']/..//div[@role='textbox']")
+    variable_value = LazyElement("//label[text()='Value']/..//div[@role='textbox']")
+    number_input = LazyElement("//input[@name='condition.ruleVariable.value']")
+    response_headers = LazyElement("//label[text()='Response Headers']/../div/input")
+    parameter_name = LazyElement("//label[text()='Parameter Name']/..//div[@role='textbox']")
+    custom_log_field = LazyElement("//label[text()='Custom Log Field']/../div/input")
+    response_body = LazyElement("//label[text()='Response Body']/..//textarea")
+    kbytes_per_second = LazyElement("//input[@name='feature.value.kbytes_per_sec']")
+    prebuf_seconds = LazyElement("//input[@name='feature.value.prebuf_seconds']")
+    header_treatment_input = LazyElement(
+        "//label[text()='Cache Control Header Treatment']/../div/input")
+    cache_key_option_input = LazyElement("//input[@name='cache-key']")
+    headers_input = LazyElement("//input[@name='headers']")
+    cookies_input = LazyElement("//input[@name='cookies']")
+    add_expression_button = LazyElement("//button[text()='Add an Expression']")
+    expression_input = LazyElement("//div[@role='textbox']/div")
+    option_input = LazyElement("//input[@name='cache-key-query-string']")
+    include_input = LazyElement("//input[@name='include']")
+    exclude_input = LazyElement("//input[@name='exclude']")
+    cacheable_request_body_size = LazyElement(
+        "//label[text()='Cacheable Request Body Size']/../div/input")
+    compress_content_types_input = LazyElement(
+        "//label[text()='Compress Content Types']/../div/input")
+    post_input = LazyElement("//label[text()='POST']/..//input")
+    put_input = LazyElement("//label[text()='PUT']/..//input")
+    h264_support_input = LazyElement("//label[text()='Enable H264 encoding']/../div/input")
+    expires_header_treatment_input = LazyElement(
+        "//label[text()='Expires Header Treatment']/../div/input")
+    duration_value = LazyElement("//input[@name='feature.value' and @type='number']")
+    duration_unit = LazyElement("//input[@name='feature.value' and @type='text']")
+    response_status_code = LazyElement("//input[@name='feature.value.0.key']")
+    max_age_value = LazyElement("//input[@name='feature.value.0.value' and @type='number']")
+    max_age_unit = LazyElement("//input[@name='feature.value.0.value' and @type='text']")
+    service_worker_max_age_value = LazyElement("//input[@name='feature.value' and @type='number']")
+    service_worker_max_age_unit = LazyElement("//input[@name='feature.value' and @type='text']")
+    ignore_origin_no_cache = LazyElement(
+        "//label[text()='Ignore no-cache headers when the origin returns one of these status codes:']/../div/input")
+    cacheable_status_codes = LazyElement("//label[text()='Cacheable Status Codes']/../div/input")
+    feature_value_input = LazyElement("//input[@name='feature.value']")
+    proxy_special_headers_input = LazyElement(
+        "//label[text()='Proxy Special Headers']/../div/input")
+    set_origin_input = LazyElement("//label[text()='Origin Name']/../div/input")
+    # AI Rules
+    add_rule_using_ai = LazyElement("//button[text()='Add Router Rule Using AI...']")
+    add_rule_using_ai_input = LazyElement("//input[@data-qa='add-rule-using-ai-text']")
+    generate_rule = LazyElement("//button[text()='Generate Rule']")
+    rules_list = LazyElement("//div[@data-rbd-droppable-id='droppable-rules']/div", ListElement)
+    created_rule = LazyElement(
+        "((//div[@data-qa='rule-conditions'])[{rule_num}]//div[@data-qa='rule-condition'])[{{num}}]",
+        "((//div[@data-qa='rule-features'])[{rule_num}]//div[@data-qa='rule-feature'])[{{num}}]",
+        CreatedRuleElement)
+    single_condition = LazyElement("//div[@data-qa='rule-condition']", ListElement)
+    rule_div = LazyElement("//form/div/div/div[@data-rbd-draggable-context-id]")
+    nested_rule_add_element_button = LazyElement(
+        "((//div[@data-rbd-droppable-id='{id}']/div)[{num}]//button[text()='Add'])[last()]",
+        DynamicPageElement)
+    rule_add_element_button = LazyElement(
+        "(//form/div/div/div[@data-rbd-draggable-id][{num}]//button[text()='Add'])[last()]",
+        DynamicIndexElement)
+    ai_rule_generation_error = LazyElement("//form//p[contains(@class, 'MuiTypography-body1')]")
+    # ====== Cache =====
+
+    purge_the_cache = LazyElement("//button[text()='Purge the Cache...']")
+    purge_cache = LazyElement("//button[text()='Purge Cache']")
+    purge = LazyElement("//button[text()='Purge']")
+    purge_all_entries = LazyElement("//input[@value='all_entries']")
+    purge_by_path = LazyElement("//input[@value='path']")
+    purge_by_key = LazyElement("//input[@value='surrogate_key']")
 
 
 class ActivityMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        # TODO
+    # TODO
+    pass
 
 
 class TrafficMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-
-        # Date Picker
-        self.date_picker = PageElement(self.page, "//div[@data-qa='date-range-picker']")
-        self.date_picker_today = PageElement(self.page, "//div[@data-qa='dp-range-TODAY']")
-        self.date_picker_last_24_hours = PageElement(self.page, "//div[@data-qa='dp-range-LAST_24_HOURS']")
-        self.date_picker_last_7_days = PageElement(self.page, "//div[@data-qa='dp-range-LAST_7_DAYS']")
-        self.date_picker_this_month = PageElement(self.page, "//div[@data-qa='dp-range-THIS_MONTH']")
-        self.date_picker_last_month = PageElement(self.page, "//div[@data-qa='dp-range-LAST_MONTH']")
-        self.date_picker_last_30_days = PageElement(self.page, "//div[@data-qa='dp-range-LAST_30_DAYS']")
-        self.date_picker_last_90_days = PageElement(self.page, "//div[@data-qa='dp-range-LAST_90_DAYS']")
-        self.date_picker_daily = PageElement(self.page, "//div[@data-qa='dp-range-DAY']")
-        self.date_picker_monthly = PageElement(self.page, "//div[@data-qa='dp-range-MONTH']")
-        self.date_picker_custom_date_range = PageElement(self.page, "//div[@data-qa='dp-range-CUSTOM_RANGE']")
-        self.date_picker_apply_button = PageElement(self.page, "//button[text()='Apply']")
-
-        # Traffic Overview elements
-        self.traffic_header = PageElement(self.page, "//h2[text()='Traffic']")
-        self.traffic_overview_tab_button = PageElement(self.page,
-            "//button[@role='tab']/..//*[text()='Overview']")
-        self.traffic_metric_selector = PageElement(self.page,
-            '//input[@data-qa="data-usage-metricsSelector"]')
-        self.traffic_requests_grid_summary = PageElement(self.page,
-            "//div[@data-qa='urls-chart']//*[contains(text(), 'Requests')]")
-        self.traffic_errors_grid_summary = PageElement(self.page,
-            '//div[@data-qa="errors-card"]//*[contains(text(), "Errors")]')
-        self.traffic_rules_grid_summary = PageElement(self.page,
-            '//main//span[text()="Rules"]')
-        self.traffic_rules_metric_selector = PageElement(self.page,
-            '//input[@data-qa="rules-metricsSelector"]')
-        self.traffic_rules_percentile_selector = PageElement(self.page,
-            '//input[@data-qa="rules-percentilesSelector"]')
-        self.traffic_origin_latency_over_time_summary = PageElement(self.page,
-            '//div[@data-qa="urls-chart"]//*[text()="Origin Latency Over Time"]')
-        self.show_request_count_button = PageElement(self.page,
-            '//div[@data-qa="rules-percentageToggle"]//button[@value="count"]')
-        self.show_as_percentage_of_total_requests_button = PageElement(self.page,
-            '//div[@data-qa="rules-percentageToggle"]//button[@value="percent"]')
-        self.chart_filter_button = ListElement(self.page, '//button[@data-qa="chart-settings"]')
-        self.chart_filter_button_full_cache_flushes = ListElement(self.page,
-            '//div[@data-qa="settings-show-cacheFlushes"]//input[@type="checkbox"]')
-        self.chart_filter_button_deployments = ListElement(self.page,
-            '//div[@data-qa="settings-show-deployments"]//input[@type="checkbox"]')
-        self.traffic_origin_latency_drop_down_filter = PageElement(self.page,
-            "//input[@data-qa='originLatency-breakdownSelector']")
-        self.traffic_origin_latency_metrics_selector = PageElement(self.page,
-            "//input[@data-qa='originLatency-metricsSelector']")
-        self.traffic_origin_latency_percentile_selector = PageElement(self.page,
-            "//input[@data-qa='originLatency-percentilesSelector']")
-        self.traffic_main_chart_summary = PageElement(self.page, "//*[@data-qa='data-usage-summary']")
-        self.traffic_rules_coulumn_with_metrics_data = PageElement(self.page,
-            '//table//tr//th[10]//*[@aria-disabled]')
-        # By Country tab elements
-        self.country_tab = PageElement(self.page, "//button[@role='tab'][contains(text(), 'By Country')]")
-        self.country_map = PageElement(self.page, "//div[@data-qa='geo-map']")
-        self.country_metric_selector = PageElement(self.page,
-            '//input[@data-qa="geo-metricsSelector"]')
-        self.country_percentile_selector = PageElement(self.page,
-            '//input[@data-qa="geo-percentilesSelector"]')
-        self.country_tab_origin_latency_by_country_grid = PageElement(self.page,
-            "//div[@data-qa='geo-table']//*[text()='Origin Latency by Country']")
+    # Date Picker
+    date_picker = LazyElement("//div[@data-qa='date-range-picker']")
+    date_picker_today = LazyElement("//div[@data-qa='dp-range-TODAY']")
+    date_picker_last_24_hours = LazyElement("//div[@data-qa='dp-range-LAST_24_HOURS']")
+    date_picker_last_7_days = LazyElement("//div[@data-qa='dp-range-LAST_7_DAYS']")
+    date_picker_this_month = LazyElement("//div[@data-qa='dp-range-THIS_MONTH']")
+    date_picker_last_month = LazyElement("//div[@data-qa='dp-range-LAST_MONTH']")
+    date_picker_last_30_days = LazyElement("//div[@data-qa='dp-range-LAST_30_DAYS']")
+    date_picker_last_90_days = LazyElement("//div[@data-qa='dp-range-LAST_90_DAYS']")
+    date_picker_daily = LazyElement("//div[@data-qa='dp-range-DAY']")
+    date_picker_monthly = LazyElement("//div[@data-qa='dp-range-MONTH']")
+    date_picker_custom_date_range = LazyElement("//div[@data-qa='dp-range-CUSTOM_RANGE']")
+    date_picker_apply_button = LazyElement("//button[text()='Apply']")
+
+    # Traffic Overview elements
+    traffic_header = LazyElement("//h2[text()='Traffic']")
+    traffic_overview_tab_button = LazyElement("//button[@role='tab']/..//*[text()='Overview']")
+    traffic_metric_selector = LazyElement('//input[@data-qa="data-usage-metricsSelector"]')
+    traffic_requests_grid_summary = LazyElement(
+        "//div[@data-qa='urls-chart']//*[contains(text(), 'Requests')]")
+    traffic_errors_grid_summary = LazyElement(
+        '//div[@data-qa="errors-card"]//*[contains(text(), "Errors")]')
+    traffic_rules_grid_summary = LazyElement('//main//span[text()="Rules"]')
+    traffic_rules_metric_selector = LazyElement('//input[@data-qa="rules-metricsSelector"]')
+    traffic_rules_percentile_selector = LazyElement('//input[@data-qa="rules-percentilesSelector"]')
+    traffic_origin_latency_over_time_summary = LazyElement(
+        '//div[@data-qa="urls-chart"]//*[text()="Origin Latency Over Time"]')
+    show_request_count_button = LazyElement(
+        '//div[@data-qa="rules-percentageToggle"]//button[@value="count"]')
+    show_as_percentage_of_total_requests_button = LazyElement(
+        '//div[@data-qa="rules-percentageToggle"]//button[@value="percent"]')
+    chart_filter_button = LazyElement('//button[@data-qa="chart-settings"]', ListElement)
+    chart_filter_button_full_cache_flushes = LazyElement(
+        '//div[@data-qa="settings-show-cacheFlushes"]//input[@type="checkbox"]', ListElement)
+    chart_filter_button_deployments = LazyElement(
+        '//div[@data-qa="settings-show-deployments"]//input[@type="checkbox"]', ListElement)
+    traffic_origin_latency_drop_down_filter = LazyElement(
+        "//input[@data-qa='originLatency-breakdownSelector']")
+    traffic_origin_latency_metrics_selector = LazyElement(
+        "//input[@data-qa='originLatency-metricsSelector']")
+    traffic_origin_latency_percentile_selector = LazyElement(
+        "//input[@data-qa='originLatency-percentilesSelector']")
+    traffic_main_chart_summary = LazyElement("//*[@data-qa='data-usage-summary']")
+    traffic_rules_coulumn_with_metrics_data = LazyElement('//table//tr//th[10]//*[@aria-disabled]')
+    # By Country tab elements
+    country_tab = LazyElement("//button[@role='tab'][contains(text(), 'By Country')]")
+    country_map = LazyElement("//div[@data-qa='geo-map']")
+    country_metric_selector = LazyElement('//input[@data-qa="geo-metricsSelector"]')
+    country_percentile_selector = LazyElement('//input[@data-qa="geo-percentilesSelector"]')
+    country_tab_origin_latency_by_country_grid = LazyElement(
+        "//div[@data-qa='geo-table']//*[text()='Origin Latency by Country']")
 
 
 class RedirectsMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.add_a_redirect_button = PageElement(self.page, "//button[@data-qa='redirect-add-btn']")
-        self.remove_selected_redirect = PageElement(self.page, "//button[@data-qa='redirect-remove-btn']")
-        self.confirm_remove_redirect = PageElement(self.page, "//button[text()='Remove ']")
-        self.search_field = PageElement(self.page, "//input[@id='search']")
-        self.default_status_dropdown = PageElement(self.page, "//div[@data-qa='redirect-default-status-picker']")
-        self.import_button = PageElement(self.page, "//button[@data-qa='redirect-import-btn']")
-        self.export_button = PageElement(self.page, "//button[@data-qa='redirect-export-btn']")
-        self.redirect_from = PageElement(self.page, "//input[@id='from']")
-        self.redirect_to = PageElement(self.page, "//input[@id='to']")
-        self.response_status = PageElement(self.page, "//div[@data-qa='redirect-status-picker']//div[@role='combobox']")
-        self.forward_query_string = PageElement(self.page, "//span[@data-qa='redirect-forward-query-string-checkbox']")
-        self.save_redirect_button = PageElement(self.page, "//button[@data-qa='redirect-add-save-popup-btn']")
-        self.import_override_existing = PageElement(self.page, "//span[text()='Override existing list with file content']")
-        self.import_append_file = PageElement(self.page, "//span[text()='Append file content to existing redirects list']")
-        self.upload_redirect_button = PageElement(self.page, "//button[text()='Upload redirects']")
-        self.redeploy_confirmation = PageElement(self.page, "//div[@role='dialog']//button[contains(text(), 'Deploy Now')]")
-        self.delete_all_checkbox = PageElement(self.page, "//table//tr//th//input[@type='checkbox']")
-        self.first_checkbox_from_the_table = PageElement(self.page, "//table//tbody//td//input[@type='checkbox']")
-        self.empty_list_message = PageElement(self.page, "//div[text()='This environment has no redirects']")
-        self.table_value_from_field = DynamicPageElement(self.page, "//table//tbody//tr[{row}]//td[2]")
-        self.table_value_to_field = DynamicPageElement(self.page, "//table//tbody//tr[{row}]//td[3]")
-        self.table_value_status_field = DynamicPageElement(self.page, "//table//tbody//tr[{row}]//td[4]")
-        self.table_value_query_field = DynamicPageElement(self.page, "//table//tbody//tr[{row}]//td[5]")
-        self.import_browse_button = PageElement(self.page, "//button[@data-qa='redirect-import-browse-btn']")
-        self.redirects_page = PageElement(self.page, "//span[text()='Redirects']")
-        self.no_redirects_matching = PageElement(self.page, "//div[text()='No redirects matching \"']")
+    add_a_redirect_button = LazyElement("//button[@data-qa='redirect-add-btn']")
+    remove_selected_redirect = LazyElement("//button[@data-qa='redirect-remove-btn']")
+    confirm_remove_redirect = LazyElement("//button[text()='Remove ']")
+    search_field = LazyElement("//input[@id='search']")
+    default_status_dropdown = LazyElement("//div[@data-qa='redirect-default-status-picker']")
+    import_button = LazyElement("//button[@data-qa='redirect-import-btn']")
+    export_button = LazyElement("//button[@data-qa='redirect-export-btn']")
+    redirect_from = LazyElement("//input[@id='from']")
+    redirect_to = LazyElement("//input[@id='to']")
+    response_status = LazyElement("//div[@data-qa='redirect-status-picker']//div[@role='combobox']")
+    forward_query_string = LazyElement("//span[@data-qa='redirect-forward-query-string-checkbox']")
+    save_redirect_button = LazyElement("//button[@data-qa='redirect-add-save-popup-btn']")
+    import_override_existing = LazyElement(
+        "//span[text()='Override existing list with file content']")
+    import_append_file = LazyElement(
+        "//span[text()='Append file content to existing redirects list']")
+    upload_redirect_button = LazyElement("//button[text()='Upload redirects']")
+    redeploy_confirmation = LazyElement(
+        "//div[@role='dialog']//button[contains(text(), 'Deploy Now')]")
+    delete_all_checkbox = LazyElement("//table//tr//th//input[@type='checkbox']")
+    first_checkbox_from_the_table = LazyElement("//table//tbody//td//input[@type='checkbox']")
+    empty_list_message = LazyElement("//div[text()='This environment has no redirects']")
+    table_value_from_field = LazyElement("//table//tbody//tr[{row}]//td[2]", DynamicPageElement)
+    table_value_to_field = LazyElement("//table//tbody//tr[{row}]//td[3]", DynamicPageElement)
+    table_value_status_field = LazyElement("//table//tbody//tr[{row}]//td[4]", DynamicPageElement)
+    table_value_query_field = LazyElement("//table//tbody//tr[{row}]//td[5]", DynamicPageElement)
+    import_browse_button = LazyElement("//button[@data-qa='redirect-import-browse-btn']")
+    redirects_page = LazyElement("//span[text()='Redirects']")
+    no_redirects_matching = LazyElement("//div[text()='No redirects matching \"']")
 
 
 class DeploymentsMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.serverless = PageElement(self.page, "//button[@id='server-logs']")
-        # Change it when data-qa attr is ready
-        self.resume_logs = PageElement(
-            self.page,
-            "//button[@data-qa='resume-logs']")
+    serverless = LazyElement("//button[@id='server-logs']")
+    # Change it when data-qa attr is ready
+    resume_logs = LazyElement("//button[@data-qa='resume-logs']")
 
 
 class SecurityMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.event_logs = PageElement(self.page, "//*[text()='Logs']")
-        self.security_application = PageElement(self.page,
-                                                "//*[text()='Security Apps']")
-        self.dashboard = PageElement(self.page, "//*[text()='Dashboard']").first
-        self.rules_manager = PageElement(self.page, "//*[text()='Rules Manager']")
-        self.access_rules = PageElement(self.page, "//*[text()='Access Rules']")
-        self.rate_rules = PageElement(self.page, "//*[text()='Rate Rules']")
-        self.bot_rules = PageElement(self.page, "//*[text()='Bot Rules']")
-        self.custom_rules = PageElement(self.page, "//*[text()='Custom Rules']")
-        self.managed_rules = PageElement(self.page, "//*[text()='Managed Rules']")
-
-        self.add_rule = PageElement(self.page, "//button[text()='Add Rule']")
-        self.no_data_to_display = PageElement(self.page, "//div[text()='No data to display']")
-
-        # ========= Rate Rules ======
-
-        self.input_num = PageElement(self.page, "//input[@id='num']")
-        self.add_rate_rule = PageElement(self.page, "//button[text()='New Rate Ruleset']")
-        self.rate_new_condition_group = PageElement(
-            self.page,"//button[text()='New Condition Group']")
-        self.rate_new_condition = PageElement(self.page, "//span[text()= 'New Condition']")
-        self.rate_condition_value_input = PageElement(self.page, "//input[@placeholder='Add...']")
-        self.rate_conditions = DynamicRateConditions(
-            self.page,
-            "//button[@data-rbd-draggable-context-id='{group}' and @title='Condition {condition}']"
-            )
-        self.rate_condition_match_by = DynamicPageElement(
-            self.page,
-            "//input[@name='conditionGroups[{group}].conditions[{condition}].target.type']")
-        self.rate_condition_values = ListElement(
-            self.page,
-            "//label[text()='Values']/..//div[@role='button']")
-        self.match_req_header_input = PageElement(self.page, '//input[@placeholder="Type or select header name"]')
-
-        # ======== Managed Rules ==========
-
-        self.add_managed_rule = PageElement(self.page, "//button[text()='New Managed Ruleset']")
-
-        # Ignore list
-        self.header_name_input = PageElement(
-            self.page, "//input[@name='generalSettings.responseHeaderName']")
-        self.ignore_cookies_input = PageElement(
-            self.page, "//input[@name='generalSettings.ignoreCookie']")
-        self.ignore_cookies_buttons = ListElement(
-            self.page,
-            "//input[@name='generalSettings.ignoreCookie']/..//div[@role='button']")
-        self.ignore_header_input = PageElement(
-            self.page, "//input[@name='generalSettings.ignoreHeader']")
-        self.ignore_header_buttons = ListElement(
-            self.page,
-            "//input[@name='generalSettings.ignoreHeader']/..//div[@role='button']")
-        self.ignore_query_args_input = PageElement(
-            self.page, "//input[@name='generalSettings.ignoreQueryArgs']")
-        self.ignore_query_args_buttons = ListElement(
-            self.page,
-            "//input[@name='generalSettings.ignoreQueryArgs']/../div[@role='button']")
-
-        # More Details
-        self.more_details = PageElement(self.page, "//div//p[text()='More Details']")
-        self.max_args_reqs_input = PageElement(self.page,
-                                               "//input[@name='generalSettings.maxNumArgs']")
-        self.single_arg_length_input = PageElement(
-            self.page, "//input[@name='generalSettings.argLength']")
-        self.arg_name_length_input = PageElement(
-            self.page, "//input[@name='generalSettings.argNameLength']")
-        self.total_arg_length_input = PageElement(
-            self.page, "//input[@name='generalSettings.totalArgLength']")
-        self.json_parser_input = PageElement(
-            self.page, "//input[@name='generalSettings.jsonParser']")
-
-        # Policies
-        self.policies = PageElement(self.page, "//button[text()='Inbound Policies']")
-        self.ruleset_input = PageElement(self.page, "//input[@name='rulesetVersion']")
-        self.ruleset_select = UlElement(self.page, "//ul[@role='listbox']//ul")
-        self.threshold_input = PageElement(self.page,
-                                           "//input[@name='generalSettings.anomalyThreshold']")
-        self.paranoia_level_input = PageElement(
-            self.page, "//input[@name='generalSettings.paranoiaLevel']")
-        self.ruleset_switch = PageElement(self.page, "//input[@name='rulesetswitch']")
-        # Exceptions
-        self.exceptions = PageElement(self.page, "//button[text()='Exceptions']")
-        self.add_condition = PageElement(self.page, "//button//span[text()='Add New Condition']")
-        self.rule_ids = PageElement(self.page,
-                                    "//input[@name='ruleTargetUpdates[0].ruleIds']")
-        self.parameter_input = PageElement(self.page,
-                                               "//input[@name='ruleTargetUpdates[0].target']")
-        self.condition_name = PageElement(self.page,
-                                          "//input[@name='ruleTargetUpdates[0].targetMatch']")
-        self.regex_switch = PageElement(self.page, "//input[@name='regexSwitch']")
-        self.rule_ids_buttons = ListElement(
-            self.page,
-            "//input[@name='ruleTargetUpdates[0].ruleIds']/..//div[@role='button']")
-
-        self.conditions = ListElement(
-            self.page, "//div[@aria-label='Managed rule exceptions']/button")
-
-        # ============= Security application manager ============
-
-        self.secapp_by_name = DynamicPageElement(
-            self.page,
-            "//div[@data-rbd-droppable-id='droppable']//h4[text()='{name}']/ancestor::div[2]")
-        self.secapp_names = PageElement(self.page, "//div[@role='button']/div/h4")
-        self.save_secapp = PageElement(
-            self.page,
-            "//div[text()='You have unsaved changes.']/../..//button[text()='Save']")
-        self.new_seccurity_application = PageElement(
-            self.page, "//button[text()='New Security Application']")
-        self.host_input = PageElement(self.page, "//input[@name='host.type']")
-        self.host_values_input = PageElement(self.page, "//input[@name='host.values']")
-        self.host_values_buttons = PageElement(
-            self.page, "//input[@name='host.values']/..//div[@role='button']")
-        self.url_path_input = PageElement(self.page, "//input[@name='path.type']")
-        self.url_values_input = PageElement(self.page, "//input[@name='path.values']")
-        self.url_values_buttons = PageElement(
-            self.page, "//input[@name='path.values']/..//div[@role='button']")
-        self.host_negative_match_checkbox = PageElement(
-            self.page, "//input[@name='host.isNegated']")
-        self.path_negative_match_checkbox = PageElement(
-            self.page, "//input[@name='path.isNegated']")
-        # Access Rules
-        self.config_access_rules = PageElement(
-            self.page,
-            "//button[@id='vertical-tab-0']")
-        self.prod_access_rule_input = PageElement(self.page, "//input[@name='aclProdId']")
-        self.action_access_rule_input = PageElement(self.page, "//input[@name='aclProdAction.enfType']")
-        self.audit_access_rule_input = PageElement(self.page, "//input[@name='aclAuditId']")
-
-        # Rate rules
-        self.config_rate_rules = PageElement(
-            self.page,
-            "//div[@aria-label='Managed rule exceptions']//button[text()='Rate Rules']")
-        self.prod_rate_rule_input = PageElement(self.page,
-                                                "//input[@placeholder='Add Rate Rule']")
-        # Managed Rules
-        self.config_managed_rules = PageElement(
-            self.page,
-            "//div[@aria-label='Managed rule exceptions']//button[text()='Managed Rule']")
-        self.prod_managed_rule_input = PageElement(self.page, "//input[@name='rulesProdId']")
-        self.action_managed_rule_input = PageElement(self.page, "//input[@name='rulesProdAction.enfType']")
-        self.audit_managed_rule_input = PageElement(self.page, "//input[@name='rulesAuditId']")
-
-        # ================= Access Rules ==========
-
-        self.add_access_rule = PageElement(self.page, "//button[text()='New Access Ruleset']")
-        # Access Control
-        self.access_control_input = PageElement(self.page,
-                                                "//input[@name='access-control-dropdown']")
-        self.whitelist = PageElement(self.page, "//button/p[text()='whitelist']")
-        self.blacklist = PageElement(self.page, "//button/p[text()='blacklist']")
-        self.accesslist = PageElement(self.page, "//button/p[text()='accesslist']")
-        # Create Access Control inputs for dropdown list
-        for type_title, list_ in product(ACCESS_CONTROL_TYPE,
-                                   ('whitelist', 'blacklist', 'accesslist')):
-            type_id = ACCESS_CONTROL_TYPE[type_title]
-            # Inputs
-            setattr(self,
-                    f'{type_id.lower()}_{list_}_input',
-                    PageElement(self.page, f"//textarea[@name='{type_id}.{list_}']"))
-            # Buttons
-            setattr(self,
-                    f'{type_id.lower()}_{list_}',
-                    PageElement(self.page, f"//div[p='{type_title}']/../../../..//p[text()='{list_}']"))
-            # # Saved input values
-            # setattr(self,
-            #         f'{type_id.lower()}_{list_}_values',
-            #         ListElement(self.page, f"//p[span='{type_title}']/../../../..//div[@role='button']/span"))
-
-        # Allowed HTTP Methods
-        for method in HTTP_METHODS:
-            setattr(self,
-                    f'method_{method.lower()}',
-                    PageElement(self.page, f"//input[@value='{method}']"))
-
-        self.other_methods = PageElement(self.page, "//input[@name='other http methods']")
-        self.other_methods_buttons = ListElement(
-            self.page, '//label[@id="other http methods"]/..//div[@role="button"]')
-
-        self.response_header_name = PageElement(self.page,
-                                                "//input[@name='responseHeaderName']")
-        self.file_upload_limit = PageElement(
-            self.page, "//input[@name='maxFileSize']")
-
-        self.request_content_type = PageElement(self.page,
-                                                "//input[@name='allowedRequestContentTypes']")
-        self.request_content_type_buttons = ListElement(
-            self.page,
-            "//label[text()='Allowed Request Content Types']/..//div[@role='button']")
-        self.request_content_type_buttons = ListElement(
-            self.page,
-            "//label[text()='Allowed Request Content Types']/..//div[@role='button']")
-        self.request_content_type_clear = ListElement(
-            self.page,
-            "//label[text()='Allowed Request Content Types']/..//button[@title='Clear']")
-        self.extension_blacklist = PageElement(self.page,
-                                               "//input[@name='disallowedExtensions']")
-        self.extension_blacklist_buttons = ListElement(
-            self.page, "//label[text()='Extension Blacklist']/..//div[@role='button']")
-        self.extension_blacklist_clear = ListElement(
-            self.page,
-            "//label[text()='Extension Blacklist']/..//button[@title='Clear']")
-        self.header_blacklist = PageElement(self.page, "//input[@name='disallowedHeaders']")
-        self.header_blacklist_buttons = ListElement(
-            self.page,
-            "//label[text()='Header Blacklist']/..//div[@role='button']")
-        self.header_blacklist_clear = ListElement(
-            self.page,
-            "//label[text()='Header Blacklist']/..//button[@title='Clear']")
-
-        # ==================== Dashboard & Event Logs ==============
-
-        self.dashboard_time_frame_input = PageElement(
-            self.page, "//input[@id='time']")
-        self.view_input = PageElement(self.page, "//input[@name='view']")
-        self.refresh_input = PageElement(self.page, "//input[@name='refresh']")
-
-        self.threats_button = PageElement(self.page, "//button[text()='Threats']")
-        self.browser_challenges_button = PageElement(self.page,
-                                                     "//button[text()='Browser Challenges']")
-        self.rates_button = PageElement(self.page, "//button[text()='Rates']")
-        self.rate_enforcement_button = PageElement(self.page,
-                                                   "//button[text()='Rate Enforcement']")
-        # Advanced filters
-        self.add_edit_filters = PageElement(self.page, "//button[text()='Edit/Add Filters']")
-        self.add_filter = PageElement(self.page, "//button[text()='Add Filter']")
-
-        self.field_input = PageElement(self.page, "//input[@placeholder='Select Field']")
-        self.value_input = PageElement(self.page, "//input[@name='domain']")
-
-        self.filter_names = ListElement(
-            self.page,
-            "//div[contains(@class, 'MuiGrid-container')]/div[contains(@class, 'MuiGrid-item')]/div[@role='button']")
-        self.filter_remove = ListElement(self.page,
-                                         "//div[p[contains(., 'Filters:')]]//button")
-        self.dashboard_current_time = PageElement(
-            self.page, "//h2[contains(text(), 'Security')]/../h6")
+    event_logs = LazyElement("//*[text()='Logs']")
+    security_application = LazyElement("//*[text()='Security Apps']")
+    dashboard = LazyElement("//*[text()='Dashboard']", nth=0)
+    rules_manager = LazyElement("//*[text()='Rules Manager']")
+    access_rules = LazyElement("//*[text()='Access Rules']")
+    rate_rules = LazyElement("//*[text()='Rate Rules']")
+    bot_rules = LazyElement("//*[text()='Bot Rules']")
+    custom_rules = LazyElement("//*[text()='Custom Rules']")
+    managed_rules = LazyElement("//*[text()='Managed Rules']")
+
+    add_rule = LazyElement("//button[text()='Add Rule']")
+    no_data_to_display = LazyElement("//div[text()='No data to display']")
+
+    # ========= Rate Rules ======
+
+    input_num = LazyElement("//input[@id='num']")
+    add_rate_rule = LazyElement("//button[text()='New Rate Ruleset']")
+    rate_new_condition_group = LazyElement("//button[text()='New Condition Group']")
+    rate_new_condition = LazyElement("//span[text()= 'New Condition']")
+    rate_condition_value_input = LazyElement("//input[@placeholder='Add...']")
+    rate_conditions = LazyElement(
+        "//button[@data-rbd-draggable-context-id='{group}' and @title='Condition {condition}']",
+        DynamicRateConditions)
+    rate_condition_match_by = LazyElement(
+        "//input[@name='conditionGroups[{group}].conditions[{condition}].target.type']",
+        DynamicPageElement)
+    rate_condition_values = LazyElement(
+        "//label[text()='Values']/..//div[@role='button']", ListElement)
+    match_req_header_input = LazyElement('//input[@placeholder="Type or select header name"]')
+
+    # ======== Managed Rules ==========
+
+    add_managed_rule = LazyElement("//button[text()='New Managed Ruleset']")
+
+    # Ignore list
+    header_name_input = LazyElement("//input[@name='generalSettings.responseHeaderName']")
+    ignore_cookies_input = LazyElement("//input[@name='generalSettings.ignoreCookie']")
+    ignore_cookies_buttons = LazyElement(
+        "//input[@name='generalSettings.ignoreCookie']/..//div[@role='button']", ListElement)
+    ignore_header_input = LazyElement("//input[@name='generalSettings.ignoreHeader']")
+    ignore_header_buttons = LazyElement(
+        "//input[@name='generalSettings.ignoreHeader']/..//div[@role='button']", ListElement)
+    ignore_query_args_input = LazyElement("//input[@name='generalSettings.ignoreQueryArgs']")
+    ignore_query_args_buttons = LazyElement(
+        "//input[@name='generalSettings.ignoreQueryArgs']/../div[@role='button']", ListElement)
+
+    # More Details
+    more_details = LazyElement("//div//p[text()='More Details']")
+    max_args_reqs_input = LazyElement("//input[@name='generalSettings.maxNumArgs']")
+    single_arg_length_input = LazyElement("//input[@name='generalSettings.argLength']")
+    arg_name_length_input = LazyElement("//input[@name='generalSettings.argNameLength']")
+    total_arg_length_input = LazyElement("//input[@name='generalSettings.totalArgLength']")
+    json_parser_input = LazyElement("//input[@name='generalSettings.jsonParser']")
+
+    # Policies
+    policies = LazyElement("//button[text()='Inbound Policies']")
+    ruleset_input = LazyElement("//input[@name='rulesetVersion']")
+    ruleset_select = LazyElement("//ul[@role='listbox']//ul", UlElement)
+    threshold_input = LazyElement("//input[@name='generalSettings.anomalyThreshold']")
+    paranoia_level_input = LazyElement("//input[@name='generalSettings.paranoiaLevel']")
+    ruleset_switch = LazyElement("//input[@name='rulesetswitch']")
+    # Exceptions
+    exceptions = LazyElement("//button[text()='Exceptions']")
+    add_condition = LazyElement("//button//span[text()='Add New Condition']")
+    rule_ids = LazyElement("//input[@name='ruleTargetUpdates[0].ruleIds']")
+    parameter_input = LazyElement("//input[@name='ruleTargetUpdates[0].target']")
+    condition_name = LazyElement("//input[@name='ruleTargetUpdates[0].targetMatch']")
+    regex_switch = LazyElement("//input[@name='regexSwitch']")
+    rule_ids_buttons = LazyElement(
+        "//input[@name='ruleTargetUpdates[0].ruleIds']/..//div[@role='button']", ListElement)
+
+    conditions = LazyElement("//div[@aria-label='Managed rule exceptions']/button", ListElement)
+
+    # ============= Security application manager ============
+
+    secapp_by_name = LazyElement(
+        "//div[@data-rbd-droppable-id='droppable']//h4[text()='{name}']/ancestor::div[2]",
+        DynamicPageElement)
+    secapp_names = LazyElement("//div[@role='button']/div/h4")
+    save_secapp = LazyElement(
+        "//div[text()='You have unsaved changes.']/../..//button[text()='Save']")
+    new_seccurity_application = LazyElement("//button[text()='New Security Application']")
+    host_input = LazyElement("//input[@name='host.type']")
+    host_values_input = LazyElement("//input[@name='host.values']")
+    host_values_buttons = LazyElement("//input[@name='host.values']/..//div[@role='button']")
+    url_path_input = LazyElement("//input[@name='path.type']")
+    url_values_input = LazyElement("//input[@name='path.values']")
+    url_values_buttons = LazyElement("//input[@name='path.values']/..//div[@role='button']")
+    host_negative_match_checkbox = LazyElement("//input[@name='host.isNegated']")
+    path_negative_match_checkbox = LazyElement("//input[@name='path.isNegated']")
+    # Access Rules
+    config_access_rules = LazyElement("//button[@id='vertical-tab-0']")
+    prod_access_rule_input = LazyElement("//input[@name='aclProdId']")
+    action_access_rule_input = LazyElement("//input[@name='aclProdAction.enfType']")
+    audit_access_rule_input = LazyElement("//input[@name='aclAuditId']")
+
+    # Rate rules
+    config_rate_rules = LazyElement(
+        "//div[@aria-label='Managed rule exceptions']//button[text()='Rate Rules']")
+    prod_rate_rule_input = LazyElement("//input[@placeholder='Add Rate Rule']")
+    # Managed Rules
+    config_managed_rules = LazyElement(
+        "//div[@aria-label='Managed rule exceptions']//button[text()='Managed Rule']")
+    prod_managed_rule_input = LazyElement("//input[@name='rulesProdId']")
+    action_managed_rule_input = LazyElement("//input[@name='rulesProdAction.enfType']")
+    audit_managed_rule_input = LazyElement("//input[@name='rulesAuditId']")
+
+    # ================= Access Rules ==========
+
+    add_access_rule = LazyElement("//button[text()='New Access Ruleset']")
+    # Access Control
+    access_control_input = LazyElement("//input[@name='access-control-dropdown']")
+    whitelist = LazyElement("//button/p[text()='whitelist']")
+    blacklist = LazyElement("//button/p[text()='blacklist']")
+    accesslist = LazyElement("//button/p[text()='accesslist']")
+    # Access Control inputs/buttons and Allowed HTTP Methods are added below the class
+
+    other_methods = LazyElement("//input[@name='other http methods']")
+    other_methods_buttons = LazyElement(
+        '//label[@id="other http methods"]/..//div[@role="button"]', ListElement)
+
+    response_header_name = LazyElement("//input[@name='responseHeaderName']")
+    file_upload_limit = LazyElement("//input[@name='maxFileSize']")
+
+    request_content_type = LazyElement("//input[@name='allowedRequestContentTypes']")
+    request_content_type_buttons = LazyElement(
+        "//label[text()='Allowed Request Content Types']/..//div[@role='button']", ListElement)
+    request_content_type_buttons = LazyElement(
+        "//label[text()='Allowed Request Content Types']/..//div[@role='button']", ListElement)
+    request_content_type_clear = LazyElement(
+        "//label[text()='Allowed Request Content Types']/..//button[@title='Clear']", ListElement)
+    extension_blacklist = LazyElement("//input[@name='disallowedExtensions']")
+    extension_blacklist_buttons = LazyElement(
+        "//label[text()='Extension Blacklist']/..//div[@role='button']", ListElement)
+    extension_blacklist_clear = LazyElement(
+        "//label[text()='Extension Blacklist']/..//button[@title='Clear']", ListElement)
+    header_blacklist = LazyElement("//input[@name='disallowedHeaders']")
+    header_blacklist_buttons = LazyElement(
+        "//label[text()='Header Blacklist']/..//div[@role='button']", ListElement)
+    header_blacklist_clear = LazyElement(
+        "//label[text()='Header Blacklist']/..//button[@title='Clear']", ListElement)
+
+    # ==================== Dashboard & Event Logs ==============
+
+    dashboard_time_frame_input = LazyElement("//input[@id='time']")
+    view_input = LazyElement("//input[@name='view']")
+    refresh_input = LazyElement("//input[@name='refresh']")
+
+    threats_button = LazyElement("//button[text()='Threats']")
+    browser_challenges_button = LazyElement("//button[text()='Browser Challenges']")
+    rates_button = LazyElement("//button[text()='Rates']")
+    rate_enforcement_button = LazyElement("//button[text()='Rate Enforcement']")
+    # Advanced filters
+    add_edit_filters = LazyElement("//button[text()='Edit/Add Filters']")
+    add_filter = LazyElement("//button[text()='Add Filter']")
+
+    field_input = LazyElement("//input[@placeholder='Select Field']")
+    value_input = LazyElement("//input[@name='domain']")
+
+    filter_names = LazyElement(
+        "//div[contains(@class, 'MuiGrid-container')]/div[contains(@class, 'MuiGrid-item')]/div[@role='button']",
+        ListElement)
+    filter_remove = LazyElement("//div[p[contains(., 'Filters:')]]//button", ListElement)
+    dashboard_current_time = LazyElement("//h2[contains(text(), 'Security')]/../h6")
+
+
+def _add_security_elements():
+    """ Add access control inputs/buttons and allowed HTTP methods to SecurityMixin """
+    # Create Access Control inputs for dropdown list
+    for type_title, list_ in product(ACCESS_CONTROL_TYPE, ('whitelist', 'blacklist', 'accesslist')):
+        type_id = ACCESS_CONTROL_TYPE[type_title]
+        # Inputs
+        set_lazy_element(SecurityMixin,
+                         f'{type_id.lower()}_{list_}_input',
+                         LazyElement(f"//textarea[@name='{type_id}.{list_}']"))
+        # Buttons
+        set_lazy_element(SecurityMixin,
+                         f'{type_id.lower()}_{list_}',
+                         LazyElement(f"//div[p='{type_title}']/../../../..//p[text()='{list_}']"))
+
+    # Allowed HTTP Methods
+    for method in HTTP_METHODS:
+        set_lazy_element(SecurityMixin,
+                         f'method_{method.lower()}',
+                         LazyElement(f"//input[@value='{method}']"))
+
+
+_add_security_elements()
 
 
 class AttackSurfacesMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-
-        self.error_message = PageElement(self.page, "//h1[text()='Something went wrong.']")
-
-        # menu
-        self.dashboard = PageElement(self.page, "//div[@data-qa='asm-dashboard']")
-        self.collections = PageElement(self.page, "//div[@data-qa='asm-collections']")
-        self.entities = PageElement(self.page, "//div[@data-qa='asm-entities']")
-        self.exposures = PageElement(self.page, "//div[@data-qa='asm-exposures']")
-        self.technologies = PageElement(self.page, "//div[@data-qa='asm-technologies']")
-        self.rules = PageElement(self.page, "//div[@data-qa='asm-rules']")
-
-        # Dashboard items
-        self.dash_header = PageElement(self.page, "//h2[text()='Attack Surfaces Dashboard']")
-
-        # Collections items
-        self.collections_header = PageElement(self.page, "//h2[text()='Collections']")
-        self.create_collection_btn = PageElement(self.page, "//button[@data-qa='create-collection-btn']")
-        self.collections_table = TableElement(self.page, "//table[@data-qa='collections-tbl']")
-
-        # Collections Create dialog
-        self.dlg_name = PageElement(self.page, "//input[@id='name']")
-        self.dlg_descr = PageElement(self.page, "//input[@id='description']")
-        # //button[@data-qa='btn-sch-sun']
-        # //button[@data-qa='btn-sch-mon']
-        # //button[@data-qa='btn-sch-tue']
-        # //button[@data-qa='btn-sch-wed']
-        # //button[@data-qa='btn-sch-thu']
-        # //button[@data-qa='btn-sch-fri']
-        # //button[@data-qa='btn-sch-sat']
-        # //input[@id='scan_at_utc_hour']
-        self.dlg_email_on_start = PageElement(self.page, "//*[@data-qa='email-on-start']//input")
-        self.dlg_email_on_complete = PageElement(self.page, "//*[@data-qa='email-on-complete']//input")
-        self.dlg_email_on_exposure = PageElement(self.page, "//*[@data-qa='email-on-exposure']//input")
-        # //div[@data-qa='email-to']
-        self.dlg_create_collection_btn = PageElement(self.page, "//button[@data-qa='create-dlg-save-btn']")
-        self.dlg_cancel_btn = PageElement(self.page, "//button[@data-qa='create-dlg-cancel-btn']")
-
-        # Collections Delete collection dialog
-        self.del_dlg_cancel_btn = PageElement(self.page, "//div[@role='dialog']//button[text()='Cancel']")
-        self.del_dlg_delete_btn = PageElement(self.page, "//div[@role='dialog']//button[text()='Delete']")
-
-        # Inside collection
-        self.coll_scan_now_btn = PageElement(self.page, "//button[@data-qa='scan-now-btn']")
-        self.coll_edit_collection_btn = PageElement(self.page, "//button[@data-qa='edit-collection-btn']")
-        # //div[@data-qa='collection-overview']
-        # -------------------- TBD overview here ------------------
-        # Seeds
-        self.seeds_tbl = PageElement(self.page, "//div[@data-qa='collection-seeds']//table")
-        self.add_seed_btn = PageElement(self.page, "//div[@data-qa='collection-seeds']//button[text()='Add a Seed...']")
-        # Add Seed dialog
-        self.add_seed_dlg_type = PageElement(self.page, "//input[@name='seed_type_id']")
-        self.add_seed_dlg_type_select = DynamicSelectElement(self.page, "//ul[@id='seed_type_id-listbox']/li[text()='{seed_type}']")
-        self.add_seed_dlg_seed = PageElement(self.page, "//input[contains(@placeholder,'e.g.')]")
-        self.add_seed_dlg_cancel_btn = PageElement(self.page, "//button[text()='Cancel']")
-        self.add_seed_dlg_create_btn = PageElement(self.page, "//button[text()='Create Seed']")
-        # Scans
-        self.scans_tbl = TableElement(self.page, "//div[@data-qa='collection-scans']//table")
-        # Scan details
-        self.scan_exposures_tbl = TableElement(self.page, "//div[text()='Exposures']/../../../following-sibling::div//table")
-        self.scan_tasks_tbl = TableElement(self.page, "//span[text()='Tasks']/../../following-sibling::div//table")
-
-        # Reset Collection
-        self.reset_collection_btn = PageElement(self.page, "(//button[text()='Reset Collection'])[1]")
-        self.reset_collection_dlg_reset_btn = PageElement(self.page, "(//button[text()='Reset Collection'])[2]")
-
-        # Assets (Entities) items
-        self.assets_header = PageElement(self.page, "//h2[text()='Assets']")
-
-        # Exposures items
-        self.exposures_header = PageElement(self.page, "//h2[text()='Exposures']")
-        self.exposures_tbl = TableElement(self.page, "//h2[text()='Exposures']/../../../following-sibling::div//table")
-
-        # Technologies items
-        self.technologies_header = PageElement(self.page, "//h2[text()='Technologies']")
-
-        # Rules items
-        self.rules_header = PageElement(self.page, "//h2[text()='Rules']")
-        self.rules_reset_to_defaults_btn = PageElement(self.page, "//button[text()='Reset to Default']")
-        self.rules_reset_dlg_reset_btn = PageElement(self.page, "//button[text()='Reset']")
+    error_message = LazyElement("//h1[text()='Something went wrong.']")
+
+    # menu
+    dashboard = LazyElement("//div[@data-qa='asm-dashboard']")
+    collections = LazyElement("//div[@data-qa='asm-collections']")
+    entities = LazyElement("//div[@data-qa='asm-entities']")
+    exposures = LazyElement("//div[@data-qa='asm-exposures']")
+    technologies = LazyElement("//div[@data-qa='asm-technologies']")
+    rules = LazyElement("//div[@data-qa='asm-rules']")
+
+    # Dashboard items
+    dash_header = LazyElement("//h2[text()='Attack Surfaces Dashboard']")
+
+    # Collections items
+    collections_header = LazyElement("//h2[text()='Collections']")
+    create_collection_btn = LazyElement("//button[@data-qa='create-collection-btn']")
+    collections_table = LazyElement("//table[@data-qa='collections-tbl']", TableElement)
+
+    # Collections Create dialog
+    dlg_name = LazyElement("//input[@id='name']")
+    dlg_descr = LazyElement("//input[@id='description']")
+    # //button[@data-qa='btn-sch-sun']
+    # //button[@data-qa='btn-sch-mon']
+    # //button[@data-qa='btn-sch-tue']
+    # //button[@data-qa='btn-sch-wed']
+    # //button[@data-qa='btn-sch-thu']
+    # //button[@data-qa='btn-sch-fri']
+    # //button[@data-qa='btn-sch-sat']
+    # //input[@id='scan_at_utc_hour']
+    dlg_email_on_start = LazyElement("//*[@data-qa='email-on-start']//input")
+    dlg_email_on_complete = LazyElement("//*[@data-qa='email-on-complete']//input")
+    dlg_email_on_exposure = LazyElement("//*[@data-qa='email-on-exposure']//input")
+    # //div[@data-qa='email-to']
+    dlg_create_collection_btn = LazyElement("//button[@data-qa='create-dlg-save-btn']")
+    dlg_cancel_btn = LazyElement("//button[@data-qa='create-dlg-cancel-btn']")
+
+    # Collections Delete collection dialog
+    del_dlg_cancel_btn = LazyElement("//div[@role='dialog']//button[text()='Cancel']")
+    del_dlg_delete_btn = LazyElement("//div[@role='dialog']//button[text()='Delete']")
+
+    # Inside collection
+    coll_scan_now_btn = LazyElement("//button[@data-qa='scan-now-btn']")
+    coll_edit_collection_btn = LazyElement("//button[@data-qa='edit-collection-btn']")
+    # //div[@data-qa='collection-overview']
+    # -------------------- TBD overview here ------------------
+    # Seeds
+    seeds_tbl = LazyElement("//div[@data-qa='collection-seeds']//table")
+    add_seed_btn = LazyElement("//div[@data-qa='collection-seeds']//button[text()='Add a Seed...']")
+    # Add Seed dialog
+    add_seed_dlg_type = LazyElement("//input[@name='seed_type_id']")
+    add_seed_dlg_type_select = LazyElement(
+        "//ul[@id='seed_type_id-listbox']/li[text()='{seed_type}']", DynamicSelectElement)
+    add_seed_dlg_seed = LazyElement("//input[contains(@placeholder,'e.g.')]")
+    add_seed_dlg_cancel_btn = LazyElement("//button[text()='Cancel']")
+    add_seed_dlg_create_btn = LazyElement("//button[text()='Create Seed']")
+    # Scans
+    scans_tbl = LazyElement("//div[@data-qa='collection-scans']//table", TableElement)
+    # Scan details
+    scan_exposures_tbl = LazyElement(
+        "//div[text()='Exposures']/../../../following-sibling::div//table", TableElement)
+    scan_tasks_tbl = LazyElement(
+        "//span[text()='Tasks']/../../following-sibling::div//table", TableElement)
+
+    # Reset Collection
+    reset_collection_btn = LazyElement("(//button[text()='Reset Collection'])[1]")
+    reset_collection_dlg_reset_btn = LazyElement("(//button[text()='Reset Collection'])[2]")
+
+    # Assets (Entities) items
+    assets_header = LazyElement("//h2[text()='Assets']")
+
+    # Exposures items
+    exposures_header = LazyElement("//h2[text()='Exposures']")
+    exposures_tbl = LazyElement(
+        "//h2[text()='Exposures']/../../../following-sibling::div//table", TableElement)
+
+    # Technologies items
+    technologies_header = LazyElement("//h2[text()='Technologies']")
+
+    # Rules items
+    rules_header = LazyElement("//h2[text()='Rules']")
+    rules_reset_to_defaults_btn = LazyElement("//button[text()='Reset to Default']")
+    rules_reset_dlg_reset_btn = LazyElement("//button[text()='Reset']")
 
     def wait_for_error(self, timeout=1000):
         try:
@@ -735,15 +619,14 @@ class AttackSurfacesMixin:
         self.log.debug(f"List collections")
         collections = []
         self.collections_table.scroll_into_view_if_needed()
-        for row in self.collections_table.tbody.tr:
-            coll_name = row[0].text_content()
+        for row in self.collections_table.cells()['rows']:
             collections.append({
-                'name': coll_name,
-                'entities': row[1].text_content(),
-                'exposures': row[2].text_content(),
-                'last_scanned': row[3].text_content(),
+                'name': row[0],
+                'entities': row[1],
+                'exposures': row[2],
+                'last_scanned': row[3],
             })
-            if name_filter and name_filter == coll_name:
+            if name_filter and name_filter == row[0]:
                 return collections.pop()
         return collections
 
@@ -763,25 +646,21 @@ class AttackSurfacesMixin:
     def remove_collection(self, collection_name: str, skip_empty_table=False):
         self.log.debug(f"Removing collection '{collection_name}'")
         self.collections_table.scroll_into_view_if_needed()
-        for row in self.collections_table.tbody.tr:
+        row = self.collections_table.find_row((collection_name, 'all'))
+        if row is not None:
             coll_title = row[0].text_content()
-            if coll_title in (collection_name, 'all'):
-                row.get_by_role("button").click()
-                self.del_dlg_delete_btn.click()
-                expect(row._locator, f'{coll_title} was not removed').to_have_count(0, timeout=5000)
-                return
-        else:
-            if not skip_empty_table:
-                raise Exception(f"Collections was not found")
+            row.get_by_role("button").click()
+            self.del_dlg_delete_btn.click()
+            expect(row._locator, f'{coll_title} was not removed').to_have_count(0, timeout=5000)
+        elif not skip_empty_table:
+            raise Exception(f"Collections was not found")
 
     def open_collection(self, collection_name: str):
         self.log.debug(f"Opening collection '{collection_name}'")
         self.collections_table.scroll_into_view_if_needed()
-        for row in self.collections_table.tbody.tr:
-            if row[0].text_content() == collection_name:
-                # self.locator(row[0]._locator).click()
-                # self.locator(row[0]).click()
-                row[0].click()
+        row = self.collections_table.find_row(collection_name)
+        if row is not None:
+            row[0].click()
 
     def add_seed(self, seed_type, seed):
         """seed_type: Domain, Github repository, IP Address, IP Address Range"""
@@ -795,14 +674,14 @@ class AttackSurfacesMixin:
         self.log.debug(f"List scans")
         scans = []
         self.scans_tbl.scroll_into_view_if_needed()
-        for row in self.scans_tbl.tbody.tr:
+        for row in self.scans_tbl.cells()['rows']:
             scans.append({
-                'when': row[0].text_content(),
-                'status': row[1].text_content(),
-                'entities_scanned': row[2].text_content(),
-                'new_entities_discovered': row[3].text_content(),
-                'new_exposures': row[4].text_content(),
-                'new_technology_versions': row[5].text_content(),
+                'when': row[0],
+                'status': row[1],
+                'entities_scanned': row[2],
+                'new_entities_discovered': row[3],
+                'new_exposures': row[4],
+                'new_technology_versions': row[5],
             })
         return scans
 
@@ -825,15 +704,15 @@ class AttackSurfacesMixin:
         self.log.debug(f"List scan tasks")
         tasks = []
         self.scan_tasks_tbl.scroll_into_view_if_needed()
-        for row in self.scan_tasks_tbl.tbody.tr:
+        for row in self.scan_tasks_tbl.cells()['rows']:
             tasks.append({
-                'status': row[0].text_content(),
-                'duration': row[1].text_content(),
-                'task': row[2].text_content(),
-                'entity': row[3].text_content(),
-                'hostnames': row[4].text_content(),
-                'last_update': row[5].text_content(),
-                'exposures_found': row[6].text_content(),
+                'status': row[0],
+                'duration': row[1],
+                'task': row[2],
+                'entity': row[3],
+                'hostnames': row[4],
+                'last_update': row[5],
+                'exposures_found': row[6],
             })
         return tasks
 
@@ -841,216 +720,178 @@ class AttackSurfacesMixin:
         self.log.debug(f"List scan exposures")
         exposures = []
         self.scan_exposures_tbl.scroll_into_view_if_needed()
-        for row in self.scan_exposures_tbl.tbody.tr:
-            exposures.append(row[1].text_content())
+        for row in self.scan_exposures_tbl.cells()['rows']:
+            exposures.append(row[1])
         return exposures
 
 
 class ExperimentsMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.experiments_title = PageElement(self.page, "//h2/*[text()='Experimentation']")
-        self.add_experiment_button = PageElement(self.page,
-                                                 "//button[text()='Add Experiment']")
-        # === Experiment parameters ===
-        self.experiment_name = DynamicPageElement(self.page, "//*[text()='Experiment: ']/..//b[text()='{name}']")
-        self.experiment_name_input = DynamicPageElement(self.page, "//input[@id='experiments.{id}.name']")
-        self.variant_name_input = DynamicPageElement(self.page, "//input[@id='experiments.{exp_id}.variants.{var_id}.name']")
-        self.variant_percentage_input = DynamicPageElement(self.page, "//input[@id='experiments.{exp_id}.variants.{var_id}.weight']")
-        self.add_variant_button = PageElement(self.page, "//button[text()='Add Variant']")
-        self.delete_experiment_button = PageElement(self.page, "(//button[@data-qa='delete-button'])[1]")
-        self.delete_experiment_list = ListElement(self.page,
-                                            "//button[@data-qa='delete-button']")
-        self.is_active_checkbox_list = ListElement(self.page, "//form//input[@type='checkbox']")
-        self.delete_experiment_confirm_button = PageElement(self.page, "//button[text()='Delete experiment']")
-        self.wrong_percentage_message = PageElement(self.page, "//*[text()='Percentage total have to be 100']")
-        # === Conditions ===
-        self.add_criteria_button = PageElement(self.page, "//button[.//text()='Add Criteria']")
-        self.add_condition_button = PageElement(self.page, "//button[text()='Add Condition']")
-        self.variable_input = PageElement(self.page, "//label[text()='Variable']/../div/input")
-        self.operator_input = PageElement(self.page, "//label[text()='Operator']/../div/input")
-        self.variable_select = DynamicPageElement(
-            self.page, "//div[text()='All Variables']/../ul/li//p[text()='{name}']")
-        self.code_input = PageElement(self.page, "input[name='feature.value.code']")
-        self.name_input = PageElement(self.page, "//label[contains(text(), 'Name')]/..//div[@role='textbox']")
-        self.value_div = PageElement(self.page, "//label[contains(text(), 'Value')]/..//div[@role='textbox']")
-        self.match_value_input = PageElement(self.page, "//label[contains(text(), 'Value')]/../div/input")
-        self.match_tags_inputs = PageElement(self.page, "//label[contains(text(), 'Value')]/../div")
-        self.match_compress_content_type_inputs = PageElement(
-            self.page, "//label[contains(text(), 'Compress Content Type')]/../div")
-        self.match_value_regex = PageElement(
-            self.page, "//label[contains(text(), 'Match Value')]/..//div[@role='textbox']")
-        self.values_list =  PageElement(self.page, "//label[contains(text(), 'Value(s')]/../div")
-        self.rule_checkbox = PageElement(self.page, "(//label//input[@type='checkbox'])[1]")
-        # === Features ===
-        self.add_feature_confirm_button = PageElement(self.page, "//button[text()='Add Feature']")
-        self.feature_input = PageElement(self.page,
-                                         "input[placeholder='Search Features...']")
-        self.feature_select = DynamicSelectElement(
-            self.page,
-            "//ul[@role='listbox']/li/div[text()='{type}']/../ul/li[text()='{name}']")
-        self.header_name = PageElement(
-            self.page,
-            "//label[contains(text(), 'Header Name')]/..//div[@role='textbox']")
-        self.add_action_button = PageElement(self.page, "(//button[text()='Add Action'])[1]")
-        self.variable_input = PageElement(self.page,
-                                          "//label[text()='Variable']/../div/input")
-        self.variable_select = DynamicPageElement(
-            self.page, "//div[text()='All Variables']/../ul/li//p[text()='{name}']")
-        self.operator_input = PageElement(self.page,
-                                          "//label[text()='Operator']/../div/input")
-        self.rule_checkbox = PageElement(self.page, "(//label//input[@type='checkbox'])[1]")
-        self.code_input = PageElement(self.page, "input[name='feature.value.code']")
-        self.name_input = PageElement(
-            self.page, "//label[contains(text(), 'Name')]/..//div[@role='textbox']")
-        self.value_div = PageElement(
-            self.page, "//label[contains(text(), 'Value')]/..//div[@role='textbox']")
-        self.match_value_input = PageElement(
-            self.page, "//label[contains(text(), 'Value')]/../div/input")
-        self.match_tags_inputs = PageElement(
-            self.page, "//label[contains(text(), 'Value')]/../div")
-        self.origin_response_headers = PageElement(
-            self.page, "//label[text()='Response Headers']/../div/input")
-        self.match_style_input = PageElement(
-            self.page, "input[name='feature.value.0.syntax']")
-        self.source_input = PageElement(
-            self.page, "//label[contains(text(), 'Source')]/..//div[@role='textbox']")
-        self.destination_input = PageElement(
-            self.page, "//label[contains(text(), 'Destination')]/..//div[@role='textbox']")
-        self.variable_name = PageElement(
-            self.page, "//label[text()='Name']/..//div[@role='textbox']")
-        self.variable_value = PageElement(
-            self.page, "//label[text()='Value']/..//div[@role='textbox']")
-        self.number_input = PageElement(self.page,
-                                        "input[name='condition.ruleVariable.value']")
-        self.response_headers = PageElement(
-            self.page,
-            "//label[text()='Response Headers']/../div/input")
-        self.parameter_name = PageElement(self.page,
-                                          "//label[text()='Parameter Name']/..//div[@role='textbox']")
-        self.custom_log_field = PageElement(
-            self.page, "//label[text()='Custom Log Field']/../div/input")
-        self.response_body = PageElement(
-            self.page, "//label[text()='Response Body']/..//textarea")
-        self.kbytes_per_second = PageElement(
-            self.page, "input[name='feature.value.kbytes_per_sec']")
-        self.prebuf_seconds = PageElement(
-            self.page, "input[name='feature.value.prebuf_seconds']")
-        self.header_treatment_input = PageElement(
-            self.page, "//label[text()='Cache Control Header Treatment']/../div/input")
-        self.option_input = PageElement(self.page, "input[name='cache-key-query-string']")
-        self.include_input = PageElement(self.page, "input[name='include']")
-        self.exclude_input = PageElement(self.page, "input[name='exclude']")
-        self.cacheable_request_body_size = PageElement(
-            self.page, "//label[text()='Cacheable Request Body Size']/../div/input")
-        self.compress_content_types_input = PageElement(
-            self.page, "//label[text()='Compress Content Types']/../div/input")
-        self.post_input = PageElement(self.page, "//label[text()='POST']/..//input")
-        self.put_input = PageElement(self.page, "//label[text()='PUT']/..//input")
-        self.h264_support_input = PageElement(
-            self.page,
-            "//label[text()='Enable H264 encoding']/../div/input")
-        self.expires_header_treatment_input = PageElement(
-            self.page, "//label[text()='Expires Header Treatment']/../div/input")
-        self.duration_value = PageElement(
-            self.page, "input[name='feature.value'][type='number']")
-        self.duration_unit = PageElement(self.page,
-                                         "input[name='feature.value'][type='text']")
-        self.response_status_code = PageElement(
-            self.page, "input[name='feature.value.0.key']")
-        self.max_age_value = PageElement(self.page,
-                                         "input[name='feature.value.0.value'][type='number']")
-        self.max_age_unit = PageElement(self.page,
-                                        "input[name='feature.value.0.value'][type='text']")
-        self.service_worker_max_age_value = PageElement(
-            self.page, "input[name='feature.value'][type='number']")
-        self.service_worker_max_age_unit = PageElement(
-            self.page, "input[name='feature.value'][type='text']")
-        self.ignore_origin_no_cache = PageElement(self.page,
-                "//label[text()='Ignore no-cache headers when the origin returns one of these status codes:']/../div/input")
-        self.cacheable_status_codes = PageElement(
-            self.page, "//label[text()='Cacheable Status Codes']/../div/input")
-        self.feature_value_input = PageElement(
-            self.page, "input[name='feature.value']")
-        self.proxy_special_headers_input = PageElement(
-            self.page, "//label[text()='Proxy Special Headers']/../div/input")
-        self.set_origin_input = PageElement(self.page,
-                                            "//label[text()='Origin Name']/../div/input")
+    experiments_title = LazyElement("//h2/*[text()='Experimentation']")
+    add_experiment_button = LazyElement("//button[text()='Add Experiment']")
+    # === Experiment parameters ===
+    experiment_name = LazyElement(
+        "//*[text()='Experiment: ']/..//b[text()='{name}']", DynamicPageElement)
+    experiment_name_input = LazyElement("//input[@id='experiments.{id}.name']", DynamicPageElement)
+    variant_name_input = LazyElement(
+        "//input[@id='experiments.{exp_id}.variants.{var_id}.name']", DynamicPageElement)
+    variant_percentage_input = LazyElement(
+        "//input[@id='experiments.{exp_id}.variants.{var_id}.weight']", DynamicPageElement)
+    add_variant_button = LazyElement("//button[text()='Add Variant']")
+    delete_experiment_button = LazyElement("(//button[@data-qa='delete-button'])[1]")
+    delete_experiment_list = LazyElement("//button[@data-qa='delete-button']", ListElement)
+    is_active_checkbox_list = LazyElement("//form//input[@type='checkbox']", ListElement)
+    delete_experiment_confirm_button = LazyElement("//button[text()='Delete experiment']")
+    wrong_percentage_message = LazyElement("//*[text()='Percentage total have to be 100']")
+    # === Conditions ===
+    add_criteria_button = LazyElement("//button[.//text()='Add Criteria']")
+    add_condition_button = LazyElement("//button[text()='Add Condition']")
+    variable_input = LazyElement("//label[text()='Variable']/../div/input")
+    operator_input = LazyElement("//label[text()='Operator']/../div/input")
+    variable_select = LazyElement(
+        "//div[text()='All Variables']/../ul/li//p[text()='{name}']", DynamicPageElement)
+    code_input = LazyElement("input[name='feature.value.code']")
+    name_input = LazyElement("//label[contains(text(), 'Name')]/..//div[@role='textbox']")
+    value_div = LazyElement("//label[contains(text(), 'Value')]/..//div[@role='textbox']")
+    match_value_input = LazyElement("//label[contains(text(), 'Value')]/../div/input")
+    match_tags_inputs = LazyElement("//label[contains(text(), 'Value')]/../div")
+    match_compress_content_type_inputs = LazyElement(
+        "//label[contains(text(), 'Compress Content Type')]/../div")
+    match_value_regex = LazyElement(
+        "//label[contains(text(), 'Match Value')]/..//div[@role='textbox']")
+    values_list = LazyElement("//label[contains(text(), 'Value(s')]/../div")
+    rule_checkbox = LazyElement("(//label//input[@type='checkbox'])[1]")
+    # === Features ===
+    add_feature_confirm_button = LazyElement("//button[text()='Add Feature']")
+    feature_input = LazyElement("input[placeholder='Search Features...']")
+    feature_select = LazyElement(
+        "//ul[@role='listbox']/li/div[text()='{type}']/../ul/li[text()='{name}']",
+        DynamicSelectElement)
+    header_name = LazyElement("//label[contains(text(), 'Header Name')]/..//div[@role='textbox']")
+    add_action_button = LazyElement("(//button[text()='Add Action'])[1]")
+    variable_input = LazyElement("//label[text()='Variable']/../div/input")
+    variable_select = LazyElement(
+        "//div[text()='All Variables']/../ul/li//p[text()='{name}']", DynamicPageElement)
+    operator_input = LazyElement("//label[text()='Operator']/../div/input")
+    rule_checkbox = LazyElement("(//label//input[@type='checkbox'])[1]")
+    code_input = LazyElement("input[name='feature.value.code']")
+    name_input = LazyElement("//label[contains(text(), 'Name')]/..//div[@role='textbox']")
+    value_div = LazyElement("//label[contains(text(), 'Value')]/..//div[@role='textbox']")
+    match_value_input = LazyElement("//label[contains(text(), 'Value')]/../div/input")
+    match_tags_inputs = LazyElement("//label[contains(text(), 'Value')]/../div")
+    origin_response_headers = LazyElement("//label[text()='Response Headers']/../div/input")
+    match_style_input = LazyElement("input[name='feature.value.0.syntax']")
+    source_input = LazyElement("//label[contains(text(), 'Source')]/..//div[@role='textbox']")
+    destination_input = LazyElement(
+        "//label[contains(text(), 'Destination')]/..//div[@role='textbox']")
+    variable_name = LazyElement("//label[text()='Name']/..//div[@role='textbox']")
+    variable_value = LazyElement("//label[text()='Value']/..//div[@role='textbox']")
+    number_input = LazyElement("input[name='condition.ruleVariable.value']")
+    response_headers = LazyElement("//label[text()='Response Headers']/../div/input")
+    parameter_name = LazyElement("//label[text()='Parameter Name']/..//div[@role='textbox']")
+    custom_log_field = LazyElement("//label[text()='Custom Log Field']/../div/input")
+    response_body = LazyElement("//label[text()='Response Body']/..//textarea")
+    kbytes_per_second = LazyElement("input[name='feature.value.kbytes_per_sec']")
+    prebuf_seconds = LazyElement("input[name='feature.value.prebuf_seconds']")
+    header_treatment_input = LazyElement(
+        "//label[text()='Cache Control Header Treatment']/../div/input")
+    option_input = LazyElement("input[name='cache-key-query-string']")
+    include_input = LazyElement("input[name='include']")
+    exclude_input = LazyElement("input[name='exclude']")
+    cacheable_request_body_size = LazyElement(
+        "//label[text()='Cacheable Request Body Size']/../div/input")
+    compress_content_types_input = LazyElement(
+        "//label[text()='Compress Content Types']/../div/input")
+    post_input = LazyElement("//label[text()='POST']/..//input")
+    put_input = LazyElement("//label[text()='PUT']/..//input")
+    h264_support_input = LazyElement("//label[text()='Enable H264 encoding']/../div/input")
+    expires_header_treatment_input = LazyElement(
+        "//label[text()='Expires Header Treatment']/../div/input")
+    duration_value = LazyElement("input[name='feature.value'][type='number']")
+    duration_unit = LazyElement("input[name='feature.value'][type='text']")
+    response_status_code = LazyElement("input[name='feature.value.0.key']")
+    max_age_value = LazyElement("input[name='feature.value.0.value'][type='number']")
+    max_age_unit = LazyElement("input[name='feature.value.0.value'][type='text']")
+    service_worker_max_age_value = LazyElement("input[name='feature.value'][type='number']")
+    service_worker_max_age_unit = LazyElement("input[name='feature.value'][type='text']")
+    ignore_origin_no_cache = LazyElement(
+        "//label[text()='Ignore no-cache headers when the origin returns one of these status codes:']/../div/input")
+    cacheable_status_codes = LazyElement("//label[text()='Cacheable Status Codes']/../div/input")
+    feature_value_input = LazyElement("input[name='feature.value']")
+    proxy_special_headers_input = LazyElement(
+        "//label[text()='Proxy Special Headers']/../div/input")
+    set_origin_input = LazyElement("//label[text()='Origin Name']/../div/input")
 
 
 class EnvironmentVariables:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.env_variable_title = PageElement(self.page, "//h2[text()='Environment Variables']")
-        self.add_env_variable_button = PageElement(self.page, "//button[text()='Add Environment Variable']")
-        self.import_env_variable_button = PageElement(self.page, "//button[text()='Import Environment Variables']")
-        self.the_key_field = PageElement(self.page, "//input[@id='key']")
-        self.the_value_field = PageElement(self.page, "//div//textarea[@id='value']")
-        self.keep_this_value_secret_checkbox = PageElement(self.page, "//span[@data-qa='secret-checkbox']")
-        self.import_text_field = PageElement(self.page, "//div[@data-qa='import-textfield']//textarea[1]")
-        self.add_variable_button = PageElement(self.page, "//button[text()='Add variable']")
-        self.import_variables_text_area = PageElement(self.page, "//textarea[@id=':r1j:']")
-        self.import_variables_button = PageElement(self.page, "//button[text()='Import Variables']")
-        self.confirm_remove_var = PageElement(self.page, "//button[text()='Remove Variable']")
-        self.row_key = DynamicPageElement(self.page, "//table//tbody//tr[{row}]//td[1]")
-        self.row_value = DynamicPageElement(self.page, "//table/tbody/tr[{row}]/td[2]")
-        self.env_page = PageElement(self.page, "//span[text()='Environment Variables']")
-        self.deploy_confirmation = PageElement(self.page, "//div[@role='dialog']//button[text()='Deploy Now']")
+    env_variable_title = LazyElement("//h2[text()='Environment Variables']")
+    add_env_variable_button = LazyElement("//button[text()='Add Environment Variable']")
+    import_env_variable_button = LazyElement("//button[text()='Import Environment Variables']")
+    the_key_field = LazyElement("//input[@id='key']")
+    the_value_field = LazyElement("//div//textarea[@id='value']")
+    keep_this_value_secret_checkbox = LazyElement("//span[@data-qa='secret-checkbox']")
+    import_text_field = LazyElement("//div[@data-qa='import-textfield']//textarea[1]")
+    add_variable_button = LazyElement("//button[text()='Add variable']")
+    import_variables_text_area = LazyElement("//textarea[@id=':r1j:']")
+    import_variables_button = LazyElement("//button[text()='Import Variables']")
+    confirm_remove_var = LazyElement("//button[text()='Remove Variable']")
+    row_key = LazyElement("//table//tbody//tr[{row}]//td[1]", DynamicPageElement)
+    row_value = LazyElement("//table/tbody/tr[{row}]/td[2]", DynamicPageElement)
+    env_page = LazyElement("//span[text()='Environment Variables']")
+    deploy_confirmation = LazyElement("//div[@role='dialog']//button[text()='Deploy Now']")
 
 
 
 class OriginsMixin:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.origins_title = PageElement(self.page, "//h2[text()='Origins']")
-        self.origin_row = ListElement(self.page, "//div[@data-qa='origin-block']")
-        self.delete_origin_button_confirmation = PageElement(self.page, "//button[text()='Delete Origin']")
-        self.origin_name_field = DynamicPageElement(self.page, "//input[@name='origins.{origin}.name']")
-        self.origin_override_host_headers = DynamicPageElement(
-            self.page, "//input[@name='origins.{origin}.override_host_header']")
-        self.origin_hostname = DynamicPageElement(self.page, "//input[@name='origins.{origin}.hosts.{row}.hostname']")
-        self.origin_scheme = DynamicPageElement(self.page, "//input[@name='origins.{origin}.hosts.{row}.scheme']")
-        self.origin_port = DynamicPageElement(self.page, "//input[@name='origins.{origin}.hosts.{row}.port']")
-        self.origin_ip_version_preference = DynamicPageElement(
-            self.page, "//input[@name='origins.{origin}.hosts.{row}.dns_preference']")
-        self.origin_add_host = PageElement(self.page, "//button[@data-qa='add-host-button']")
-        self.origin_use_sni = ListElement(self.page, "//span[@data-qa='use-sni-checkbox']")
-        self.allow_self_signed_certs = ListElement(self.page, "//span[@data-qa='allow-self-signed-certs-checkbox']")
-        self.origin_use_the_following_sni_field = DynamicPageElement(
-            self.page, "//input[@name='origins.{origin}.tls_verify.sni_hint_and_strict_san_check']")
-        self.add_pin_button = PageElement(self.page, "(//button[@data-qa='add-pin-button'])[last()]")
-        self.pinned_certs = DynamicPageElement(
-            self.page, "//input[@name='origins.{origin}.tls_verify.pinned_certs.{row}.pinned_cert']")
-        self.shields_drop_down = DynamicPageElement(
-            self.page, "//input[@name='origins.{origin}.shields']")
-        self.shields_row = PageElement(self.page, "//div[@data-qa='origin-shields-block']")
-        self.add_origin_button = PageElement(self.page, "//button[@data-qa='add-origin-button']")
-        self.origin_json_editor = PageElement(self.page, "//button[@data-qa='json-editor-button']")
-        self.origin_editor = PageElement(self.page, "//button[@data-qa='origins-editor-button']")
-        self.json_field = PageElement(self.page, "//div[@class='lines-content monaco-editor-background']")
-        self.balancer_type = DynamicPageElement(self.page, "//input[@name='origins.{origin}.balancer']")
-        self.use_sni_hint = ListElement(
-            self.page, "//span[@data-qa='use-sni-hint-and-enforce-origin-san-cn-checking-checkbox']")
+    origins_title = LazyElement("//h2[text()='Origins']")
+    origin_row = LazyElement("//div[@data-qa='origin-block']", ListElement)
+    delete_origin_button_confirmation = LazyElement("//button[text()='Delete Origin']")
+    origin_name_field = LazyElement("//input[@name='origins.{origin}.name']", DynamicPageElement)
+    origin_override_host_headers = LazyElement(
+        "//input[@name='origins.{origin}.override_host_header']", DynamicPageElement)
+    origin_hostname = LazyElement(
+        "//input[@name='origins.{origin}.hosts.{row}.hostname']", DynamicPageElement)
+    origin_scheme = LazyElement(
+        "//input[@name='origins.{origin}.hosts.{row}.scheme']", DynamicPageElement)
+    origin_port = LazyElement(
+        "//input[@name='origins.{origin}.hosts.{row}.port']", DynamicPageElement)
+    origin_ip_version_preference = LazyElement(
+        "//input[@name='origins.{origin}.hosts.{row}.dns_preference']", DynamicPageElement)
+    origin_add_host = LazyElement("//button[@data-qa='add-host-button']")
+    origin_use_sni = LazyElement("//span[@data-qa='use-sni-checkbox']", ListElement)
+    allow_self_signed_certs = LazyElement(
+        "//span[@data-qa='allow-self-signed-certs-checkbox']", ListElement)
+    origin_use_the_following_sni_field = LazyElement(
+        "//input[@name='origins.{origin}.tls_verify.sni_hint_and_strict_san_check']",
+        DynamicPageElement)
+    add_pin_button = LazyElement("(//button[@data-qa='add-pin-button'])[last()]")
+    pinned_certs = LazyElement(
+        "//input[@name='origins.{origin}.tls_verify.pinned_certs.{row}.pinned_cert']",
+        DynamicPageElement)
+    shields_drop_down = LazyElement("//input[@name='origins.{origin}.shields']", DynamicPageElement)
+    shields_row = LazyElement("//div[@data-qa='origin-shields-block']")
+    add_origin_button = LazyElement("//button[@data-qa='add-origin-button']")
+    origin_json_editor = LazyElement("//button[@data-qa='json-editor-button']")
+    origin_editor = LazyElement("//button[@data-qa='origins-editor-button']")
+    json_field = LazyElement("//div[@class='lines-content monaco-editor-background']")
+    balancer_type = LazyElement("//input[@name='origins.{origin}.balancer']", DynamicPageElement)
+    use_sni_hint = LazyElement(
+        "//span[@data-qa='use-sni-hint-and-enforce-origin-san-cn-checking-checkbox']", ListElement)
 
 
 class OrgActivity:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.activity_header = PageElement(self.page, "//h2[text()='Organization Activity']")
-        self.add_filter_button = PageElement(self.page, "//table//button[text()='Add a Filter']")
-        self.show_more_button = PageElement(self.page, "//button[text()='Show More']")
-        self.filter_search_field = PageElement(self.page, "//input[@id='activity-search']")
-        self.filter_action_type_field = PageElement(self.page, "//input[@id='action-type']")
-        self.from_date_field = PageElement(self.page, "//input[@id='from']")
-        self.to_date_field = PageElement(self.page, "//input[@id='to']")
-        self.clear_filters_button = PageElement(self.page, "//button[text()='Clear Filters']")
+    activity_header = LazyElement("//h2[text()='Organization Activity']")
+    add_filter_button = LazyElement("//table//button[text()='Add a Filter']")
+    show_more_button = LazyElement("//button[text()='Show More']")
+    filter_search_field = LazyElement("//input[@id='activity-search']")
+    filter_action_type_field = LazyElement("//input[@id='action-type']")
+    from_date_field = LazyElement("//input[@id='from']")
+    to_date_field = LazyElement("//input[@id='to']")
+    clear_filters_button = LazyElement("//button[text()='Clear Filters']")
 
 
 class WebProperty:
-    def __init__(self, page: Page, url: str):
-        super().__init__(page, url)
-        self.search_field = PageElement(self.page, "//input[@id='property-search']")
-        self.sorting_drop_down = PageElement(self.page, "//input[@id='sort']")
-        self.property_name = DynamicPageElement(self.page, "//div//p[text()='{name}']")
-        self.latest_deployment_header = PageElement(self.page, "//span[text()='Latest Production Deployment']")
-        self.property_cards = ListElement(self.page, "//div[@class='property-cards']//a")
\ No newline at end of file
+    search_field = LazyElement("//input[@id='property-search']")
+    sorting_drop_down = LazyElement("//input[@id='sort']")
+    property_name = LazyElement("//div//p[text()='{name}']", DynamicPageElement)
+    latest_deployment_header = LazyElement("//span[text()='Latest Production Deployment']")
+    property_cards = LazyElement("//div[@class='property-cards']//a", ListElement)
\ No newline at end of file
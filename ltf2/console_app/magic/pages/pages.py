@@ -13,6 +13,7 @@ from io import StringIO
 from playwright.sync_api import Page, TimeoutError, expect
 from urllib.parse import urljoin
 
+from ltf2.console_app.magic.interaction import measure_interaction
 from ltf2.console_app.magic.nested_rules import NestedRules
 from ltf2.console_app.magic.pages.base_page import BasePage
 from ltf2.console_app.magic.pages.components import (CommonMixin,
@@ -39,12 +40,10 @@ class LoginPage(CommonMixin, LoginMixin, BasePage):
         self.submit.click()
         self.password.fill(password)
         self.submit.click()
-        # Skip multi-factor auth if present
-        try:
-            self.skip_this_step.click(timeout=2000)
-        except TimeoutError:
-            pass
         try:
+            # Skip multi-factor auth if present
+            if self.probe(self.skip_this_step, ready=self.settings):
+                self.skip_this_step.click()
             self.settings.wait_for()
         except TimeoutError as e:
             if self.reset_pasword.is_visible():
@@ -135,11 +134,10 @@ class PropertyPage(CommonMixin, EnvironmentMixin, BasePage):
 
     def revert_rules(self):
         self.add_rule.wait_for()
-        try:
-            # Click `Revert` button if available
-            self.revert_button.click(timeout=4000)
-        except TimeoutError:
+        # Click `Revert` button if available
+        if not self.probe(self.revert_button):
             return
+        self.revert_button.click()
         self.revert_changes_button.click(timeout=2000)
         # Wait for 'Revent' button to dissapear
         self.revert_button.wait_for(state='hidden', timeout=10000)
@@ -167,34 +165,36 @@ class PropertyPage(CommonMixin, EnvironmentMixin, BasePage):
             expect(self.rules_list._locator).to_have_count(rules_count+1, timeout=40000)
         except (AssertionError, TimeoutError):
             # Check if rule generation failed
-            try:
-                error = self.ai_rule_generation_error.inner_text(timeout=10)
+            if self.ai_rule_generation_error.is_present():
+                error = self.ai_rule_generation_error.inner_text()
                 assert not error, f"Cannot generate rule: {error}"
-            except TimeoutError:
-                pass
             raise
 
 
 class SecurityPage(CommonMixin, SecurityMixin, BasePage):
     def _delete_rules(self, rules: list[str], url_section: str) -> None:
+        """ Delete rules via UI (see `ConsoleApi.delete_waf_rules` for bulk deletion) """
         self.mock.clear()
+        url = f"{self.url.strip('/')}/security/{url_section}"
+        # The page is reloaded only after a rule is deleted
+        reload = True
         for rule in rules:
-            url = f"{self.url.strip('/')}/security/{url_section}"
-            self.goto(url)
-            try:
-                self.table.wait_for(timeout=5000)  # ms
-            except TimeoutError:
-                # Check if there is no rules present
-                self.no_data_to_display.wait_for(timeout=500)  # ms
-                return
-            for row in self.table.tbody.tr:
-                if row[0].text_content() == rule:
-                    row[0].click()
-                    self.delete_button.click()
-                    self.confirm_button.click()
-                    # Wait message on snackbar to change
-                    self.client_snackbar.get_by_text('Successfully deleted').wait_for()
-                    break
+            if reload:
+                self.goto(url)
+                try:
+                    self.table.wait_for(timeout=5000)  # ms
+                except TimeoutError:
+                    # Check if there is no rules present
+                    self.no_data_to_display.wait_for(timeout=500)  # ms
+                    return
+            row = self.table.find_row(rule)
+            reload = row is not None
+            if row is not None:
+                row[0].click()
+                self.delete_button.click()
+                self.confirm_button.click()
+                # Wait message on snackbar to change
+                self.client_snackbar.get_by_text('Successfully deleted').wait_for()
 
     def _open_rule_editor(self, url_section: str,
                           name: str, name_index: int = 0):
@@ -202,10 +202,10 @@ class SecurityPage(CommonMixin, SecurityMixin, BasePage):
         url = f"{self.url.strip('/')}/security/{url_section}"
         self.goto(url)
         self.table.wait_for()
-        for row in self.table.tbody.tr:
-            if row[name_index].text_content() == name:
-                row[name_index].click()
-                return True
+        row = self.table.find_row(name, column=name_index)
+        if row is not None:
+            measure_interaction(row[name_index], name=f'open {url_section} rule editor')
+            return True
 
         raise AssertionError("Rule was not saved")
 
@@ -0,0 +1,219 @@
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from playwright.sync_api import Error, Page, Route
+
+
+# Data requests of the console app: GraphQL and BFF
+RECORDED_URLS = ('**/graphql', '**/api/bff/**')
+
+STORE_VERSION = 1
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+
+class Exchange(NamedTuple):
+    """ Recorded response, the body is kept in the store by its digest """
+    status: int
+    content_type: str
+    body: str
+
+
+def canonical_body(post_data: Optional[str]) -> Union[dict, list, str, None]:
+    """ JSON request body (GraphQL query, BFF payload) or the raw body """
+    if not post_data:
+        return None
+    try:
+        return json.loads(post_data)
+    except ValueError:
+        return post_data
+
+
+def request_keys(method: str, url: str, post_data: Optional[str]) -> Tuple[str, str]:
+    """ Loose and exact keys of the request
+
+    Loose key is the method, path (and GraphQL `operationName`), exact key also
+    includes query params and body. Host is ignored, so exchanges recorded on
+    one environment are replayed on another.
+
+    Example:
+        request_keys('POST', 'https://app.test/graphql',
+                     '{"operationName": "wafConfig", "variables": {...}}')
+        # ('POST /graphql wafConfig', 'POST /graphql wafConfig 6f1ed002ab...')
+    """
+    parts = urlsplit(url)
+    body = canonical_body(post_data)
+    loose = f'{method} {parts.path}'
+    if isinstance(body, dict) and body.get('operationName'):
+        loose += f' {body["operationName"]}'
+    query = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    digest = hashlib.sha1(json.dumps([query, body], sort_keys=True).encode()).hexdigest()
+    return loose, f'{loose} {digest}'
+
+
+class ExchangeStore:
+    """ Compact store of the recorded request/response exchanges
+
+    Bodies are deduplicated by digest and the store is saved as gzipped JSON.
+    Consecutive identical responses of the same request are stored once; different
+    responses are replayed in the recorded order (the last one is repeated).
+
+    A request is matched exactly (method, path, query, body) first. If there is
+    no such request (e.g. it contains the current time), the first response
+    recorded for the same method, path and GraphQL operation is replayed.
+
+    Example:
+        store = ExchangeStore.load('har/traffic/test_routes.json.gz')
+        exchange = store.lookup('POST', url, post_data)
+    """
+    def __init__(self):
+        self.bodies: Dict[str, str] = {}
+        self.exchanges: Dict[str, List[Exchange]] = {}
+        # Loose key -> exact key of the first recorded request
+        self.loose: Dict[str, str] = {}
+        # Replay position of every exact key
+        self._cursors: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return sum(len(exchanges) for exchanges in self.exchanges.values())
+
+    def add(self, method: str, url: str, post_data: Optional[str],
+            status: int, content_type: str, body: bytes) -> None:
+        loose, exact = request_keys(method, url, post_data)
+        digest = hashlib.sha1(body).hexdigest()
+        if digest not in self.bodies:
+            try:
+                self.bodies[digest] = body.decode()
+            except UnicodeDecodeError:
+                self.bodies[digest] = 'base64:' + base64.b64encode(body).decode()
+        exchange = Exchange(status, content_type, digest)
+        exchanges = self.exchanges.setdefault(exact, [])
+        if not exchanges or exchanges[-1] != exchange:
+            exchanges.append(exchange)
+        self.loose.setdefault(loose, exact)
+
+    def lookup(self, method: str, url: str, post_data: Optional[str]) -> Optional[Exchange]:
+        loose, exact = request_keys(method, url, post_data)
+        if exact not in self.exchanges:
+            exact = self.loose.get(loose)
+            if exact is None:
+                return None
+        exchanges = self.exchanges[exact]
+        position = self._cursors.get(exact, 0)
+        self._cursors[exact] = position + 1
+        return exchanges[min(position, len(exchanges) - 1)]
+
+    def body(self, exchange: Exchange) -> bytes:
+        body = self.bodies[exchange.body]
+        if body.startswith('base64:'):
+            return base64.b64decode(body[len('base64:'):])
+        return body.encode()
+
+    def save(self, path: Union[str, Path]) -> None:
+        """ Save the store into the gzipped JSON file atomically """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': STORE_VERSION,
+                'bodies': self.bodies,
+                'exchanges': {key: [list(e) for e in exchanges]
+                              for key, exchanges in self.exchanges.items()},
+                'loose': self.loose}
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+        try:
+            # Constant mtime: the same exchanges give the same file
+            with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+                f.write(json.dumps(data, separators=(',', ':')).encode())
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ExchangeStore':
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != STORE_VERSION:
+            raise ValueError(f'Unsupported version of the store {path}: {data.get("version")}')
+        store = cls()
+        store.bodies = data['bodies']
+        store.exchanges = {key: [Exchange(*e) for e in exchanges]
+                           for key, exchanges in data['exchanges'].items()}
+        store.loose = data['loose']
+        return store
+
+
+class ConsoleRecorder:
+    """ Record data requests of the console app or replay them offline
+
+    In `record` mode requests are sent to the backend and the exchanges are
+    added to the store. In `replay` mode responses are served from the store;
+    requests that are not in the store are aborted, so the backend is never
+    reached. Routes of `GraphQLMock` have priority: only requests that are not
+    mocked reach the recorder.
+
+    Args:
+        page: playwright Page instance
+        store: store to record into or replay from
+        mode: `record` or `replay`
+        urls: url globs of the recorded requests
+
+    Example:
+        recorder = ConsoleRecorder(page, ExchangeStore(), mode=RECORD)
+        ...
+        recorder.detach()
+        recorder.store.save('har/test_traffic.json.gz')
+    """
+    def __init__(self, page: Page, store: ExchangeStore, mode: str = REPLAY,
+                 urls: Tuple[str, ...] = RECORDED_URLS):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f'Unknown mode `{mode}`, supported: {(RECORD, REPLAY)}')
+        self.page = page
+        self.store = store
+        self.mode = mode
+        self.urls = urls
+        self.missed: List[str] = []
+        self.log = logging.getLogger(self.__class__.__name__)
+        handler = self.record_route if mode == RECORD else self.replay_route
+        self._routes = [(url, handler) for url in urls]
+        for url, handler in self._routes:
+            self.page.route(url, handler)
+
+    def record_route(self, route: Route) -> None:
+        request = route.request
+        try:
+            response = route.fetch()
+            body = response.body()
+        except Error as e:
+            self.log.debug(f'{request.method} {request.url} was not recorded: {e}')
+            route.fallback()
+            return
+        self.store.add(request.method, request.url, request.post_data, response.status,
+                       response.headers.get('content-type', ''), body)
+        route.fulfill(response=response, body=body)
+
+    def replay_route(self, route: Route) -> None:
+        request = route.request
+        exchange = self.store.lookup(request.method, request.url, request.post_data)
+        if exchange is None:
+            self.log.warning(f'No recorded response: {request.method} {request.url}')
+            self.missed.append(request_keys(request.method, request.url, request.post_data)[0])
+            route.abort('blockedbyclient')
+            return
+        route.fulfill(status=exchange.status,
+                      content_type=exchange.content_type or None,
+                      body=self.store.body(exchange))
+
+    def detach(self) -> None:
+        """ Stop handling requests of the page """
+        for url, handler in self._routes:
+            self.page.unroute(url, handler)
+        self._routes = []
@@ -0,0 +1,120 @@
+""" pytest plugin: time spent in the expected timeouts
+
+Page objects and fixtures probe optional elements with short timeouts, e.g.
+
+    try:
+        page.status_snackbar_close.click(timeout=1500)
+    except TimeoutError:
+        pass
+
+Every TimeoutError raised by a page element action and swallowed by the code
+(the test did not fail with it) is attributed to the code line that called
+the action. The leaderboard of these call sites is printed at the end of the
+run (merged from all pytest-xdist workers). The report is opt-in.
+
+Options:
+    --timeout-report N: number of call sites in the leaderboard (0 by default: disabled)
+    --timeout-report-json PATH: save the full report to the JSON file
+"""
+import json
+from collections import defaultdict
+from typing import Dict
+
+import pytest
+
+from ltf2.console_app.magic.timing import get_action_recorder
+
+
+class TimeoutReport:
+    """ Wasted time of the expected timeouts by call site """
+    def __init__(self, config):
+        self.config = config
+        self.sites: Dict[str, dict] = defaultdict(
+            lambda: {'count': 0, 'total': 0.0, 'max': 0.0, 'tests': set(), 'targets': set()})
+
+    def add(self, site: str, duration: float, test: str, target: str) -> None:
+        stats = self.sites[site]
+        stats['count'] += 1
+        stats['total'] += duration
+        stats['max'] = max(stats['max'], duration)
+        stats['tests'].add(test)
+        stats['targets'].add(target)
+
+    def merge(self, sites: Dict[str, dict]) -> None:
+        for site, other in sites.items():
+            stats = self.sites[site]
+            stats['count'] += other['count']
+            stats['total'] += other['total']
+            stats['max'] = max(stats['max'], other['max'])
+            stats['tests'].update(other['tests'])
+            stats['targets'].update(other['targets'])
+
+    def to_json(self) -> Dict[str, dict]:
+        """ Call sites sorted by the wasted time """
+        return {site: {**stats,
+                       'total': round(stats['total'], 3),
+                       'max': round(stats['max'], 3),
+                       'tests': sorted(stats['tests']),
+                       'targets': sorted(stats['targets'])}
+                for site, stats in sorted(self.sites.items(), key=lambda item: item[1]['total'],
+                                          reverse=True)}
+
+    # ======== Hooks ========
+
+    def pytest_sessionstart(self, session):
+        get_action_recorder().track_timeouts = True
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        yield
+        recorder = get_action_recorder()
+        failure = call.excinfo.value if call.excinfo else None
+        for event in recorder.timeouts:
+            # Timeout that failed the test is not an expected one
+            if event.exception is not failure:
+                self.add(event.site, event.duration, item.nodeid,
+                         f'{event.action} {event.selector}')
+        recorder.timeouts.clear()
+
+    def pytest_sessionfinish(self, session):
+        get_action_recorder().track_timeouts = False
+        if hasattr(self.config, 'workeroutput'):
+            # pytest-xdist worker: the report is sent to the controller
+            self.config.workeroutput['timeout_report'] = self.to_json()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.merge(getattr(node, 'workeroutput', {}).get('timeout_report', {}))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if hasattr(self.config, 'workeroutput'):
+            return
+        report = self.to_json()
+        json_path = self.config.getoption('--timeout-report-json')
+        if json_path:
+            with open(json_path, 'w') as f:
+                json.dump(report, f, indent=2)
+        top = self.config.getoption('--timeout-report')
+        if not report or not top:
+            return
+        total = sum(stats['total'] for stats in report.values())
+        count = sum(stats['count'] for stats in report.values())
+        terminalreporter.write_sep('=', f'expected timeouts: {total:.1f}s wasted in {count} probes')
+        terminalreporter.write_line(f'{"total, s":>9} {"count":>6} {"max, s":>7} {"tests":>6}  call site')
+        for site, stats in list(report.items())[:top]:
+            terminalreporter.write_line(f'{stats["total"]:>9.1f} {stats["count"]:>6} '
+                                        f'{stats["max"]:>7.1f} {len(stats["tests"]):>6}  {site}')
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('timeout-report', 'expected timeouts report')
+    group.addoption('--timeout-report', type=int, default=0, metavar='N',
+                    help='Print N call sites that wasted the most time in expected '
+                         'timeouts (disabled by default)')
+    group.addoption('--timeout-report-json', default=None, metavar='PATH',
+                    help='Save the full report of the expected timeouts to the JSON file')
+
+
+def pytest_configure(config):
+    if config.getoption('--timeout-report') or config.getoption('--timeout-report-json'):
+        config.pluginmanager.register(TimeoutReport(config), 'timeout-report-collector')
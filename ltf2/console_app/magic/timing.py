@@ -0,0 +1,167 @@
+import os
+import sys
+import time
+from collections import defaultdict
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+# Locator methods that only build another locator (no browser round-trip)
+LOCATOR_BUILDERS = frozenset({
+    'locator', 'nth', 'filter', 'and_', 'or_', 'frame_locator', 'get_by_alt_text',
+    'get_by_label', 'get_by_placeholder', 'get_by_role', 'get_by_test_id',
+    'get_by_text', 'get_by_title',
+})
+
+# Call sites are reported relative to ltf2/console_app
+_PACKAGE_DIR = str(Path(__file__).parents[1])
+_ELEMENT_FILES = frozenset({__file__, str(Path(__file__).with_name('elements.py'))})
+
+
+class ActionTiming(NamedTuple):
+    """ Forwarded locator call: `outcome` is 'ok' or the class name of the raised exception """
+    selector: str
+    action: str
+    duration: float
+    outcome: str
+    started: float
+
+
+class TimeoutEvent(NamedTuple):
+    """ TimeoutError raised by the forwarded locator call """
+    site: str
+    selector: str
+    action: str
+    duration: float
+    exception: BaseException
+
+
+class ActionRecorder:
+    """ Records duration of the actions done to page elements (see `PageElement`)
+
+    Recording is off until `start()` is called, so elements are not slowed
+    down when the timings are not collected.
+
+    Example:
+        recorder = get_action_recorder()
+        recorder.start()
+        login_page.login(...)
+        summary = recorder.summary()
+        recorder.stop()
+    """
+    def __init__(self):
+        self.enabled = False
+        self.timings: List[ActionTiming] = []
+        # Timeouts are collected separately by the `timeout_report` plugin
+        self.track_timeouts = False
+        self.timeouts: List[TimeoutEvent] = []
+        # Measured interactions (see `measure_interaction`), always recorded
+        self.interactions: list = []
+
+    def start(self) -> None:
+        self.timings = []
+        self.enabled = True
+
+    def stop(self) -> None:
+        self.enabled = False
+
+    def record(self, selector: str, action: str, duration: float, outcome: str,
+               started: float) -> None:
+        self.timings.append(ActionTiming(selector, action, duration, outcome, started))
+
+    @property
+    def active(self) -> bool:
+        return self.enabled or self.track_timeouts
+
+    def wrap(self, func, selector: str, action: str):
+        """ Wrap locator method to record its timing and timeouts """
+        @wraps(func)
+        def timed(*args, **kwargs):
+            started = time.time()
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                duration = time.perf_counter() - start
+                if self.enabled:
+                    self.record(selector, action, duration, e.__class__.__name__, started)
+                if self.track_timeouts and isinstance(e, PlaywrightTimeoutError):
+                    self.timeouts.append(TimeoutEvent(call_site(), selector, action, duration, e))
+                raise
+            if self.enabled:
+                self.record(selector, action, time.perf_counter() - start, 'ok', started)
+            return result
+        return timed
+
+    def summary(self, top: int = 20) -> dict:
+        """ Total time of the actions, the slowest actions and selectors
+
+        Example:
+            {"count": 42, "total": 12.5,
+             "slowest_actions": [{"selector": "//button", "action": "click",
+                                  "duration": 3.1, "outcome": "ok", ...}, ...],
+             "slowest_selectors": [{"selector": "//button", "count": 3,
+                                    "total": 4.2, "max": 3.1, "errors": 0}, ...],
+             "actions": {"click": {"count": 10, "total": 6.3, "max": 3.1, "errors": 0}, ...}}
+        """
+        by_selector: Dict[str, dict] = defaultdict(_new_stats)
+        by_action: Dict[str, dict] = defaultdict(_new_stats)
+        for t in self.timings:
+            _add_stats(by_selector[t.selector], t)
+            _add_stats(by_action[t.action], t)
+        slowest = sorted(self.timings, key=lambda t: t.duration, reverse=True)[:top]
+        selectors = sorted(by_selector.items(), key=lambda item: item[1]['total'], reverse=True)
+        return {
+            'count': len(self.timings),
+            'total': _round(sum(t.duration for t in self.timings)),
+            'slowest_actions': [{**t._asdict(), 'duration': _round(t.duration)} for t in slowest],
+            'slowest_selectors': [{'selector': selector, **_rounded(stats)}
+                                  for selector, stats in selectors[:top]],
+            'actions': {action: _rounded(stats) for action, stats in
+                        sorted(by_action.items(), key=lambda item: item[1]['total'],
+                               reverse=True)},
+        }
+
+
+def call_site() -> str:
+    """ Code (outside of the elements) that called the element action: `<path>:<line> (<func>)` """
+    frame = sys._getframe(1)
+    while frame.f_back and frame.f_code.co_filename in _ELEMENT_FILES:
+        frame = frame.f_back
+    path = frame.f_code.co_filename
+    if path.startswith(_PACKAGE_DIR):
+        path = os.path.relpath(path, _PACKAGE_DIR)
+    return f'{path}:{frame.f_lineno} ({frame.f_code.co_name})'
+
+
+def _new_stats() -> dict:
+    return {'count': 0, 'total': 0.0, 'max': 0.0, 'errors': 0}
+
+
+def _add_stats(stats: dict, timing: ActionTiming) -> None:
+    stats['count'] += 1
+    stats['total'] += timing.duration
+    stats['max'] = max(stats['max'], timing.duration)
+    stats['errors'] += timing.outcome != 'ok'
+
+
+def _round(value: float) -> float:
+    return round(value, 4)
+
+
+def _rounded(stats: dict) -> dict:
+    return {**stats, 'total': _round(stats['total']), 'max': _round(stats['max'])}
+
+
+_recorder: Optional[ActionRecorder] = None
+
+
+def get_action_recorder() -> ActionRecorder:
+    """ Recorder shared by all elements of the process """
+    global _recorder
+    if _recorder is None:
+        _recorder = ActionRecorder()
+    return _recorder
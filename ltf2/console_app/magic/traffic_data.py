@@ -0,0 +1,220 @@
+""" Synthetic data of the traffic report (BFF `/api/bff/traffic/*` endpoints)
+
+The dataset is generated with NumPy, so production-sized payloads (90 days at
+minute resolution, thousands of routes) are built in a fraction of a second.
+All breakdowns are derived from the same edge requests, so totals are exact
+and consistent: requests of the routes and of the countries sum up to the
+requests of the time series.
+
+The response layout (`{"data": [rows]}` with the fields below) is defined in
+`TrafficDataset.payloads`. It is NOT taken from a real BFF response yet: the
+field names are assumed. Record the traffic tests against the stage property
+(`pytest ltf2/console_app/tests/traffic_report --console-data record`), take
+the layout from the responses stored in `har/.../<test>.json.gz` and note the
+source here. Until then `synthetic_traffic` tests are skipped unless
+`--synthetic-traffic` is given.
+"""
+import json
+import time
+from typing import Callable, Dict, Optional
+
+import numpy as np
+from playwright.sync_api import Page, Route
+
+from ltf2.console_app.magic.constants import (DATA_USAGE_OVERTIME, ERRORS_OVERTIME,
+                                              ORIGINS_COUNTRIES, ORIGINS_OVERTIME,
+                                              TRAFFIC_OVERTIME, TRAFFIC_ROUTES)
+
+
+DAY = 24 * 60 * 60
+
+COUNTRIES = ('US', 'DE', 'GB', 'FR', 'JP', 'IN', 'BR', 'CA', 'AU', 'NL', 'SG', 'KR',
+             'IT', 'ES', 'SE', 'PL', 'MX', 'CN', 'RU', 'UA', 'TR', 'ZA', 'AR', 'CH',
+             'BE', 'AT', 'NO', 'DK', 'FI', 'IE', 'PT', 'CZ', 'IL', 'HK', 'TW', 'ID',
+             'TH', 'VN', 'MY', 'PH', 'NZ', 'CL', 'CO', 'PE', 'EG', 'NG', 'KE', 'SA',
+             'AE', 'RO', 'HU', 'GR', 'BG', 'RS', 'HR', 'SK', 'LT', 'LV', 'EE', 'IS')
+
+
+def zipf_weights(n: int, s: float = 1.1) -> np.ndarray:
+    """ Shares of `n` items with Zipf-like popularity (a few items get most of the traffic) """
+    weights = 1.0 / np.arange(1, n + 1) ** s
+    return weights / weights.sum()
+
+
+class TrafficDataset:
+    """ Synthetic traffic of the property
+
+    Args:
+        days: length of the time series (fractions are allowed, 1/24 is one hour)
+        resolution: step of the time series (sec)
+        routes: number of the routes (rules)
+        origins: number of the origins
+        countries: number of the countries (max `len(COUNTRIES)`)
+        requests_per_step: mean edge requests per step at the daily peak
+        end: end of the time series (unix time, sec), now by default
+        seed: seed of the random generator, the same seed gives the same data
+
+    Example:
+        dataset = TrafficDataset(days=90, routes=5000, end=1700000000)
+        dataset.totals['edge_requests']  # exact total of the series
+    """
+    def __init__(self,
+                 days: float = 30,
+                 resolution: int = 60,
+                 routes: int = 100,
+                 origins: int = 3,
+                 countries: int = 30,
+                 requests_per_step: float = 1000,
+                 end: Optional[int] = None,
+                 seed: int = 0):
+        self.resolution = resolution
+        end = int(time.time() if end is None else end) // resolution * resolution
+        steps = max(int(days * DAY / resolution), 1)
+        self.rng = np.random.default_rng(seed)
+        # Time series
+        self.timestamps = np.arange(end - (steps - 1) * resolution, end + 1, resolution,
+                                    dtype=np.int64)
+        day_phase = 2 * np.pi * (self.timestamps % DAY) / DAY
+        week_factor = np.where((self.timestamps // DAY + 4) % 7 >= 5, 0.7, 1.0)
+        rate = (requests_per_step * week_factor * (0.6 + 0.4 * np.sin(day_phase - np.pi / 2))
+                * self.rng.lognormal(0, 0.1, steps))
+        self.edge_requests = self.rng.poisson(rate).astype(np.int64)
+        hit_rate = self.rng.beta(18, 2, steps)
+        self.origin_requests = self.rng.binomial(self.edge_requests, 1 - hit_rate)
+        self.edge_bytes = (self.edge_requests
+                           * self.rng.lognormal(np.log(30_000), 0.2, steps)).astype(np.int64)
+        self.origin_bytes = (self.origin_requests
+                             * self.rng.lognormal(np.log(40_000), 0.2, steps)).astype(np.int64)
+        self.errors_5xx = self.rng.binomial(self.edge_requests, 0.002)
+        self.errors_4xx = self.rng.binomial(self.edge_requests - self.errors_5xx, 0.01)
+        # Origin latency (ms) of every origin and step
+        self.origins = [f'origin-{i}.example.com' for i in range(origins)]
+        self.origin_ttfb = self.rng.lognormal(np.log(80), 0.3, (origins, steps)).round(1)
+        self.origin_response_time = (self.origin_ttfb
+                                     + self.rng.lognormal(np.log(40), 0.5, (origins, steps))).round(1)
+        # Breakdowns of the total edge requests
+        total_requests = int(self.edge_requests.sum())
+        self.routes = [f'/route/{i}' for i in range(routes)]
+        self.route_requests = self.rng.multinomial(total_requests, zipf_weights(routes))
+        self.route_ttfb = self.rng.lognormal(np.log(60), 0.5, routes).round(1)
+        self.route_response_time = (self.route_ttfb
+                                    + self.rng.lognormal(np.log(30), 0.5, routes)).round(1)
+        self.countries = list(COUNTRIES[:countries])
+        country_shares = zipf_weights(len(self.countries), s=1.3)
+        self.country_requests = self.rng.multinomial(total_requests, country_shares)
+        self.country_origin_requests = self.rng.multinomial(int(self.origin_requests.sum()),
+                                                            country_shares)
+        self.country_bytes = self.rng.multinomial(int(self.edge_bytes.sum()), country_shares)
+        self.country_errors = self.rng.multinomial(
+            int(self.errors_4xx.sum() + self.errors_5xx.sum()), country_shares)
+        self.country_ttfb = self.rng.lognormal(np.log(80), 0.3, len(self.countries)).round(1)
+        self.country_response_time = (self.country_ttfb + self.rng.lognormal(
+            np.log(40), 0.5, len(self.countries))).round(1)
+
+    @property
+    def totals(self) -> Dict[str, int]:
+        """ Exact totals of the time series """
+        return {'edge_requests': int(self.edge_requests.sum()),
+                'origin_requests': int(self.origin_requests.sum()),
+                'edge_bytes': int(self.edge_bytes.sum()),
+                'origin_bytes': int(self.origin_bytes.sum()),
+                'errors_4xx': int(self.errors_4xx.sum()),
+                'errors_5xx': int(self.errors_5xx.sum())}
+
+    @staticmethod
+    def data_json(**columns) -> str:
+        """ `{"data": [rows]}` JSON of the columns (numpy arrays or lists of the same length)
+
+        Rows are formatted with one template, no dicts are built for millions of values.
+        """
+        template = '{{' + ','.join(f'"{name}":{{}}' for name in columns) + '}}'
+        values = [c.tolist() if isinstance(c, np.ndarray) else c for c in columns.values()]
+        values = [[json.dumps(v) for v in column] if column and isinstance(column[0], str)
+                  else column for column in values]
+        return '{"data":[' + ','.join(map(template.format, *values)) + ']}'
+
+    def payloads(self) -> Dict[str, Callable[[], str]]:
+        """ Builders of the JSON response of every endpoint (url glob) """
+        ts_ms = self.timestamps * 1000
+        steps = len(self.timestamps)
+        return {
+            TRAFFIC_OVERTIME: lambda: self.data_json(
+                timestamp=ts_ms,
+                edge_requests=self.edge_requests,
+                origin_requests=self.origin_requests,
+                edge_bytes=self.edge_bytes,
+                origin_bytes=self.origin_bytes,
+                edge_requests_rate=(self.edge_requests / self.resolution).round(3),
+                origin_requests_rate=(self.origin_requests / self.resolution).round(3),
+                edge_throughput=(self.edge_bytes * 8 / self.resolution).round(1),
+                origin_throughput=(self.origin_bytes * 8 / self.resolution).round(1)),
+            DATA_USAGE_OVERTIME: lambda: self.data_json(
+                timestamp=ts_ms,
+                edge_bytes=self.edge_bytes,
+                origin_bytes=self.origin_bytes),
+            ERRORS_OVERTIME: lambda: self.data_json(
+                timestamp=ts_ms,
+                status_4xx=self.errors_4xx,
+                status_5xx=self.errors_5xx),
+            # Aggregated over the origins: one row per timestamp like the other series,
+            # instead of `steps * origins` rows (1.3M rows for 90 days and 10 origins)
+            ORIGINS_OVERTIME: lambda: self.data_json(
+                timestamp=ts_ms,
+                origins=[len(self.origins)] * steps,
+                ttfb=self.origin_ttfb.mean(axis=0).round(1),
+                response_time=self.origin_response_time.mean(axis=0).round(1)),
+            TRAFFIC_ROUTES: lambda: self.data_json(
+                route=self.routes,
+                requests=self.route_requests,
+                ttfb=self.route_ttfb,
+                response_time=self.route_response_time),
+            ORIGINS_COUNTRIES: lambda: self.data_json(
+                country=self.countries,
+                bytes=self.country_bytes,
+                origin_requests=self.country_origin_requests,
+                errors=self.country_errors,
+                origin_ttfb=self.country_ttfb,
+                response_time=self.country_response_time,
+                cache_hit_rate=(1 - self.country_origin_requests
+                                / np.maximum(self.country_requests, 1)).round(4)),
+        }
+
+
+class TrafficDataMock:
+    """ Serve the dataset instead of the BFF traffic endpoints of the page
+
+    Bodies are serialized on the first request of the endpoint and cached.
+
+    Example:
+        mock = TrafficDataMock(page, TrafficDataset(days=90, routes=5000))
+        traffic_page.soft_goto()
+        ...
+        mock.detach()
+    """
+    def __init__(self, page: Page, dataset: TrafficDataset):
+        self.page = page
+        self.dataset = dataset
+        self._builders = dataset.payloads()
+        self._bodies: Dict[str, bytes] = {}
+        self._handlers = {url: self._handler(url) for url in self._builders}
+        for url, handler in self._handlers.items():
+            self.page.route(url, handler)
+
+    def body(self, url: str) -> bytes:
+        if url not in self._bodies:
+            self._bodies[url] = self._builders[url]().encode()
+        return self._bodies[url]
+
+    def json(self, url: str) -> dict:
+        """ Response of the endpoint, as the page receives it """
+        return json.loads(self.body(url))
+
+    def _handler(self, url: str) -> Callable[[Route], None]:
+        def handle(route: Route) -> None:
+            route.fulfill(status=200, content_type='application/json', body=self.body(url))
+        return handle
+
+    def detach(self) -> None:
+        for url, handler in self._handlers.items():
+            self.page.unroute(url, handler)
+        self._handlers = {}
@@ -0,0 +1,209 @@
+""" Expected values of the traffic report computed from the BFF responses
+
+Responses of the BFF traffic endpoints are captured from the page, turned
+into NumPy columns and aggregated (totals, averages, percentiles). Rendered
+summaries are parsed into quantities and compared with the expected values
+with the tolerance of the displayed precision.
+
+Field names of the responses are the same as served by `TrafficDataset`
+(see `traffic_data.py`), metrics of the page are mapped to them below. The
+checks are meant for `synthetic_traffic` tests, where the layout is known.
+"""
+import re
+import time
+from fnmatch import fnmatch
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import numpy as np
+from playwright.sync_api import Page, Response
+
+from ltf2.console_app.magic.constants import (DATA_USAGE_OVERTIME, ERRORS_OVERTIME,
+                                              ORIGINS_COUNTRIES, ORIGINS_OVERTIME, PAGE_TIMEOUT,
+                                              TRAFFIC_OVERTIME, TRAFFIC_ROUTES)
+from ltf2.console_app.magic.elements import PageElement
+
+
+TRAFFIC_ENDPOINTS = (TRAFFIC_OVERTIME, DATA_USAGE_OVERTIME, ERRORS_OVERTIME,
+                     ORIGINS_OVERTIME, TRAFFIC_ROUTES, ORIGINS_COUNTRIES)
+
+# Multipliers of the displayed units to the base unit of the kind of quantity
+UNITS = {
+    'bytes': {'B': 1, 'KB': 1e3, 'MB': 1e6, 'GB': 1e9, 'TB': 1e12, 'PB': 1e15},
+    'bits': {'bps': 1, 'Kbps': 1e3, 'Mbps': 1e6, 'Gbps': 1e9, 'Tbps': 1e12},
+    'rate': {'': 1, 'rps': 1, 'req/s': 1, 'K': 1e3, 'Krps': 1e3, 'M': 1e6, 'Mrps': 1e6},
+    'count': {'': 1, 'K': 1e3, 'M': 1e6, 'B': 1e9},
+    'ms': {'ms': 1, 's': 1e3, '': 1},
+    'percent': {'%': 1, '': 1},
+}
+
+# Labels of the aggregations in the summaries
+SUMMARY_LABELS = {'total': 'Total:', 'average': 'Average:'}
+
+QUANTITY_RE = re.compile(r'(?P<value>[-+]?\d[\d,]*(?:\.(?P<decimals>\d+))?)\s*(?P<unit>[A-Za-z/%]*)')
+
+
+class Metric(NamedTuple):
+    """ Value of the page computed from the endpoint field
+
+    Args:
+        endpoint: url glob of the BFF endpoint
+        field: field of the response rows
+        aggregate: total, average, max or percentile (p50, p75, p95, p99)
+        kind: kind of the quantity (key of UNITS)
+    """
+    endpoint: str
+    field: str
+    aggregate: str
+    kind: str
+
+
+MAIN_CHART_METRICS = {
+    'Data Transferred Edge': Metric(TRAFFIC_OVERTIME, 'edge_bytes', 'total', 'bytes'),
+    'Data Transferred Origin': Metric(TRAFFIC_OVERTIME, 'origin_bytes', 'total', 'bytes'),
+    'Throughput Edge': Metric(TRAFFIC_OVERTIME, 'edge_throughput', 'average', 'bits'),
+    'Throughput Origin': Metric(TRAFFIC_OVERTIME, 'origin_throughput', 'average', 'bits'),
+    'Requests Rate Edge': Metric(TRAFFIC_OVERTIME, 'edge_requests_rate', 'average', 'rate'),
+    'Requests Rate Origin': Metric(TRAFFIC_OVERTIME, 'origin_requests_rate', 'average', 'rate'),
+}
+
+
+class Quantity(NamedTuple):
+    """ Displayed number: value in the base unit and its precision (half of the last digit) """
+    value: float
+    precision: float
+
+
+def parse_quantity(text: str, kind: str) -> Quantity:
+    """ Parse displayed quantity, e.g. `2.18 TB` (bytes) or `1,024 req/s` (rate)
+
+    Example:
+        parse_quantity('Total: 2.18 TB', 'bytes')
+        # Quantity(value=2180000000000.0, precision=5000000000.0)
+    """
+    match = QUANTITY_RE.search(text)
+    if match is None:
+        raise ValueError(f'No quantity in `{text}`')
+    units = UNITS[kind]
+    unit = match['unit']
+    if unit not in units:
+        raise ValueError(f'Unknown unit `{unit}` of {kind} in `{text}`, supported: {list(units)}')
+    multiplier = units[unit]
+    decimals = len(match['decimals'] or '')
+    return Quantity(float(match['value'].replace(',', '')) * multiplier,
+                    0.5 * 10 ** -decimals * multiplier)
+
+
+def aggregate(values: np.ndarray, how: str) -> float:
+    if how == 'total':
+        return float(values.sum())
+    if how == 'average':
+        return float(values.mean())
+    if how == 'max':
+        return float(values.max())
+    if how.startswith('p'):
+        return float(np.percentile(values, float(how[1:])))
+    raise ValueError(f'Unknown aggregation `{how}`')
+
+
+def columns_of(rows: List[dict]) -> Dict[str, Union[np.ndarray, list]]:
+    """ Response rows as columns: numeric fields are numpy arrays, the rest are lists """
+    if not rows:
+        return {}
+    columns = {}
+    for field, sample in rows[0].items():
+        values = map(itemgetter(field), rows)
+        if isinstance(sample, (int, float)) and not isinstance(sample, bool):
+            columns[field] = np.fromiter(values, dtype=float, count=len(rows))
+        else:
+            columns[field] = list(values)
+    return columns
+
+
+class TrafficExpectations:
+    """ Compare the traffic report with the BFF responses received by the page
+
+    The latest response of every traffic endpoint is kept; it is parsed only
+    when a value is checked.
+
+    Args:
+        page: playwright Page instance
+        rtol: relative tolerance added to the displayed precision
+
+    Example:
+        expectations = TrafficExpectations(page)
+        traffic_page.goto()
+        expectations.expect_summary('Data Transferred Edge', traffic_page.traffic_main_chart_summary)
+    """
+    def __init__(self, page: Page, rtol: float = 0.001):
+        self.page = page
+        self.rtol = rtol
+        self.responses: Dict[str, Response] = {}
+        self._columns: Dict[str, Tuple[Response, dict]] = {}
+        self.page.on('response', self._on_response)
+
+    def _on_response(self, response: Response) -> None:
+        path = urlsplit(response.url).path
+        for endpoint in TRAFFIC_ENDPOINTS:
+            if fnmatch(path, endpoint):
+                self.responses[endpoint] = response
+
+    def detach(self) -> None:
+        self.page.remove_listener('response', self._on_response)
+
+    def columns(self, endpoint: str) -> Dict[str, Union[np.ndarray, list]]:
+        """ Columns of the latest response of the endpoint """
+        response = self.responses.get(endpoint)
+        if response is None:
+            raise AssertionError(f'No response of {endpoint} was received')
+        cached = self._columns.get(endpoint)
+        if cached is None or cached[0] is not response:
+            cached = (response, columns_of(response.json()['data']))
+            self._columns[endpoint] = cached
+        return cached[1]
+
+    def expected(self, metric: Metric) -> float:
+        columns = self.columns(metric.endpoint)
+        if metric.field not in columns:
+            raise AssertionError(f'No `{metric.field}` in {metric.endpoint}: {list(columns)}')
+        return aggregate(columns[metric.field], metric.aggregate)
+
+    def is_close(self, expected: Union[float, np.ndarray],
+                 actual: Union[Quantity, np.ndarray],
+                 precision: Optional[np.ndarray] = None) -> Union[bool, np.ndarray]:
+        """ Expected value rounded to the displayed precision (and `rtol`) equals the actual """
+        if isinstance(actual, Quantity):
+            actual, precision = actual
+        return np.abs(expected - actual) <= precision + self.rtol * np.abs(expected)
+
+    def check_summary(self, name: str, text: str,
+                      metrics: Dict[str, Metric] = MAIN_CHART_METRICS) -> None:
+        """ Check the summary of the chart (e.g. `Total: 2.18 TB`) for the selected metric """
+        metric = metrics[name]
+        label = SUMMARY_LABELS.get(metric.aggregate)
+        assert label is None or text.split()[0] == label, \
+            f'{name}: summary `{text}` should start with `{label}`'
+        expected = self.expected(metric)
+        actual = parse_quantity(text, metric.kind)
+        assert self.is_close(expected, actual), \
+            f'{name}: summary `{text}` ({actual.value}) differs from {metric.aggregate} ' \
+            f'{expected} of `{metric.field}` in {metric.endpoint}'
+
+    def expect_summary(self, name: str, element: PageElement,
+                       metrics: Dict[str, Metric] = MAIN_CHART_METRICS,
+                       timeout: float = PAGE_TIMEOUT) -> None:
+        """ Wait until the summary element shows the expected value (see `check_summary`)
+
+        The chart is re-rendered after the metric is selected, so the summary of
+        the previous metric can be read right after the click.
+        """
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            try:
+                self.check_summary(name, element.inner_text(), metrics)
+                return
+            except AssertionError:
+                if time.monotonic() >= deadline:
+                    raise
+            self.page.wait_for_timeout(100)
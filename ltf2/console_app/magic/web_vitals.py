@@ -0,0 +1,246 @@
+""" Front-end performance metrics of the console pages
+
+Every navigation of a page object (`BasePage.goto` / `soft_goto`) is recorded
+with the metrics of the document collected in the browser:
+
+    navigation: Navigation Timing of the loaded document (ms from the start)
+    fcp, lcp: First / Largest Contentful Paint (ms)
+    cls: Cumulative Layout Shift (the largest session window)
+    inp: Interaction to Next Paint (ms) of the interactions done by the test
+    long_tasks: count, total and max duration (ms) of the main thread tasks > 50 ms
+    heap: used and total JS heap size (bytes, Chromium only)
+    requests: count of the requests by initiator type and transferred bytes
+
+Metrics of a navigation are collected when the page object navigates again
+or is detached, so they cover the whole time the test spent on the page.
+Soft navigations (the app router) have no Navigation Timing and LCP, their
+metrics include only the entries after the navigation started.
+"""
+import logging
+import statistics
+import time
+import weakref
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Error, Page
+
+
+HARD = 'hard'
+SOFT = 'soft'
+
+# Installs the performance observers of the document (once), entries are kept
+# in `window.__ltfPerf` as [startTime, ...] arrays
+OBSERVER_JS = """() => {
+    if (window.__ltfPerf) {
+        return;
+    }
+    const perf = window.__ltfPerf = {lcp: [], shifts: [], longTasks: [], events: []};
+    performance.setResourceTimingBufferSize(10000);
+    const observe = (type, handler, options) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(handler))
+                .observe({type, buffered: true, ...options});
+        } catch (e) {}  // entry type is not supported by the browser
+    };
+    observe('largest-contentful-paint', e => perf.lcp.push([e.startTime]));
+    observe('layout-shift', e => e.hadRecentInput || perf.shifts.push([e.startTime, e.value]));
+    observe('longtask', e => perf.longTasks.push([e.startTime, e.duration]));
+    observe('event', e => e.interactionId && perf.events.push([e.startTime, e.duration, e.interactionId]),
+            {durationThreshold: 16});
+}"""
+
+# Metrics of the entries since `since` (performance.now() of the soft navigation, 0 for the document)
+COLLECT_JS = """since => {
+    const perf = window.__ltfPerf || {lcp: [], shifts: [], longTasks: [], events: []};
+    const after = entries => entries.filter(e => e[0] >= since);
+    const round = value => Math.round(value * 10) / 10;
+    // CLS: the largest session window of layout shifts (1 s gap, 5 s max)
+    let cls = 0, session = 0, first = 0, last = 0;
+    for (const [start, value] of after(perf.shifts)) {
+        if (session && (start - last > 1000 || start - first > 5000)) {
+            session = 0;
+        }
+        if (!session) {
+            first = start;
+        }
+        session += value;
+        last = start;
+        cls = Math.max(cls, session);
+    }
+    // INP: the longest interaction, one highest interaction per 50 is ignored
+    const interactions = {};
+    for (const [, duration, id] of after(perf.events)) {
+        interactions[id] = Math.max(interactions[id] || 0, duration);
+    }
+    const latencies = Object.values(interactions).sort((a, b) => b - a);
+    const lcp = after(perf.lcp);
+    const tasks = after(perf.longTasks).map(e => e[1]);
+    const requests = {total: 0, transfer_size: 0};
+    for (const r of performance.getEntriesByType('resource')) {
+        if (r.startTime >= since) {
+            requests.total += 1;
+            requests[r.initiatorType] = (requests[r.initiatorType] || 0) + 1;
+            requests.transfer_size += r.transferSize || 0;
+        }
+    }
+    const nav = since ? undefined : performance.getEntriesByType('navigation')[0];
+    const paint = since ? undefined : performance.getEntriesByName('first-contentful-paint')[0];
+    const memory = performance.memory;
+    return {
+        now: performance.now(),
+        navigation: nav ? {ttfb: round(nav.responseStart),
+                           dom_interactive: round(nav.domInteractive),
+                           dom_content_loaded: round(nav.domContentLoadedEventEnd),
+                           load: round(nav.loadEventEnd),
+                           transfer_size: nav.transferSize} : null,
+        fcp: paint ? round(paint.startTime) : null,
+        lcp: lcp.length ? round(lcp[lcp.length - 1][0] - since) : null,
+        cls: Math.round(cls * 10000) / 10000,
+        inp: latencies.length ? latencies[Math.min(Math.floor(latencies.length / 50),
+                                                   latencies.length - 1)] : null,
+        interactions: latencies.length,
+        long_tasks: {count: tasks.length,
+                     total: round(tasks.reduce((a, b) => a + b, 0)),
+                     max: round(Math.max(0, ...tasks))},
+        heap: memory ? {used: memory.usedJSHeapSize, total: memory.totalJSHeapSize} : null,
+        requests,
+    };
+}"""
+
+# Metrics summarized by page type (medians of the navigations)
+SUMMARY_METRICS = ('duration', 'fcp', 'lcp', 'cls', 'inp', 'long_tasks.total', 'heap.used',
+                   'requests.total')
+
+
+def page_type(page_object) -> str:
+    """ Type of the page object, e.g. `Traffic` for TrafficPage """
+    name = page_object.__class__.__name__
+    return name[:-len('Page')] if name.endswith('Page') and name != 'Page' else name
+
+
+class WebVitalsCollector:
+    """ Records performance metrics of the navigations of page objects
+
+    Collecting is off until `start()` is called, then `BasePage` reports its
+    navigations with `leave()` (before) and `enter()` (after).
+
+    Example:
+        collector = get_web_vitals_collector()
+        collector.start()
+        traffic_page.soft_goto()
+        ...
+        traffic_page.detach()
+        records = collector.stop()
+    """
+    def __init__(self):
+        self.enabled = False
+        self.records: List[dict] = []
+        self._pending: Dict[Page, dict] = weakref.WeakKeyDictionary()
+        self._instrumented = weakref.WeakSet()
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def start(self) -> None:
+        self.records = []
+        self._pending.clear()
+        self.enabled = True
+
+    def stop(self) -> List[dict]:
+        """ Collect the navigations that are not finished yet and stop collecting """
+        for page in list(self._pending):
+            self._finish(page)
+        self.enabled = False
+        return self.records
+
+    def _instrument(self, page: Page) -> None:
+        if page not in self._instrumented:
+            page.add_init_script(f'({OBSERVER_JS})()')
+            self._instrumented.add(page)
+        # The document could be loaded before the init script was added
+        page.evaluate(OBSERVER_JS)
+
+    def _finish(self, page: Page) -> Optional[float]:
+        """ Collect metrics of the pending navigation, return performance.now() of the page """
+        pending = self._pending.pop(page, None)
+        if pending is None:
+            return None
+        try:
+            metrics = page.evaluate(COLLECT_JS, pending['since'])
+        except Error as e:
+            self.log.debug(f'Metrics of {pending["url"]} were not collected: {e}')
+            return None
+        now = metrics.pop('now')
+        self.records.append({**pending, **metrics, 'time_on_page': round(now - pending['since'])})
+        return now
+
+    def leave(self, page_object) -> float:
+        """ Called before the navigation: finish the current one
+
+        Returns:
+            performance.now() of the document: start of the soft navigation
+        """
+        now = self._finish(page_object.page)
+        if now is None:
+            try:
+                now = page_object.page.evaluate('performance.now()')
+            except Error:
+                now = 0
+        return now
+
+    def enter(self, page_object, url: str, kind: str, duration: float, since: float = 0) -> None:
+        """ Called after the navigation
+
+        Args:
+            page_object: BasePage instance
+            url: navigated url
+            kind: `hard` (page load) or `soft` (app router)
+            duration: time of the navigation call (sec)
+            since: performance.now() at the start of the soft navigation
+        """
+        page = page_object.page
+        try:
+            self._instrument(page)
+        except Error as e:
+            self.log.debug(f'Performance observers were not installed to {url}: {e}')
+            return
+        self._pending[page] = {'page': page_type(page_object),
+                               'url': url,
+                               'kind': kind,
+                               'started': time.time() - duration,
+                               'duration': round(duration * 1000),
+                               'since': 0 if kind == HARD else since}
+
+    def summary(self) -> Dict[str, dict]:
+        """ Medians of the metrics of the navigations by page type and kind
+
+        Example:
+            {"Traffic soft": {"count": 2, "duration": 640, "lcp": null, "cls": 0.01, ...}}
+        """
+        groups = defaultdict(list)
+        for record in self.records:
+            groups[f'{record["page"]} {record["kind"]}'].append(record)
+        summary = {}
+        for group, records in sorted(groups.items()):
+            summary[group] = {'count': len(records)}
+            for metric in SUMMARY_METRICS:
+                values = [v for v in (_value(r, metric) for r in records) if v is not None]
+                summary[group][metric] = statistics.median(values) if values else None
+        return summary
+
+
+def _value(record: dict, metric: str):
+    """ Value of the dotted metric name, e.g. `heap.used` """
+    for key in metric.split('.'):
+        record = record.get(key) if isinstance(record, dict) else None
+    return record
+
+
+_collector: Optional[WebVitalsCollector] = None
+
+
+def get_web_vitals_collector() -> WebVitalsCollector:
+    """ Collector shared by all page objects of the process """
+    global _collector
+    if _collector is None:
+        _collector = WebVitalsCollector()
+    return _collector
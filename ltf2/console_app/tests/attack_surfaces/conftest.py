@@ -1,11 +1,12 @@
-from typing import Generator
+import os
+import socket
+from typing import Generator, Union
 from urllib.parse import urljoin
 
 import pytest
-import requests
-from playwright.sync_api import TimeoutError
 from playwright.sync_api import Page
 
+from ltf2.console_app.exposure.client import ExposureClient
 from ltf2.console_app.magic.constants import PAGE_TIMEOUT
 from ltf2.console_app.magic.pages.pages import AttackSurfacesPage
 
@@ -22,43 +23,72 @@ def cleanup(collections_page, base_url, ltfrc_console_app):
         collections_page.remove_collection(c)
 
 
+@pytest.fixture(scope='session')
+def exposure_client(ltfrc_console_app) -> Generator[ExposureClient, None, None]:
+    """ Client of the exposure service, owner of the exposures is this pytest process.
+
+    Exposures are stopped at the end of the session.
+    """
+    client = ExposureClient(
+        f'http://{ltfrc_console_app["exposure_service_ip"]}:'
+        f'{ltfrc_console_app["exposure_service_port"]}',
+        owner=f'{socket.gethostname()}-{os.getpid()}',
+    )
+    yield client
+    client.clear()
+    client.close()
+
+
 @pytest.fixture
-def open_port(ltfrc_console_app):
-    exposure_svc = f'http://{ltfrc_console_app["exposure_service_ip"]}:{ltfrc_console_app["exposure_service_port"]}'
+def open_port(exposure_client):
+    """ Open ports on the exposure service.
+
+    The service is reconciled with the ports of the test: listeners of the
+    previous test with the same spec are reused, the rest are stopped.
+    """
+    specs = []
 
-    def _open_port(p_type: str, port: int, tls: str = ""):
+    def _open_port(p_type: str, port: Union[int, str], tls: Union[str, dict] = ""):
         # p_type: nc, http
-        # tls: any cert name of exposure/certs folder (without extension)
-        r = requests.post(
-            exposure_svc,
-            json=[
-                {"type": p_type, "port": port, "cert": tls},
-            ],
-        )
-        r.raise_for_status()
+        # port: port or range of ports (e.g. "10000-11000")
+        # tls: any cert name of exposure/certs folder (without extension) or cert spec
+        specs.append({"type": p_type, "port": port, "cert": tls})
+        exposure_client.reconcile(specs)
+        # The listener may be kept from the previous test, count only hits of this test
+        exposure_client.reset_hits(port)
     yield _open_port
-    requests.get(f'{exposure_svc}/clear')
+
+
+@pytest.fixture
+def wait_port_hits(exposure_client):
+    """ Wait until the exposed ports get `count` hits (connections/requests) from the scanner
+
+    Return hits of the ports, raise AssertionError if they were not received in time.
+    """
+    def _wait_port_hits(ports: Union[int, str, list], count: int = 1, kind: str = 'connections',
+                        timeout: float = 120) -> dict:
+        result = exposure_client.wait_hits(ports, count, kind, timeout)
+        assert result['reached'], f'Ports {ports} got less than {count} {kind}: {result["hits"]}'
+        return result['hits']
+    yield _wait_port_hits
 
 
 # =============== Pages ======================
 
 @pytest.fixture
 def attack_surfaces_logged(
-        use_login_state: dict,
-        page: Page,
+        warm_page: Page,
         base_url: str,
         ltfrc_console_app) -> Generator[AttackSurfacesPage, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
-    main_page = AttackSurfacesPage(page, url=urljoin(base_url, ltfrc_console_app['team']))
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
+    main_page = AttackSurfacesPage(warm_page, url=urljoin(base_url, ltfrc_console_app['team']))
     main_page.goto()
     # main_page.attack_surfaces.click()
     # Close the status banner if present
-    try:
-        main_page.status_snackbar_close.click(timeout=1500)
-    except TimeoutError:
-        print('Status banner not found')
+    main_page.close_status_snackbar()
     yield main_page
+    main_page.detach()
 
 
 @pytest.fixture
@@ -12,7 +12,8 @@ def reset_rules_to_default(rules_page):
 
 
 @pytest.mark.regression
-def test_bat(reset_rules_to_default, collections_page, cleanup, ltfrc_console_app, open_port):
+def test_bat(reset_rules_to_default, collections_page, cleanup, ltfrc_console_app, open_port,
+             wait_port_hits):
     """Attack Surfaces - BAT 1"""
     target_ip = ltfrc_console_app['exposure_service_ip']
     opened_port = 5900
@@ -28,6 +29,8 @@ def test_bat(reset_rules_to_default, collections_page, cleanup, ltfrc_console_ap
     collections_page.add_seed(seed_type='IP Address', seed=target_ip)
 
     collections_page.coll_scan_now_btn.click()
+    # Scanner reached the exposed port
+    wait_port_hits(opened_port, timeout=120)
     # expect(collections_page.coll_scan_now_btn._locator, 'Scan was not complete').to_be_enabled(timeout=120*1000)
     collections_page.collections.click()
     collections_page.open_collection(coll_name)
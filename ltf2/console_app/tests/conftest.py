@@ -1,28 +1,39 @@
 from __future__ import annotations
 
+import json
 import pickle
 
 import os
+import re
 import time
 from collections import namedtuple
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
 from urllib.parse import urljoin
 
+import allure
 import pytest
 from ltf2.util import comparators
 from ltf2.util.config import get_ltfrc_section
-from playwright.sync_api import Browser, Page, TimeoutError
+from playwright.sync_api import Browser, Page
 # Explicitly import to avoid using the `context` fixture from ltf2.utils
 from pytest_playwright.pytest_playwright import context
 from requests.structures import CaseInsensitiveDict
 
+from ltf2.console_app.magic.api import ConsoleApi
 from ltf2.console_app.magic.constants import PAGE_TIMEOUT
+from ltf2.console_app.magic.context_pool import ContextPool
+from ltf2.console_app.magic.helpers import pickle_dump_atomic, worker_id, worker_index
 from ltf2.console_app.magic.pages.pages import (ExperimentsPage, LoginPage,
                                                 OrgPage, PropertyPage,
                                                 TrafficPage, RedirectsPage,
                                                 OriginsPage, EnvironmentVariablesPage,
                                                 OrgActivityPage, WebPropertyPage)
+from ltf2.console_app.magic.replay import RECORD, REPLAY, ConsoleRecorder, ExchangeStore
+from ltf2.console_app.magic.timing import get_action_recorder
+from ltf2.console_app.magic.traffic_data import TrafficDataMock, TrafficDataset
+from ltf2.console_app.magic.traffic_expect import TrafficExpectations
+from ltf2.console_app.magic.web_vitals import get_web_vitals_collector
 
 Credentials = namedtuple('Credentials', 'users password')
 
@@ -35,6 +46,161 @@ REDIRECTS_URL_PATH = f"{ENV_URL_PATH}redirects"
 ORIGINS_URL_PATH = f"{ENV_URL_PATH}configuration/origins"
 ENV_VARIABLE_URL_PATH = f"{ENV_URL_PATH}variables"
 
+# Page fixtures that change the state of the shared property.
+# Tests that use them are sent to the same xdist worker (`--dist loadgroup`)
+SHARED_PROPERTY_FIXTURES = ('property_page', 'experiment_page', 'redirect_page',
+                            'origins_page', 'env_variable_page')
+
+
+def pytest_collection_modifyitems(config, items):
+    """ Keep tests that change the shared property on one pytest-xdist worker
+
+    `synthetic_traffic` tests are skipped without `--synthetic-traffic`.
+    """
+    skip_synthetic = pytest.mark.skip(reason='Synthetic traffic tests need --synthetic-traffic')
+    for item in items:
+        if set(SHARED_PROPERTY_FIXTURES) & set(getattr(item, 'fixturenames', ())):
+            item.add_marker(pytest.mark.xdist_group('shared-property'))
+        if (not config.getoption('--synthetic-traffic')
+                and item.get_closest_marker('synthetic_traffic')):
+            item.add_marker(skip_synthetic)
+
+
+def pytest_addoption(parser):
+    parser.addoption('--context-pool', action='store_true', default=False,
+                     help='Reuse warm browser contexts between tests instead of creating '
+                          'a new context for every test. Ignored if screenshots, video or '
+                          'tracing of pytest-playwright are enabled')
+    parser.addoption('--action-timings', nargs='?', const='', default=None, metavar='DIR',
+                     help='Time actions done to page elements and attach the slowest '
+                          'of them to the allure report of every test. If DIR is '
+                          'specified, JSON files are also saved there')
+    parser.addoption('--web-vitals', nargs='?', const='', default=None, metavar='DIR',
+                     help='Collect performance metrics (Navigation Timing, Web Vitals, long '
+                          'tasks, JS heap, requests) of every page navigation and attach them '
+                          'to the allure report of every test. If DIR is specified, JSON files '
+                          'are also saved there')
+    parser.addoption('--interaction-timings', default=None, metavar='DIR',
+                     help='Save latencies of the timed interactions (`timed_click`, ...) '
+                          'of every test as JSON files into DIR')
+    parser.addoption('--console-data', choices=[RECORD, REPLAY], default=None,
+                     help='Record GraphQL and BFF exchanges of the tests or replay them '
+                          'from the recorded store instead of the backend')
+    parser.addoption('--console-data-dir', default=None, metavar='DIR',
+                     help='Store of the recorded exchanges (`har` folder next to the '
+                          'tests by default)')
+    parser.addoption('--synthetic-traffic', action='store_true', default=False,
+                     help='Run `synthetic_traffic` tests. The response layout of '
+                          '`TrafficDataset` is not verified against the BFF yet, so they '
+                          'are skipped by default')
+
+
+def use_context_pool(config) -> bool:
+    """ Whether `--context-pool` is enabled and no pytest-playwright artifacts are requested """
+    if not config.getoption('--context-pool'):
+        return False
+    return all(config.getoption(option, 'off') == 'off'
+               for option in ('--screenshot', '--video', '--tracing'))
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """ Save report of every test phase in the item (`item.rep_call`, ...) """
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f'rep_{report.when}', report)
+
+
+def _attach_json(request, name: str, payload: dict, out_dir: Optional[str]) -> None:
+    """ Attach `payload` of the test to the allure report and save it into `out_dir` (if set) """
+    result = json.dumps({'test': request.node.nodeid, **payload}, indent=2)
+    allure.attach(result, name=name, attachment_type=allure.attachment_type.JSON)
+    if out_dir:
+        path = Path(out_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        file_name = re.sub(r'[^\w.-]+', '_', request.node.nodeid)
+        (path / f'{file_name}.json').write_text(result)
+
+
+@pytest.fixture(autouse=True)
+def action_timings(request) -> Generator[None, None, None]:
+    """ Summary of the page element actions of the test (with `--action-timings`) """
+    timings_dir = request.config.getoption('--action-timings')
+    if timings_dir is None:
+        yield
+        return
+    recorder = get_action_recorder()
+    recorder.start()
+    yield
+    recorder.stop()
+    _attach_json(request, 'action timings', recorder.summary(), timings_dir)
+
+
+@pytest.fixture(autouse=True)
+def web_vitals(request) -> Generator[None, None, None]:
+    """ Performance metrics of the page navigations of the test (with `--web-vitals`)
+
+    Metrics of every navigation are saved with the type of the page object
+    (`Traffic`, `Property`, `Security`, ...) and summarized by it.
+    """
+    vitals_dir = request.config.getoption('--web-vitals')
+    if vitals_dir is None:
+        yield
+        return
+    collector = get_web_vitals_collector()
+    collector.start()
+    yield
+    records = collector.stop()
+    if not records:
+        return
+    _attach_json(request, 'web vitals',
+                 {'summary': collector.summary(), 'navigations': records}, vitals_dir)
+
+
+@pytest.fixture(autouse=True)
+def interaction_timings(request) -> Generator[None, None, None]:
+    """ Latencies of the timed interactions of the test (see `measure_interaction`)
+
+    They are attached to the allure report and saved with `--interaction-timings DIR`.
+    """
+    recorder = get_action_recorder()
+    recorder.interactions = []
+    yield
+    if not recorder.interactions:
+        return
+    _attach_json(request, 'interaction timings',
+                 {'interactions': [t._asdict() for t in recorder.interactions]},
+                 request.config.getoption('--interaction-timings'))
+
+
+@pytest.fixture(autouse=True)
+def console_data(request, project_dir) -> Generator[ConsoleRecorder | None, None, None]:
+    """ Record or replay data requests of the test page (with `--console-data`)
+
+    Exchanges of every test are stored in `<dir>/<test module path>/<test name>.json.gz`,
+    the module path is relative to the rootdir of pytest (tests and benchmarks).
+    """
+    mode = request.config.getoption('--console-data')
+    if mode is None or 'warm_page' not in request.fixturenames:
+        yield None
+        return
+    data_dir = Path(request.config.getoption('--console-data-dir') or project_dir / 'har')
+    module = Path(request.node.fspath).relative_to(request.config.rootpath).with_suffix('')
+    name = re.sub(r'[^\w.-]+', '_', request.node.name)
+    path = data_dir / module / f'{name}.json.gz'
+    if mode == REPLAY and not path.exists():
+        pytest.skip(f'No recorded exchanges: {path}')
+    store = ExchangeStore() if mode == RECORD else ExchangeStore.load(path)
+    recorder = ConsoleRecorder(request.getfixturevalue('warm_page'), store, mode)
+    yield recorder
+    recorder.detach()
+    if mode == RECORD:
+        report = getattr(request.node, 'rep_call', None)
+        if report is not None and report.passed:
+            store.save(path)
+    elif recorder.missed:
+        print(f'Requests missed in {path}: {sorted(set(recorder.missed))}')
+
 
 @pytest.fixture(scope='session')
 def project_dir():
@@ -74,6 +240,21 @@ def credentials(ltfrc_console_app: CaseInsensitiveDict) -> Credentials:
                        password)
 
 
+@pytest.fixture(scope='session')
+def login_user(credentials: Credentials) -> str:
+    """ User to log in with.
+
+    Each pytest-xdist worker gets its own user from `credentials.users`
+    (gw0 - the first one, gw1 - the second one, ...).
+    """
+    index = worker_index()
+    try:
+        return credentials.users[index]
+    except IndexError:
+        raise RuntimeError(f'Not enough users for worker {worker_id()}: at least {index + 1} '
+                           f'users should be specified in EDGIO_USER or ~/.ltfrc') from None
+
+
 @pytest.fixture(scope="session")
 def browser_type_launch_args(browser_type_launch_args: dict,
                              ltfrc_console_app: CaseInsensitiveDict,
@@ -94,36 +275,53 @@ def browser_type_launch_args(browser_type_launch_args: dict,
 def saved_login(project_dir,
                 browser: Browser,
                 base_url: str,
-                credentials: namedtuple) -> dict:
+                credentials: namedtuple,
+                login_user: str) -> dict:
     """ Save signed in state for reusing that state to skip log-in in tests.
 
+    The state is stored per pytest-xdist worker, so workers never share
+    the file (and the user).
+
     Return cookies
     """
-    cookies_file = project_dir / 'cookies.pkl'
+    wid = worker_id()
+    cookies_file = project_dir / ('cookies.pkl' if wid == 'master' else f'cookies-{wid}.pkl')
     if cookies_file.exists():
-        return pickle.load(cookies_file.open('rb'))
+        login_state = pickle.load(cookies_file.open('rb'))
+        # Reuse the state only if it was saved for the same user
+        if login_state.get('user') == login_user:
+            return login_state['storage_state']
     br_context = browser.new_context()
     page = br_context.new_page()
     # go to login page
     login_page = LoginPage(page, url=base_url)
     login_page.goto()
     # perform login
-    login_page.login(credentials.users[0], credentials.password)
+    login_page.login(login_user, credentials.password)
     assert not login_page.submit.is_visible()
     # Close the status banner if present
-    try:
-        login_page.status_snackbar_close.click(timeout=1500)
-    except TimeoutError:
-        print('Status banner not found')
+    login_page.close_status_snackbar()
     # Save storage state into the file.
     storage_state = {'cookies': br_context.cookies()}
 
-    with cookies_file.open('wb') as f:
-        pickle.dump(storage_state, f)
+    pickle_dump_atomic({'user': login_user, 'storage_state': storage_state}, cookies_file)
     br_context.close()
     return storage_state
 
 
+@pytest.fixture(scope="session")
+def console_api(base_url: str,
+                saved_login: dict,
+                ltfrc_console_app: CaseInsensitiveDict) -> Generator[ConsoleApi, None, None]:
+    """ Console API client signed in with the saved login state.
+
+    Used by fixtures to seed and purge test data in bulk instead of the UI.
+    """
+    api = ConsoleApi(base_url, saved_login, graphql_url=ltfrc_console_app.get('graphql_url'))
+    yield api
+    api.close()
+
+
 @pytest.fixture
 def use_login_state(browser_context_args: dict, saved_login: dict) -> dict:
     """ Use previously saved login state.
@@ -139,6 +337,41 @@ def use_login_state(browser_context_args: dict, saved_login: dict) -> dict:
     del browser_context_args['storage_state']
 
 
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser,
+                 browser_context_args: dict,
+                 saved_login: dict) -> Generator[ContextPool, None, None]:
+    """ Pool of warm signed in browser contexts shared by the page fixtures """
+    pool = ContextPool(browser, {**browser_context_args, 'storage_state': saved_login})
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def warm_page(request, browser_name: str) -> Generator[Page, None, None]:
+    """ Signed in page.
+
+    `browser_name` keeps every page fixture parametrized by `--browser` of
+    pytest-playwright (`page` and `context_pool` are requested dynamically).
+
+    By default the `page` fixture of pytest-playwright is used (new context for
+    every test, screenshots/video/tracing options are applied). With
+    `--context-pool` the page is taken from the pool of warm contexts and
+    returned to the pool after the test, so a new context is not created for
+    every test. Context of the failed test is closed. The pool is not used if
+    any of pytest-playwright artifacts are enabled: they are recorded per context.
+    """
+    if not use_context_pool(request.config):
+        request.getfixturevalue('use_login_state')
+        yield request.getfixturevalue('page')
+        return
+    context_pool = request.getfixturevalue('context_pool')
+    page = context_pool.acquire()
+    yield page
+    report = getattr(request.node, 'rep_call', None)
+    context_pool.release(page, reuse=report is not None and report.passed)
+
+
 @pytest.fixture
 def create_org(org_page) -> Generator[str, None, None]:
     """ Create org and delete on teardown """
@@ -175,14 +408,15 @@ def orgs_to_delete(org_page) -> Generator[list, None, None]:
 
 
 @pytest.fixture
-def org_page(use_login_state: dict,
-             page: Page,
+def org_page(warm_page: Page,
              base_url: str) -> Generator[OrgPage, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
-    org_page = OrgPage(page, base_url)
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
+    org_page = OrgPage(warm_page, base_url)
+    # The root page redirects to the team page, so it is loaded
     org_page.goto()
     yield org_page
+    org_page.detach()
 
 
 @pytest.fixture
@@ -196,12 +430,11 @@ def login_page(page: Page,
 
 
 @pytest.fixture
-def property_page(use_login_state: dict,
-                  page: Page,
+def property_page(warm_page: Page,
                   ltfrc_console_app: dict,
                   base_url: str) -> Generator[PropertyPage, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
 
     try:
         property_path = (f"{ltfrc_console_app['team']}/"
@@ -209,21 +442,21 @@ def property_page(use_login_state: dict,
                          f"{PROPERTY_URL_PATH}")
     except KeyError:
         raise ValueError(f'team and property variables are missed in .ltfrc')
-    prop_page = PropertyPage(page, url=urljoin(base_url, property_path))
-    prop_page.mock.page.unroute("**/graphql")
+    prop_page = PropertyPage(warm_page, url=urljoin(base_url, property_path))
+    prop_page.mock.detach()
     prop_page.goto()
     # Revert previously added rules
     prop_page.revert_rules()
     yield prop_page
+    prop_page.detach()
 
 
 @pytest.fixture
-def experiment_page(use_login_state: dict,
-                    page: Page,
+def experiment_page(warm_page: Page,
                     ltfrc_console_app: dict,
                     base_url: str) -> Generator[ExperimentsPage, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
     try:
         property_path = (f"{ltfrc_console_app['team']}/"
                          f"{ltfrc_console_app['property']}/"
@@ -231,7 +464,7 @@ def experiment_page(use_login_state: dict,
     except KeyError:
         raise ValueError(f'team and property variables are missed in .ltfrc')
 
-    exp_page = ExperimentsPage(page, url=urljoin(base_url, property_path))
+    exp_page = ExperimentsPage(warm_page, url=urljoin(base_url, property_path))
     exp_page.goto()
     exp_page.add_experiment_button.wait_for(timeout=30000)
 
@@ -250,15 +483,25 @@ def experiment_page(use_login_state: dict,
     # delete all experiments and deploy changes
     if exp_page.delete_experiment_list.is_visible():
         exp_page.delete_all_experiments()
+    exp_page.detach()
 
 
 @pytest.fixture
-def traffic_page(use_login_state: dict,
-                 page: Page,
+def traffic_page(request,
+                 warm_page: Page,
                  ltfrc_console_app: dict,
                  base_url: str) -> Generator[TrafficPage, None, None]:
+    """ Traffic page of the property
+
+    With `@pytest.mark.synthetic_traffic(**kwargs)` the BFF traffic endpoints
+    are served from `TrafficDataset(**kwargs)` (see `traffic_data` fixture).
+    Responses of the endpoints are captured by `traffic.expectations` to check
+    the rendered values (see `TrafficExpectations`).
+    """
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
+    marker = request.node.get_closest_marker('synthetic_traffic')
+    data_mock = TrafficDataMock(warm_page, TrafficDataset(**marker.kwargs)) if marker else None
 
     try:
         traffic_path = (f"{ltfrc_console_app['team']}/"
@@ -266,18 +509,37 @@ def traffic_page(use_login_state: dict,
                         f"{TRAFFIC_URL_PATH}")
     except KeyError:
         raise ValueError(f'team and property variables are missed in .ltfrc')
-    traffic = TrafficPage(page, url=urljoin(base_url, traffic_path))
+    traffic = TrafficPage(warm_page, url=urljoin(base_url, traffic_path))
+    traffic.traffic_data = data_mock
+    traffic.expectations = TrafficExpectations(warm_page)
     traffic.goto()
     yield traffic
+    traffic.expectations.detach()
+    traffic.detach()
+    if data_mock is not None:
+        data_mock.detach()
+
+
+@pytest.fixture
+def traffic_data(traffic_page) -> TrafficDataMock:
+    """ Synthetic traffic served to `traffic_page` (the test must be marked `synthetic_traffic`)
+
+    Example:
+        @pytest.mark.synthetic_traffic(days=90, routes=5000, end=1700000000)
+        def test_totals(traffic_page, traffic_data):
+            assert traffic_data.dataset.totals['edge_requests'] == ...
+    """
+    if traffic_page.traffic_data is None:
+        pytest.fail('Mark the test with @pytest.mark.synthetic_traffic(...)')
+    return traffic_page.traffic_data
 
 
 @pytest.fixture
-def redirect_page(use_login_state: dict,
-                  page: Page,
+def redirect_page(warm_page: Page,
                   ltfrc_console_app: dict,
                   base_url: str) -> Generator[Page, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
     try:
         property_path = (f"{ltfrc_console_app['team']}/"
                          f"{ltfrc_console_app['property']}/"
@@ -285,9 +547,9 @@ def redirect_page(use_login_state: dict,
     except KeyError:
         raise ValueError(f'team and property variables are missed in .ltfrc')
 
-    red_page = RedirectsPage(page, url=urljoin(base_url, property_path))
+    red_page = RedirectsPage(warm_page, url=urljoin(base_url, property_path))
     # Remove GraphQl mock
-    red_page.mock.page.unroute("**/graphql")
+    red_page.mock.detach()
     red_page.goto()
     red_page.add_a_redirect_button.wait_for(timeout=30000)
 
@@ -296,15 +558,15 @@ def redirect_page(use_login_state: dict,
         red_page.delete_all_redirects()
 
     yield red_page
+    red_page.detach()
 
 
 @pytest.fixture
-def origins_page(use_login_state: dict,
-                 page: Page,
+def origins_page(warm_page: Page,
                  ltfrc_console_app: dict,
                  base_url: str) -> Generator[Page, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
     try:
         property_path = (f"{ltfrc_console_app['team']}/"
                          f"{ltfrc_console_app['property']}/"
@@ -312,7 +574,7 @@ def origins_page(use_login_state: dict,
     except KeyError:
         raise ValueError(f'team and property variables are missed in .ltfrc')
 
-    origins_page = OriginsPage(page, url=urljoin(base_url, property_path))
+    origins_page = OriginsPage(warm_page, url=urljoin(base_url, property_path))
     origins_page.goto()
     origins_page.origins_title.wait_for(timeout=30000)
 
@@ -325,15 +587,15 @@ def origins_page(use_login_state: dict,
         origins_page.reload()
 
     yield origins_page
+    origins_page.detach()
 
 
 @pytest.fixture
-def env_variable_page(use_login_state: dict,
-                page: Page,
+def env_variable_page(warm_page: Page,
                 ltfrc_console_app: dict,
                 base_url: str) -> Generator[Page, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
     try:
         property_path = (f"{ltfrc_console_app['team']}/"
                          f"{ltfrc_console_app['property']}/"
@@ -341,7 +603,7 @@ def env_variable_page(use_login_state: dict,
     except KeyError:
         raise ValueError(f'team and property variables are missed in .ltfrc')
 
-    env_var = EnvironmentVariablesPage(page, url=urljoin(base_url, property_path))
+    env_var = EnvironmentVariablesPage(warm_page, url=urljoin(base_url, property_path))
     env_var.goto()
     env_var.env_variable_title.wait_for(timeout=30000)
 
@@ -350,40 +612,41 @@ def env_variable_page(use_login_state: dict,
         env_var.delete_all_variables()
 
     yield env_var
+    env_var.detach()
 
 
 @pytest.fixture
-def org_activity(use_login_state: dict,
-                 page: Page,
+def org_activity(warm_page: Page,
                  ltfrc_console_app: dict,
                  base_url: str) -> Generator[Page, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
     try:
         org_activity = (f"{ltfrc_console_app['team']}/activity")
     except KeyError:
         raise ValueError(f'team and property variables are missed in .ltfrc')
 
-    org_activity = OrgActivityPage(page, url=urljoin(base_url, org_activity))
+    org_activity = OrgActivityPage(warm_page, url=urljoin(base_url, org_activity))
     org_activity.goto()
     org_activity.table.wait_for(timeout=30000)
 
     yield org_activity
+    org_activity.detach()
 
 @pytest.fixture
-def web_properties(use_login_state: dict,
-                 page: Page,
+def web_properties(warm_page: Page,
                  ltfrc_console_app: dict,
                  base_url: str) -> Generator[Page, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
     try:
         web_properties_path = (f"{ltfrc_console_app['team']}")
     except KeyError:
         raise ValueError(f'team and property variables are missed in .ltfrc')
 
-    web_properties = WebPropertyPage(page, url=urljoin(base_url, web_properties_path))
+    web_properties = WebPropertyPage(warm_page, url=urljoin(base_url, web_properties_path))
     web_properties.goto()
     web_properties.new_property_button.wait_for(timeout=30000)
 
-    yield web_properties
\ No newline at end of file
+    yield web_properties
+    web_properties.detach()
@@ -25,7 +25,7 @@ def test_environment_variable_add_(env_variable_page):
     random_value = f"{random_str(15)},{random_str(10)},{random_str(20)}"
 
     env_variable_page.add_env_variable(random_key, random_value, False)
-    env_variable_page.wait_for_timeout(timeout=1500)
+    env_variable_page.wait_for_settle()
     assert env_variable_page.redeploy_button.is_visible()
     assert env_variable_page.row_key(row=1).inner_text() == random_key, "Key does not match"
     assert env_variable_page.row_value(row=1).inner_text() == random_value, "Value does not match"
@@ -56,7 +56,7 @@ def test_environment_variable_add_with_secret(env_variable_page):
 
     env_variable_page.add_env_variable(random_key, random_value, True)
     env_variable_page.add_variable_button.click()
-    env_variable_page.wait_for_timeout(timeout=1500)
+    env_variable_page.wait_for_settle()
     assert env_variable_page.row_key(row=1).inner_text() == random_key, "Key does not match"
     assert env_variable_page.row_value(row=1).inner_text() == "****" + random_value[12:15], "Value does not match"
 
@@ -83,7 +83,7 @@ def test_environment_variable_import(env_variable_page):
     random_data = f"{random_key}=" + random_value
 
     env_variable_page.import_env_variable(random_data, False)
-    env_variable_page.wait_for_timeout(timeout=1500)
+    env_variable_page.wait_for_settle()
     assert env_variable_page.redeploy_button.is_visible()
     assert env_variable_page.row_key(row=1).inner_text() == random_key, "Key does not match"
     assert env_variable_page.row_value(row=1).inner_text() == random_value, "Value does not match"
@@ -113,7 +113,7 @@ def test_environment_variable_import_secret(env_variable_page):
     random_data = f"{random_key}=" + random_value
 
     env_variable_page.import_env_variable(random_data, True)
-    env_variable_page.wait_for_timeout(timeout=1500)
+    env_variable_page.wait_for_settle()
     assert env_variable_page.row_key(row=1).inner_text() == random_key, "Key does not match"
     assert env_variable_page.row_value(row=1).inner_text() == "****" + random_value[12:15], "Value does not match"
 
@@ -149,7 +149,7 @@ def test_environment_variable_deploy_now(env_variable_page):
     env_variable_page.online_status.wait_for(timeout=60000)
     env_variable_page.env_page.click()
     env_variable_page.add_env_variable_button.wait_for(timeout=30000)
-    env_variable_page.wait_for_timeout(timeout=1500)
+    env_variable_page.wait_for_settle()
     assert not env_variable_page.redeploy_button.is_visible()
     assert env_variable_page.row_key(row=1).inner_text() == random_key, "Key does not match"
     assert env_variable_page.row_value(row=1).inner_text() == random_value, "Value does not match"
@@ -187,7 +187,7 @@ def test_environment_variable_import_deploy_secret(env_variable_page):
     env_variable_page.online_status.wait_for(timeout=60000)
     env_variable_page.env_page.click()
     env_variable_page.add_env_variable_button.wait_for(timeout=30000)
-    env_variable_page.wait_for_timeout(timeout=1500)
+    env_variable_page.wait_for_settle()
     assert not env_variable_page.redeploy_button.is_visible()
     assert env_variable_page.row_key(row=1).inner_text() == random_key, "Key does not match"
     assert env_variable_page.row_value(row=1).inner_text() == "****" + random_value[12:15], "Value does not match"
@@ -1,6 +1,7 @@
 import random
 import time
 import pytest
+from playwright.sync_api import expect
 from ltf2.console_app.magic.helpers import random_str, random_bool, random_int
 
 @pytest.mark.regression
@@ -83,7 +84,7 @@ def test_redirect_add(redirect_page, from_, to, status, forward_query_string):
     redirect_page.forward_query_string.set_checked(forward_query_string)
     redirect_page.save_redirect_button.click()
     redirect_page.add_a_redirect_button.wait_for(timeout=30000)
-    redirect_page.wait_for_timeout(timeout=1500)
+    redirect_page.wait_for_settle()
     assert redirect_page.table_value_from_field(row=1).inner_text() == from_
     assert redirect_page.table_value_to_field(row=1).inner_text() == to
     assert redirect_page.table_value_status_field(row=1).inner_text() == status[0:3]
@@ -114,7 +115,7 @@ def test_redirect_max_allowed(redirect_page):
     redirect_page.redirect_to.fill(max_allowed_value)
     redirect_page.save_redirect_button.click()
     redirect_page.add_a_redirect_button.wait_for(timeout=30000)
-    redirect_page.wait_for_timeout(timeout=1500)
+    redirect_page.wait_for_settle()
     assert redirect_page.table_value_from_field(row=1).inner_text() == expected
     assert redirect_page.table_value_to_field(row=1).inner_text() == expected
 
@@ -144,7 +145,7 @@ def test_redirect_delete(redirect_page):
     redirect_page.remove_selected_redirect.click()
     redirect_page.confirm_remove_redirect.click()
     redirect_page.add_a_redirect_button.wait_for(timeout=30000)
-    redirect_page.wait_for_timeout(timeout=2000)
+    redirect_page.wait_for_settle()
 
     assert redirect_page.empty_list_message.is_visible(), 'empty list message is not visible'
 
@@ -183,7 +184,7 @@ def test_redirect_update(redirect_page):
     redirect_page.forward_query_string.set_checked(True)
     redirect_page.save_redirect_button.click()
     redirect_page.add_a_redirect_button.wait_for(timeout=30000)
-    redirect_page.wait_for_timeout(timeout=1500)
+    redirect_page.wait_for_settle()
     assert redirect_page.table_value_from_field(row=1).inner_text() == new_random_data
     assert redirect_page.table_value_to_field(row=1).inner_text() == new_random_data
     assert redirect_page.table_value_status_field(row=1).inner_text() == '307'
@@ -251,7 +252,7 @@ def test_redirect_import_override_option(redirect_page):
     csv_file = redirect_page.csv_for_import(data_to_import)
     redirect_page.add_redirect(from_=random_data, to=random_data)
     redirect_page.upload_csv_file(csv_file, True)
-    redirect_page.wait_for_timeout(timeout=2500)
+    redirect_page.wait_for_settle()
     redirect_page.add_a_redirect_button.wait_for(timeout=30000)
     assert redirect_page.table_value_from_field(row=1).inner_text() == data_to_import[0][0]
     assert redirect_page.table_value_to_field(row=1).inner_text() == data_to_import[0][1]
@@ -286,10 +287,10 @@ def test_redirect_import_append_option(redirect_page):
     ]
     csv_file = redirect_page.csv_for_import(data_to_import)
     redirect_page.add_redirect(from_=random_data, to=random_data)
-    redirect_page.wait_for_timeout(timeout=2500)
+    redirect_page.wait_for_settle()
     count_rows_before_import = redirect_page.table.tbody.tr.count()
     redirect_page.upload_csv_file(csv_file, False)
-    redirect_page.wait_for_timeout(timeout=2500)
+    redirect_page.wait_for_settle()
     redirect_page.add_a_redirect_button.wait_for(timeout=30000)
     count_after_append_redirects = redirect_page.table.tbody.tr.count()
     assert count_rows_before_import + len(data_to_import) == count_after_append_redirects
@@ -330,7 +331,7 @@ def test_redirect_export_option(redirect_page):
     csv_file = redirect_page.csv_for_import(data_to_import)
     redirect_page.upload_csv_file(csv_file, True)
     redirect_page.add_a_redirect_button.wait_for(timeout=30000)
-    redirect_page.wait_for_timeout(timeout=1500)
+    redirect_page.wait_for_settle()
     with redirect_page.expect_download() as download_info:
         redirect_page.export_button.click()
     download = download_info.value
@@ -371,21 +372,22 @@ def test_redirect_search(redirect_page):
     redirect_page.upload_csv_file(csv_file, True)
     redirect_page.add_a_redirect_button.wait_for(timeout=30000)
     redirect_page.search_field.click()
+    # Search is debounced: wait for the filtered table instead of a settled page
     redirect_page.search_field.fill(random_from)
-    redirect_page.wait_for_timeout(timeout=1500)
-    assert redirect_page.table_value_from_field(row=1).inner_text() == random_from, \
-        'The search result does not match the expected'
-    assert len(redirect_page.table.tbody.tr) == 1, "More rows are present than expected"
+    expect(redirect_page.table.tbody.tr._locator,
+           "More rows are present than expected").to_have_count(1)
+    expect(redirect_page.table_value_from_field(row=1)._locator,
+           'The search result does not match the expected').to_have_text(random_from)
     redirect_page.search_field.clear()
     redirect_page.search_field.fill(random_to)
-    redirect_page.wait_for_timeout(timeout=1500)
-    assert redirect_page.table_value_to_field(row=1).inner_text() == random_to, \
-        'The search result does not match the expected'
-    assert len(redirect_page.table.tbody.tr) == 1, "More rows are present than expected"
+    expect(redirect_page.table_value_to_field(row=1)._locator,
+           'The search result does not match the expected').to_have_text(random_to)
+    expect(redirect_page.table.tbody.tr._locator,
+           "More rows are present than expected").to_have_count(1)
     redirect_page.search_field.clear()
     redirect_page.search_field.fill(random_str(10))
-    redirect_page.wait_for_timeout(timeout=1500)
-    assert redirect_page.no_redirects_matching.is_visible(), "Empty field text is not visible"
+    expect(redirect_page.no_redirects_matching._locator,
+           "Empty field text is not visible").to_be_visible()
 
 
 @pytest.mark.regression
@@ -412,7 +414,7 @@ def test_redirect_changing_default_status(redirect_page):
     redirect_page.default_status_dropdown.click()
     redirect_page.select_by_name(name=set_default).click()
     redirect_page.add_redirect(from_=random_data, to=random_data)
-    redirect_page.wait_for_timeout(timeout=1500)
+    redirect_page.wait_for_settle()
     assert redirect_page.table_value_status_field(row=1).inner_text() == 'Default (301)'
     redirect_page.default_status_dropdown.click()
     redirect_page.select_by_name(name=new_default).click()
@@ -442,7 +444,7 @@ def test_redirect_import_duplicate_values(redirect_page):
     redirect_page.upload_csv_file(csv_file, True)
     csv_file.seek(0)
     redirect_page.upload_csv_file(csv_file, False)
-    redirect_page.wait_for_timeout(timeout=1500)
+    redirect_page.wait_for_settle()
     assert redirect_page.client_snackbar.text_content() == f"Redirect {data_to_import[0][0]} is already defined on this environment."
 
 
@@ -474,7 +476,7 @@ def test_redirect_import_mapping(redirect_page):
     csv_file = redirect_page.csv_for_import(data_to_import)
     redirect_page.upload_csv_file(csv_file)
     redirect_page.add_a_redirect_button.wait_for(timeout=30000)
-    redirect_page.wait_for_timeout(timeout=1500)
+    redirect_page.wait_for_settle()
     for row_number in range(1, len(redirect_page.table.tbody.tr) + 1):
         assert redirect_page.table_value_from_field(row=row_number).inner_text() == data_to_import[row_number - 1][0]
         assert redirect_page.table_value_to_field(row=row_number).inner_text() == data_to_import[row_number - 1][1]
@@ -1,4 +1,3 @@
-from playwright.sync_api import TimeoutError
 import pytest
 
 
@@ -443,19 +442,16 @@ def test_rules_ai_cache_key_query_string_include_option(property_page):
     property_page.generate_ai_rule(
         'include only id and type query parameters in the cache key')
     # There are 2 ways how AI can create a valid rule
-    feature = None
-    try:
-        property_page.created_rule(num=-1).feature(num=0).click(timeout=1000)
-        feature = True
-    except TimeoutError:
-        try:
-            # Check if rule cannot be generated
-            error = property_page.ai_rule_generation_error.inner_text(timeout=10)
+    feature = property_page.created_rule(num=-1).feature(num=0)
+    if property_page.probe(feature):
+        feature.click()
+    else:
+        # Check if rule cannot be generated
+        if property_page.ai_rule_generation_error.is_present():
+            error = property_page.ai_rule_generation_error.inner_text()
             assert not error, f"Cannot generate rule: {error}"
-        except TimeoutError:
-            pass
         # Will check if Condition is created
-        pass
+        feature = None
     if feature:
         # Validate Feature
         assert property_page.feature_input.input_value() == 'Cache Key Query String', 'Wrong Feature'
@@ -7,18 +7,38 @@ import pytest
 from playwright.sync_api import TimeoutError
 from playwright.sync_api import Page, Browser
 
+from ltf2.console_app.magic.api import WAF_PATHS, ApiError, ConsoleApi
 from ltf2.console_app.magic.constants import PAGE_TIMEOUT, SECURITY_RULE_NAME_PREFIX
+from ltf2.console_app.magic.helpers import worker_prefix
 from ltf2.console_app.magic.pages.pages import SecurityPage
 
 
+def purge_rules(console_api: ConsoleApi, team: str, section: str, rules: list) -> bool:
+    """ Delete rules of the section (e.g. 'access_rules') via API.
+
+    Return False if API request failed or the rules were not found (e.g. the
+    response has changed) and rules should be deleted via UI.
+    """
+    if not rules:
+        return True
+    try:
+        console_api.delete_waf_rules(team, WAF_PATHS[section], rules)
+    except ApiError as e:
+        print(f'Rules were not deleted via API: {e}')
+        return False
+    return True
+
+
 def generate_fixture(delete_method: str):
     @pytest.fixture
-    def delete_rule(security_logged):
+    def delete_rule(security_logged, console_api, ltfrc_console_app):
         rules = []
 
         yield rules
 
-        getattr(security_logged, delete_method)(rules)
+        section = delete_method[len('delete_'):]
+        if not purge_rules(console_api, ltfrc_console_app['team'], section, rules):
+            getattr(security_logged, delete_method)(rules)
     return delete_rule
 
 
@@ -59,41 +79,53 @@ def setup_security_rules(browser: Browser,
     sec_page.goto()
     sec_page.security.click()
     # Close the status banner if present
-    try:
-        sec_page.status_snackbar_close.click(timeout=1500)
-    except TimeoutError:
-        print('Status banner not found')
+    sec_page.close_status_snackbar()
 
     yield sec_page
 
 
 @pytest.fixture(scope="module")
-def cleanup_managed_rules(setup_security_rules: SecurityPage,
-                        cmp) -> None:
+def cleanup_managed_rules(request,
+                          console_api: ConsoleApi,
+                          ltfrc_console_app: dict,
+                          cmp) -> None:
     """ Delete Managed Rules from previous run """
+    rules = [cmp.re_match(worker_prefix(SECURITY_RULE_NAME_PREFIX))]
+    if purge_rules(console_api, ltfrc_console_app['team'], 'managed_rules', rules):
+        return
+    setup_security_rules = request.getfixturevalue('setup_security_rules')
     setup_security_rules.managed_rules.click()
-    setup_security_rules.delete_managed_rules(
-        [cmp.re_match(SECURITY_RULE_NAME_PREFIX)])
+    setup_security_rules.delete_managed_rules(rules)
     setup_security_rules.page.close()
 
 
 @pytest.fixture(scope="module")
-def cleanup_access_rules(setup_security_rules: SecurityPage,
-                       cmp) -> None:
+def cleanup_access_rules(request,
+                         console_api: ConsoleApi,
+                         ltfrc_console_app: dict,
+                         cmp) -> None:
     """ Delete Access Rules from previous run """
+    rules = [cmp.re_match(worker_prefix(SECURITY_RULE_NAME_PREFIX))]
+    if purge_rules(console_api, ltfrc_console_app['team'], 'access_rules', rules):
+        return
+    setup_security_rules = request.getfixturevalue('setup_security_rules')
     setup_security_rules.access_rules.click()
-    setup_security_rules.delete_access_rules(
-        [cmp.re_match(SECURITY_RULE_NAME_PREFIX)])
+    setup_security_rules.delete_access_rules(rules)
     setup_security_rules.page.close()
 
 
 @pytest.fixture(scope="module")
-def cleanup_rate_rules(setup_security_rules: SecurityPage,
-                     cmp) -> None:
+def cleanup_rate_rules(request,
+                       console_api: ConsoleApi,
+                       ltfrc_console_app: dict,
+                       cmp) -> None:
     """ Delete Rate Rules from previous run """
+    rules = [cmp.re_match(worker_prefix(SECURITY_RULE_NAME_PREFIX))]
+    if purge_rules(console_api, ltfrc_console_app['team'], 'rate_rules', rules):
+        return
+    setup_security_rules = request.getfixturevalue('setup_security_rules')
     setup_security_rules.rate_rules.click()
-    setup_security_rules.delete_rate_rules(
-        [cmp.re_match(SECURITY_RULE_NAME_PREFIX)])
+    setup_security_rules.delete_rate_rules(rules)
     setup_security_rules.page.close()
 
 
@@ -111,7 +143,7 @@ def cleanup_security_app_rules(setup_security_rules: SecurityPage) -> None:
 
     setup_security_rules.secapp_names.wait_for()
     secapps_rule = setup_security_rules.secapp_names.all_inner_texts()
-    rules = [rule for rule in secapps_rule if rule.startswith(SECURITY_RULE_NAME_PREFIX)]
+    rules = [rule for rule in secapps_rule if rule.startswith(worker_prefix(SECURITY_RULE_NAME_PREFIX))]
 
     setup_security_rules.delete_security_app_rules(rules)
     setup_security_rules.page.close()
@@ -121,22 +153,19 @@ def cleanup_security_app_rules(setup_security_rules: SecurityPage) -> None:
 
 
 @pytest.fixture
-def security_logged(use_login_state: dict,
-                    page: Page,
+def security_logged(warm_page: Page,
                     base_url: str,
                     ltfrc_console_app) -> Generator[SecurityPage, None, None]:
     # Set global timeout
-    page.set_default_timeout(PAGE_TIMEOUT)
-    main_page = SecurityPage(page, url=urljoin(base_url, ltfrc_console_app['team']))
+    warm_page.set_default_timeout(PAGE_TIMEOUT)
+    main_page = SecurityPage(warm_page, url=urljoin(base_url, ltfrc_console_app['team']))
     main_page.goto()
     main_page.security.click()
     # Close the status banner if present
-    try:
-        main_page.status_snackbar_close.click(timeout=1500)
-    except TimeoutError:
-        print('Status banner not found')
+    main_page.close_status_snackbar()
     yield main_page
     main_page.mock.clear()
+    main_page.detach()
 
 
 @pytest.fixture
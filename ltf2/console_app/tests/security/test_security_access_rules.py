@@ -1,4 +1,3 @@
-import time
 from datetime import datetime, timezone
 
 import pytest
@@ -7,14 +6,14 @@ from playwright.sync_api import TimeoutError
 from ltf2.console_app.magic.constants import (ACCESS_CONTROL_TYPE,
                                               HTTP_METHODS,
                                               SECURITY_RULE_NAME_PREFIX)
-from ltf2.console_app.magic.helpers import random_str
+from ltf2.console_app.magic.helpers import random_str, worker_prefix
 from ltf2.console_app.magic.pages.pages import SecurityPage
 
 LIST_NAMES = ('blacklist', 'whitelist', 'accesslist')
 
 
 def fill_in_rule_name(page: SecurityPage) -> str:
-    name = f'{SECURITY_RULE_NAME_PREFIX}{random_str(10)}'
+    name = f'{worker_prefix(SECURITY_RULE_NAME_PREFIX)}{random_str(10)}'
     # Add rule
     page.add_access_rule.click()
     page.input_name.fill(name)
@@ -364,7 +363,7 @@ def test_access_rules_request_limit(security_logged):
         body_json=mock_data)
     security_logged.access_rules.click()
     security_logged.table.wait_for(timeout=5000)
-    time.sleep(1)
+    security_logged.wait_for_settle()
     assert security_logged.add_access_rule.is_disabled(), \
         "Add Access Rule button should be dissabled"
 
@@ -1,15 +1,14 @@
-import time
 from datetime import datetime, timezone
 
 import pytest
 
 from ltf2.console_app.magic.constants import SECURITY_RULE_NAME_PREFIX
-from ltf2.console_app.magic.helpers import random_int, random_str
+from ltf2.console_app.magic.helpers import random_int, random_str, worker_prefix
 from ltf2.console_app.magic.pages.pages import SecurityPage
 
 
 def fill_in_rule_name(page: SecurityPage) -> str:
-    name = f'{SECURITY_RULE_NAME_PREFIX}{random_str(10)}'
+    name = f'{worker_prefix(SECURITY_RULE_NAME_PREFIX)}{random_str(10)}'
     # Add rule
     page.add_managed_rule.click()
     page.input_name.fill(name)
@@ -480,7 +479,7 @@ def test_managed_rules_request_limit(security_logged):
         body_json=mock_data)
     security_logged.managed_rules.click()
     security_logged.table.wait_for(timeout=5000)
-    time.sleep(1)
+    security_logged.wait_for_settle()
     assert security_logged.add_managed_rule.is_disabled(), \
         "Add Manage Rule button should be disabled"
 
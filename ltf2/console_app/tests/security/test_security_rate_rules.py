@@ -1,15 +1,14 @@
-import time
 from datetime import datetime, timezone
 
 import pytest
 from playwright.sync_api import Page
 
 from ltf2.console_app.magic.constants import SECURITY_RULE_NAME_PREFIX
-from ltf2.console_app.magic.helpers import random_str, random_int
+from ltf2.console_app.magic.helpers import random_str, random_int, worker_prefix
 
 
 def fill_in_rule_name(page: Page) -> str:
-    name = f'{SECURITY_RULE_NAME_PREFIX}{random_str(10)}'
+    name = f'{worker_prefix(SECURITY_RULE_NAME_PREFIX)}{random_str(10)}'
     rate = '1000'
     # Add rule
     page.add_rate_rule.click()
@@ -39,7 +38,7 @@ def test_rate_rules_add_rule_without_condition_group(rate_rules_page: Page,
     3. 'Rate rule created' should appear on the snackbar
     """
     # Add rule
-    name = f'{SECURITY_RULE_NAME_PREFIX}{random_str(10)}'
+    name = f'{worker_prefix(SECURITY_RULE_NAME_PREFIX)}{random_str(10)}'
     rate = random_int(4)
     # Add rule
     rate_rules_page.add_rate_rule.click()
@@ -246,7 +245,7 @@ def test_rate_rules_request_limit(security_logged):
         body_json=mock_data)
     security_logged.rate_rules.click()
     security_logged.table.wait_for(timeout=5000)
-    time.sleep(1)
+    security_logged.wait_for_settle()
     assert security_logged.add_rate_rule.is_disabled(), \
         "Add Rate Rule button should be disabled"
 
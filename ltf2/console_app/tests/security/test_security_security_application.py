@@ -1,15 +1,13 @@
-import time
-
 import pytest
 from playwright.sync_api import TimeoutError
 
 from ltf2.console_app.magic.constants import SECURITY_RULE_NAME_PREFIX
-from ltf2.console_app.magic.helpers import random_str
+from ltf2.console_app.magic.helpers import random_str, worker_prefix
 from ltf2.console_app.magic.pages.pages import SecurityPage
 
 
 def create_app_name(page: SecurityPage) -> str:
-    name = f'{SECURITY_RULE_NAME_PREFIX}{random_str(10)}'
+    name = f'{worker_prefix(SECURITY_RULE_NAME_PREFIX)}{random_str(10)}'
     # Add rule
     page.new_seccurity_application.click()
     page.input_name.fill(name)
@@ -292,7 +290,7 @@ def test_security_application_rules_limit(security_logged):
         body_json=mock_data)
     security_logged.security_application.click()
     security_logged.new_seccurity_application.wait_for(timeout=3000)
-    time.sleep(1)
+    security_logged.wait_for_settle()
     assert security_logged.new_seccurity_application.is_disabled(), \
         "'Add New' button should be disabled"
     expected_msg = "You can only add up to 99 security applications"
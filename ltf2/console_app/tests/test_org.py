@@ -2,6 +2,7 @@ import time
 from collections import namedtuple
 
 import pytest
+from playwright.sync_api import expect
 
 from ltf2.console_app.magic.helpers import random_str
 from ltf2.console_app.magic.pages.pages import OrgPage
@@ -85,12 +86,11 @@ def test_org_add_nonexistent_user_(org_page: OrgPage, create_org: str, role: str
     org_page.member_permission(role=role).click()
     org_page.invite_member_button.click()
     # Wait for member to appear in the table
-    for _ in range(10):
-        if org_page.members_table.tbody.tr.count() > members_count:
-            break
-        time.sleep(0.5)
-    else:
-        raise AssertionError("New member was not added")
+    try:
+        expect(org_page.members_table.tbody.tr._locator).to_have_count(members_count + 1,
+                                                                       timeout=5000)
+    except AssertionError as e:
+        raise AssertionError("New member was not added") from e
     # Find a row in the table with the new member
     row = None
     for tr in org_page.members_table.tbody.tr:
@@ -112,6 +112,7 @@ def test_org_add_nonexistent_user_(org_page: OrgPage, create_org: str, role: str
 def test_add_existent_user_(org_page: OrgPage,
                             create_org: str,
                             credentials: namedtuple,
+                            login_user: str,
                             role: str):
     """ Organization - Add organization member - User exists
 
@@ -138,8 +139,9 @@ def test_add_existent_user_(org_page: OrgPage,
         5) Delete member button
     """
     try:
-        email = credentials.users[1]
-    except IndexError:
+        # Any user except the one that is logged in
+        email = next(u for u in credentials.users if u != login_user)
+    except StopIteration:
         raise AssertionError("At least two users should be specified in .ltfrc")
 
     name = email.split('@')[0]
@@ -153,12 +155,11 @@ def test_add_existent_user_(org_page: OrgPage,
     org_page.member_permission(role=role).click()
     org_page.invite_member_button.click()
     # Wait for member to appear in the table
-    for _ in range(10):
-        if org_page.members_table.tbody.tr.count() > members_count:
-            break
-        time.sleep(0.5)
-    else:
-        raise AssertionError("New member was not added")
+    try:
+        expect(org_page.members_table.tbody.tr._locator).to_have_count(members_count + 1,
+                                                                       timeout=5000)
+    except AssertionError as e:
+        raise AssertionError("New member was not added") from e
     # Find row in the table with new member
     row = None
     for tr in org_page.members_table.tbody.tr:
@@ -1,7 +1,8 @@
 import time
 from datetime import date, timedelta, datetime
 
-from ltf2.console_app.magic.constants import TRAFFIC_ROUTES, ORIGINS_OVERTIME, TRAFFIC_OVERTIME, ERRORS_OVERTIME, DATA_USAGE_OVERTIME
+from ltf2.console_app.magic.constants import TRAFFIC_ROUTES, ORIGINS_OVERTIME, TRAFFIC_OVERTIME, DATA_USAGE_OVERTIME
+from ltf2.console_app.magic.traffic_expect import MAIN_CHART_METRICS
 import pytest
 
 
@@ -269,4 +270,62 @@ def test_date_picker_custom_date_range(traffic_page):
     traffic_page.date_picker.click()
     traffic_page.date_picker_custom_date_range.click()
     traffic_page.date_picker_apply_button.click()
-    assert traffic_page.date_picker.inner_text() == date_range_format
\ No newline at end of file
+    assert traffic_page.date_picker.inner_text() == date_range_format
+
+
+@pytest.mark.synthetic_traffic(days=90, routes=5000, origins=10)
+def test_main_chart_production_sized_data(traffic_page, traffic_data):
+    """Traffic - Overview with production-sized data
+
+        Preconditions:
+        --------------
+        1. BFF traffic endpoints serve 90 days of minute data and 5000 routes
+        2. Navigate to Traffic --> Overview tab
+
+        Steps:
+        ------
+        1. Select Last 90 Days in the date picker
+        2. Select Data Transferred Edge in the main chart
+
+        Expected Results:
+        -----------------
+        1. 90 days of minute data are received
+        2. Summary of the main chart is the total edge bytes of the data within
+           the displayed precision
+        """
+    traffic_page.date_picker.click()
+    with traffic_page.expect_response(TRAFFIC_OVERTIME) as response:
+        traffic_page.date_picker_last_90_days.click()
+    assert len(response.value.json()['data']) == len(traffic_data.dataset.timestamps)
+    traffic_page.traffic_metric_selector.click()
+    traffic_page.select_by_name(name='Data Transferred Edge').click()
+    traffic_page.expectations.expect_summary('Data Transferred Edge',
+                                             traffic_page.traffic_main_chart_summary)
+
+
+@pytest.mark.synthetic_traffic(days=7, routes=200)
+def test_main_chart_summary_values(traffic_page):
+    """Traffic - Overview, summary values of the main chart with synthetic data
+
+        Preconditions:
+        --------------
+        1. BFF traffic endpoints serve 7 days of minute data
+        2. Navigate to Traffic --> Overview tab
+
+        Steps:
+        ------
+        1. Select every metric of the main chart
+
+        Expected Results:
+        -----------------
+        1. Summary of every metric equals the total or average of the traffic-overtime
+           response within the displayed precision
+        """
+    traffic_page.traffic_metric_selector.click()
+    for key in MAIN_CHART_METRICS:
+        # The latency of the metric switch is attached to the report
+        traffic_page.select_by_name(name=key).timed_click(name=f'main chart metric {key}')
+        # The measurement does not fail on a slow chart: wait for the summary explicitly.
+        # Summary label and value are computed from the TRAFFIC_OVERTIME response
+        traffic_page.expectations.expect_summary(key, traffic_page.traffic_main_chart_summary)
+        traffic_page.traffic_metric_selector.click()
@@ -1,4 +1,5 @@
 import pytest
+from playwright.sync_api import expect
 from ltf2.console_app.magic.helpers import random_str
 from ltf2.console_app.tests.origins.test_origins import generate_random_domain
 from urllib.parse import urljoin
@@ -50,9 +51,9 @@ def test_web_properties_search(web_properties):
 
     property_name = web_properties.property_cards.nth(0).inner_text().split('\n')[0]
     web_properties.search_field.fill(property_name)
-    web_properties.wait_for_timeout(timeout=2000)
+    # Search is debounced: wait for the filtered cards instead of a settled page
+    expect(web_properties.property_cards._locator, 'Expected to see 1').to_have_count(1)
     assert web_properties.property_cards.nth(0).inner_text().split('\n')[0] == property_name, "Property is not in the search result"
-    assert web_properties.property_cards.count() == 1, 'Expected to see 1'
 
 @pytest.mark.regression
 def test_web_properties_order_by(web_properties):
@@ -15,16 +15,24 @@ setup(
 
     packages=find_namespace_packages(include=['ltf2.console_app.*']),
     package_data={"ltf2.console_app": ["exposure/certs/*"]},
-    entry_points={"console_scripts": [
-        "ltf2-exposure = ltf2.console_app.exposure.app:main",
-    ]},
+    entry_points={
+        "console_scripts": [
+            "ltf2-exposure = ltf2.console_app.exposure.app:main",
+        ],
+        "pytest11": [
+            "ltf2-timeout-report = ltf2.console_app.magic.timeout_report",
+        ],
+    },
 
     install_requires=[
         'allure-pytest',
         'ltf2-util',
         'pytest',
         'pytest-playwright',
+        'pytest-xdist',
+        'cryptography',
         'flask',
+        'numpy',
         'requests'
     ],
 )